@@ -0,0 +1,54 @@
+"""
+Find the RAD URIs the benchmarks are run over.
+--> This is done directly through ASDF rather than through rad so that the benchmarks
+    can be run against older commits of rad.
+"""
+
+from __future__ import annotations
+
+import asdf
+import asdf.schema
+from semantic_version import Version
+
+__all__ = ["manifest_schema_uris", "manifest_uris"]
+
+_MANIFEST_URI_PREFIX = "asdf://stsci.edu/datamodels/roman/manifests/datamodels-"
+
+
+def _version(uri: str) -> Version:
+    # Not rad.versions, which does not exist in the older commits the benchmarks are run against
+    version = uri.rsplit("-", 1)[-1]
+
+    # First manifest has a bad semantic version "1.0", so convert to "1.0.0"
+    return Version("1.0.0" if version == "1.0" else version)
+
+
+def manifest_uris(which: str) -> list[str]:
+    """
+    Get the datamodels manifest URIs.
+
+    Parameters
+    ----------
+    which : str
+        Either "latest" for only the latest manifest or "all" for every manifest.
+    """
+    uris = sorted((uri for uri in asdf.get_config().resource_manager if uri.startswith(_MANIFEST_URI_PREFIX)), key=_version)
+
+    return uris[-1:] if which == "latest" else uris
+
+
+def manifest_schema_uris(which: str) -> list[str]:
+    """
+    Get the tagged schema URIs from the datamodels manifest(s).
+
+    Parameters
+    ----------
+    which : str
+        Either "latest" for only the latest manifest or "all" for every manifest.
+    """
+    uris = {}
+    for uri in manifest_uris(which):
+        for entry in asdf.schema.load_schema(uri)["tags"]:
+            uris[entry["schema_uri"]] = None
+
+    return list(uris)
@@ -0,0 +1,50 @@
+"""
+Benchmarks for the ASDF integration of rad.
+"""
+
+import asdf
+
+from rad.integration import get_resource_mappings
+
+
+class ResourceMappings:
+    """
+    Creating the resource mappings and looking up every resource through them.
+    """
+
+    def setup(self):
+        self.mappings = get_resource_mappings()
+        self.uris = [uri for mapping in self.mappings for uri in mapping]
+
+    def time_get_resource_mappings(self):
+        get_resource_mappings()
+
+    def peakmem_get_resource_mappings(self):
+        get_resource_mappings()
+
+    def time_iterate_uris(self):
+        for mapping in get_resource_mappings():
+            list(mapping)
+
+    def time_lookup_all(self):
+        for mapping in self.mappings:
+            for uri in mapping:
+                mapping[uri]
+
+
+class ResourceManager:
+    """
+    Looking up every rad resource through the ASDF resource manager.
+    """
+
+    def setup(self):
+        self.resource_manager = asdf.get_config().resource_manager
+        self.uris = [uri for uri in self.resource_manager if uri.startswith("asdf://stsci.edu/datamodels/roman/")]
+
+    def time_lookup_all(self):
+        for uri in self.uris:
+            self.resource_manager[uri]
+
+    def peakmem_lookup_all(self):
+        for uri in self.uris:
+            self.resource_manager[uri]
@@ -0,0 +1,122 @@
+"""
+Benchmarks for the rad schema parser, run over the schemas of the latest
+datamodels manifest and over the schemas of all the datamodels manifests.
+"""
+
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+
+import asdf.schema
+
+from rad._parser import archive_entries, archive_schema, diff, dump, super_schema
+
+from ._uris import manifest_schema_uris
+
+
+def _super_schemas(uris):
+    schemas = []
+    for uri in uris:
+        # A few of the oldest schemas cannot be resolved into super schemas
+        with suppress(ValueError):
+            schemas.append(super_schema(uri))
+
+    return schemas
+
+
+class SuperSchema:
+    """
+    Building the super schemas from a cold ASDF schema cache.
+    """
+
+    params = ("latest", "all")
+    param_names = ("manifests",)
+    number = 1
+    timeout = 300
+
+    def setup(self, manifests):
+        self.uris = manifest_schema_uris(manifests)
+        asdf.schema._load_schema_cached.cache_clear()
+
+    def time_super_schema(self, manifests):
+        _super_schemas(self.uris)
+
+    def peakmem_super_schema(self, manifests):
+        _super_schemas(self.uris)
+
+
+class Archive:
+    """
+    Producing the archive information from the super schemas.
+    """
+
+    params = ("latest", "all")
+    param_names = ("manifests",)
+    timeout = 300
+
+    def setup(self, manifests):
+        # Some older schemas have an archive_meta but no archived fields
+        self.schemas = [
+            schema
+            for schema in _super_schemas(manifest_schema_uris(manifests))
+            if "archive_meta" in schema and archive_schema(schema)
+        ]
+
+    def time_archive_schema(self, manifests):
+        for schema in self.schemas:
+            archive_schema(schema)
+
+    def time_archive_entries(self, manifests):
+        for schema in self.schemas:
+            archive_entries(schema)
+
+    def peakmem_archive_entries(self, manifests):
+        for schema in self.schemas:
+            archive_entries(schema)
+
+
+class Diff:
+    """
+    Diffing the archive schemas against a modified copy of themselves.
+    """
+
+    timeout = 300
+
+    def setup(self):
+        schemas = [schema for schema in _super_schemas(manifest_schema_uris("latest")) if "archive_meta" in schema]
+        self.current = {schema["id"]: archive_schema(schema) for schema in schemas}
+        self.main = {uri: archive_schema(super_schema(uri)) for uri in self.current}
+
+        # Drop one schema and modify another so there is something to find
+        uris = list(self.main)
+        del self.main[uris[0]]
+        self.main[uris[1]]["archive_meta"] = "modified"
+
+    def time_diff(self):
+        diff(self.current, self.main)
+
+    def peakmem_diff(self):
+        diff(self.current, self.main)
+
+
+class Dump:
+    """
+    Running the full dump of the super schemas and archive information.
+    """
+
+    number = 1
+    timeout = 600
+
+    def setup(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.tmp_dir.name)
+        asdf.schema._load_schema_cached.cache_clear()
+
+    def teardown(self):
+        self.tmp_dir.cleanup()
+
+    def time_dump(self):
+        dump(self.base_dir)
+
+    def peakmem_dump(self):
+        dump(self.base_dir)
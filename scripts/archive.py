@@ -104,6 +104,12 @@ def _diff_repo(
     archive_json: bool = True,
     archive_yaml: bool = True,
     archive_txt: bool = True,
+    archive_npy: bool = False,
+    archive_csv: bool = False,
+    archive_parquet: bool = False,
+    path_index_json: bool = False,
+    load_plan: bool = False,
+    sdf_plan_json: bool = False,
 ) -> DeepDiff:
     """Get differences between the current staged files and those in the specified commit hash.
 
@@ -126,13 +132,29 @@ def _diff_repo(
         archive_json=archive_json,
         archive_yaml=archive_yaml,
         archive_txt=archive_txt,
+        archive_npy=archive_npy,
+        archive_csv=archive_csv,
+        archive_parquet=archive_parquet,
+        path_index_json=path_index_json,
+        load_plan=load_plan,
+        sdf_plan_json=sdf_plan_json,
         verbose=True,
     )["archive_schemas"]
 
     print("Generating archive files for the main branch...")
     with _repo_branch(repo, hexsha):
         main_schemas = dump(
-            base_dir, super_schema=False, archive_json=False, archive_txt=False, archive_yaml=False, verbose=True
+            base_dir,
+            super_schema=False,
+            archive_json=False,
+            archive_txt=False,
+            archive_yaml=False,
+            archive_npy=False,
+            archive_csv=False,
+            path_index_json=False,
+            load_plan=False,
+            sdf_plan_json=False,
+            verbose=True,
         )["archive_schemas"]
 
     return diff(current_schemas, main_schemas)
@@ -178,6 +200,36 @@ def _argparser() -> ArgumentParser:
         action="store_false",
         help="Do not save the archive entries in TXT format.",
     )
+    parser.add_argument(
+        "--archive_npy",
+        action="store_true",
+        help="Save the archive entries as a NumPy structured array.",
+    )
+    parser.add_argument(
+        "--archive_csv",
+        action="store_true",
+        help="Save the archive entries in CSV format.",
+    )
+    parser.add_argument(
+        "--archive_parquet",
+        action="store_true",
+        help="Save the archive entries in Parquet format (requires pyarrow).",
+    )
+    parser.add_argument(
+        "--path_index",
+        action="store_true",
+        help="Save the dotted data path indexes of the datamodels in JSON format.",
+    )
+    parser.add_argument(
+        "--load_plan",
+        action="store_true",
+        help="Save the bulk-load plan (CREATE TABLE DDL and column-order manifest) of the archive tables.",
+    )
+    parser.add_argument(
+        "--sdf_plan",
+        action="store_true",
+        help="Save the SDF source-mapping plans of the datamodels in JSON format.",
+    )
 
     return parser
 
@@ -191,7 +243,19 @@ if __name__ == "__main__":
     hexsha = remote.refs[args.diff].commit.hexsha
 
     differences = _diff_repo(
-        repo, hexsha, save_dir, args.no_super_schema, args.no_archive_json, args.no_archive_yaml, args.no_archive_txt
+        repo,
+        hexsha,
+        save_dir,
+        args.no_super_schema,
+        args.no_archive_json,
+        args.no_archive_yaml,
+        args.no_archive_txt,
+        args.archive_npy,
+        args.archive_csv,
+        args.archive_parquet,
+        args.path_index,
+        args.load_plan,
+        args.sdf_plan,
     )
 
     print("-------------------- DIFF RESULTS ------------------")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+from rad._parser import harvest_to_sqlite
+
+
+def _argparser() -> ArgumentParser:
+    """Create the argument parser for the harvest script."""
+    parser = ArgumentParser(
+        "rad_harvest",
+        description="Harvest the archived values of the ASDF files under a directory into a SQLite catalog.",
+    )
+    parser.add_argument(
+        "root",
+        type=Path,
+        help="The directory to search (recursively) for ASDF files.",
+    )
+    parser.add_argument(
+        "database",
+        type=Path,
+        help="The SQLite database to write to, it is created if it does not exist.",
+    )
+    parser.add_argument(
+        "--pattern",
+        "-p",
+        default="*.asdf",
+        help="The pattern for the file names to harvest. Defaults to '*.asdf'.",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        default=None,
+        type=int,
+        help="The number of processes to harvest with. Defaults to the number of CPUs, 0 harvests in a single process.",
+    )
+    parser.add_argument(
+        "--batch_size",
+        default=1000,
+        type=int,
+        help="The number of rows to insert into a table per transaction.",
+    )
+
+    return parser
+
+
+if __name__ == "__main__":
+    args = _argparser().parse_args()
+
+    summary = harvest_to_sqlite(args.root, args.database, args.pattern, args.workers, args.batch_size)
+
+    for path, error in summary.errors.items():
+        print(f"{path}: {error}")
+
+    print(f"Harvested {summary.files} file(s) into {summary.rows} row(s), {len(summary.errors)} file(s) failed.")
+    sys.exit(1 if summary.errors else 0)
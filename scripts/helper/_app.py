@@ -62,6 +62,12 @@ class RadApp(App):
         super().__init__(*args, **kwargs)
         self._manager = Manager(path)
 
+    def on_unmount(self) -> None:
+        """
+        Release the file watching of the manager when the app shuts down.
+        """
+        self._manager.close()
+
     def compose(self) -> ComposeResult:
         """
         Compose (render in the App) the App's Main screen layout.
@@ -228,6 +234,7 @@ class RadApp(App):
         - Suspends the application.
         - Runs the $EDITOR (or vim by default) on the given path
         - Resumes the application after the editor is closed.
+        - Re-reads any resources which were changed on disk while suspended.
         """
         with self.suspend():
             run(  # noqa: S603
@@ -235,6 +242,8 @@ class RadApp(App):
                 check=True,
             )
 
+        self._manager.sync_resources()
+
     @work
     async def on_edit_tab_start_edit(self, event: EditTab.StartEdit) -> None:
         """
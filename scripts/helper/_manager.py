@@ -14,14 +14,23 @@ from rich.style import Style
 from rich.text import Text
 from textual.messages import Message
 from textual.widgets import DirectoryTree
+from yaml import YAMLError
 
 from ._bump import Bump
 from ._frozen import frozen_uris
 from ._resource import Resource
 from ._screen import BumpScreen, NewScreen
+from ._watch import ChangeDetector, Changes
 
 __all__ = ("Manager",)
 
+# The errors for a resource file which cannot be read, e.g. it is half-written by an editor
+#   OSError: the file cannot be read (e.g. it was removed again)
+#   ValueError: the file is not text (UnicodeDecodeError)
+#   YAMLError: the file is not valid YAML
+#   KeyError, TypeError: the file has no top-level id
+_READ_ERRORS = (OSError, ValueError, YAMLError, KeyError, TypeError)
+
 
 class _Manager:
     """
@@ -75,6 +84,10 @@ class _Manager:
         self._frozen = frozen or frozen_uris(path)
         self._walk_resources()
 
+        # Snapshot the files after the initial walk so that only subsequent
+        # changes on disk are reported
+        self._detector = ChangeDetector(path / "latest")
+
     def __getitem__(self, item: Path | str) -> Resource:
         """
         Get the resource for the given item
@@ -275,6 +288,8 @@ class _Manager:
         self._remove_resource(current_resource)
         self._add_resource(new_resource)
 
+        self._refresh(new_resource)
+
         # Update the URIs related to the new resource throughout the manager
         self._update_uri(current_resource.uri, new_resource.uri)
         self._update_uri(current_resource.tag_uri, new_resource.tag_uri)
@@ -315,6 +330,7 @@ class _Manager:
 
                 # Update the resource in the manager
                 self._resources[new_resource.uri] = new_resource
+                self._refresh(new_resource)
 
     def add_tag_entry(self, entry: str) -> None:
         """
@@ -334,6 +350,7 @@ class _Manager:
 
         # Update the resource in the manager
         self._resources[new_manifest.uri] = new_manifest
+        self._refresh(new_manifest)
 
     def _resources_to_update(self, path: Path | str) -> Generator[Bump, None, None]:
         """
@@ -363,6 +380,94 @@ class _Manager:
             if (update.uri in resource.body or update.tag_uri in resource.body) and resource.frozen:
                 yield Bump(resource, self._resources_to_update(resource.path))
 
+    def _referencing(self, uris: set[str]) -> set[str]:
+        """
+        Find the resources which reference any of the given URIs.
+        --> These are the reverse references of the resources with those URIs
+
+        Parameters
+        ----------
+        uris : set[str]
+            The URIs (schema or tag) to search for.
+
+        Returns
+        -------
+        set[str]
+            The URIs of the resources whose body references one of the URIs.
+        """
+        return {
+            resource.uri
+            for resource in self._resources.values()
+            if resource.uri not in uris and any(uri in resource.body for uri in uris)
+        }
+
+    def sync_resources(self) -> tuple[Changes, set[str], dict[Path, str]]:
+        """
+        Bring the manager up to date with changes made to the resource files on disk.
+        --> Only the resources whose files were changed, added, or removed are
+            re-read rather than re-walking the whole repository.
+        --> The files are read before the manager is modified, so a file which
+            cannot be read keeps its current resource (if any) in the manager.
+
+        Returns
+        -------
+        Changes
+            The changes to the files detected on disk.
+        set[str]
+            The URIs of the resources affected by the changes, including the
+            resources that reference them.
+        dict[Path, str]
+            The errors for the changed or added files which could not be read.
+
+        Effects
+        -------
+        - Re-reads the changed and added resources into the manager.
+        - Removes the resources whose files have been removed.
+        """
+        changes = self._detector.poll()
+
+        resources = {}
+        errors = {}
+        for path in changes.changed | changes.added:
+            try:
+                resources[path] = Resource.from_path(path, self._repository)
+            except _READ_ERRORS as error:
+                errors[path] = f"{type(error).__name__}: {error}"
+
+        # Track both the old and new URIs so that references to either are found
+        uris = set()
+        for path in changes.removed | resources.keys():
+            if path in self._key_map:
+                resource = self[path]
+                uris |= {resource.uri, resource.tag_uri}
+                self._remove_resource(resource)
+
+        for resource in resources.values():
+            self._add_resource(resource)
+            uris |= {resource.uri, resource.tag_uri}
+
+        affected = {uri for uri in uris if uri in self._resources}
+        return changes, affected | self._referencing(uris), errors
+
+    def close(self) -> None:
+        """
+        Stop watching the resource files on disk.
+        """
+        self._detector.close()
+
+    def _refresh(self, *resources: Resource) -> None:
+        """
+        Record that the manager itself has written the files of the given resources.
+        --> This keeps the bumps and edits made by the app from being reported as
+            external changes by the next sync.
+
+        Parameters
+        ----------
+        *resources : Resource
+            The resources whose files were written.
+        """
+        self._detector.refresh(resource.path for resource in resources)
+
     def _walk_resources(self) -> None:
         """
         Walk through the resources in the repository and add them to the manager.
@@ -381,9 +486,9 @@ class Manager(_Manager, DirectoryTree):
     Note
     ----
     The DirectoryTree App is not great about updating the tree when file modifications
-    are made outside of the app. Hence, users should not expect the tree to reflect
-    changes they made outside of the app. Instead they should close the app and
-    re-open it to see the external changes.
+    are made outside of the app. Hence, `sync_resources` should be called after any
+    external modification (e.g. running an editor) so that the changed files are
+    re-read and the tree is reloaded when files are added or removed.
     """
 
     ICON_LOCKED = "🔒"
@@ -496,6 +601,24 @@ class Manager(_Manager, DirectoryTree):
 
         self.post_message(self.Complete(state))
 
+    def sync_resources(self) -> tuple[Changes, set[str], dict[Path, str]]:
+        """
+        Add in the reloading of the directory tree when files were added or removed,
+        and the notification of the files which could not be read.
+        """
+        changes, affected, errors = super().sync_resources()
+
+        if changes.added or changes.removed:
+            self.reload()
+
+        if changes:
+            self.notify(f"Reloaded {len(affected)} resource(s) changed on disk.", severity="info")
+
+        for path, error in errors.items():
+            self.notify(f"Could not read {path}, keeping its last version: {error}", severity="error")
+
+        return changes, affected, errors
+
     def add_new_resource(self, state: NewScreen.Return, resource: Resource) -> None:
         """
         Add a new resource to the manager and the directory tree.
@@ -507,6 +630,7 @@ class Manager(_Manager, DirectoryTree):
             The new resource to add to the manager and the directory tree.
         """
         self._add_resource(resource)
+        self._refresh(resource)
         self.notify(f"New resource {resource.uri} added successfully.", severity="success")
         self.post_message(self.Complete(state))
 
@@ -532,6 +656,7 @@ class Manager(_Manager, DirectoryTree):
         # Remove the current resource from the manager and add the new one
         self._remove_resource(current_resource)
         self._add_resource(edited_resource)
+        self._refresh(edited_resource)
 
         self.notify(f"Edit to {edited_resource.uri} successful.", severity="success")
         self.post_message(self.Complete(BumpScreen.Return.EDIT))
@@ -0,0 +1,234 @@
+"""
+This module provides the change detection for the RAD resources on disk.
+--> The result is a ChangeDetector which reports the YAML files under a directory
+    that have been changed, added, or removed since it was last polled.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ("ChangeDetector", "Changes")
+
+
+class Changes(NamedTuple):
+    """
+    The changes detected on disk between two polls of a ChangeDetector.
+
+    Parameters
+    ----------
+    changed : frozenset[Path]
+        The files whose contents (mtime or size) changed.
+    added : frozenset[Path]
+        The files which did not exist at the last poll.
+    removed : frozenset[Path]
+        The files which no longer exist.
+    """
+
+    changed: frozenset[Path]
+    added: frozenset[Path]
+    removed: frozenset[Path]
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.added or self.removed)
+
+
+class _PollingBackend:
+    """
+    Find the candidate files for changes by simply listing the directory.
+    --> This is always correct, but requires a stat of every file on each poll.
+
+    Parameters
+    ----------
+    root : Path
+        The directory to watch.
+    pattern : str
+        The glob pattern for the files to watch.
+    """
+
+    def __init__(self, root: Path, pattern: str) -> None:
+        self._root = root
+        self._pattern = pattern
+
+    def candidates(self, known: set[Path]) -> set[Path]:
+        """
+        Get every file which may have changed since the last poll.
+        """
+        return set(self._root.glob(self._pattern)) | known
+
+    def close(self) -> None:
+        """
+        Nothing to release for polling.
+        """
+
+
+class _InotifyBackend:
+    """
+    Find the candidate files for changes from the inotify events of the directories.
+    --> Only the files named in the events need to be checked, so a poll
+        is proportional to the number of modified files rather than all files.
+    --> Requires the optional `inotify_simple` package (Linux only).
+
+    Parameters
+    ----------
+    root : Path
+        The directory to watch.
+    pattern : str
+        The glob pattern for the files to watch.
+    """
+
+    def __init__(self, root: Path, pattern: str) -> None:
+        from inotify_simple import INotify, flags
+
+        self._root = root
+        self._pattern = pattern
+        self._inotify = INotify()
+        self._mask = (
+            flags.CREATE | flags.MODIFY | flags.CLOSE_WRITE | flags.DELETE | flags.MOVED_FROM | flags.MOVED_TO | flags.ATTRIB
+        )
+        self._is_dir = flags.ISDIR
+        self._watches: dict[int, Path] = {}
+
+        self._watch(root)
+        for directory in root.glob("**/"):
+            self._watch(directory)
+
+    def _watch(self, directory: Path) -> None:
+        self._watches[self._inotify.add_watch(directory, self._mask)] = directory
+
+    def candidates(self, known: set[Path]) -> set[Path]:
+        """
+        Get the files named by the inotify events since the last poll.
+        """
+        paths = set()
+        for event in self._inotify.read(timeout=0):
+            if event.wd not in self._watches:
+                continue
+
+            path = self._watches[event.wd] / event.name
+            if event.mask & self._is_dir:
+                # A new directory may already contain files by the time it is watched
+                if path.is_dir():
+                    self._watch(path)
+                    paths |= set(path.glob(self._pattern))
+                else:
+                    paths |= {known_path for known_path in known if path in known_path.parents}
+            elif path.match(self._pattern):
+                paths.add(path)
+
+        return paths
+
+    def close(self) -> None:
+        """
+        Release the inotify file descriptor.
+        """
+        self._inotify.close()
+
+
+class ChangeDetector:
+    """
+    Detect changes to the YAML files under a directory by comparing the
+    (mtime, size) of the files against a snapshot taken at the previous poll.
+
+    ---> By default the whole directory is polled, but if the `inotify_simple` package
+         is installed (and `inotify` is not False) the inotify events are used to
+         limit the files which need to be checked.
+
+    Parameters
+    ----------
+    root : Path
+        The directory to watch (normally `latest`).
+    pattern : str, optional
+        The glob pattern for the files to watch, by default "**/*.yaml".
+    inotify : bool | None, optional
+        Whether to use the inotify backend. If None (default) it is used only when available.
+    """
+
+    def __init__(self, root: Path, pattern: str = "**/*.yaml", *, inotify: bool | None = None) -> None:
+        self._root = root
+        self._pattern = pattern
+        self._backend = self._create_backend(inotify)
+        self._snapshot = {path: stat for path in root.glob(pattern) if (stat := self._stat(path)) is not None}
+
+    def _create_backend(self, inotify: bool | None) -> _PollingBackend | _InotifyBackend:
+        if inotify is False:
+            return _PollingBackend(self._root, self._pattern)
+
+        try:
+            return _InotifyBackend(self._root, self._pattern)
+        except (ImportError, OSError):
+            if inotify:
+                raise
+
+        return _PollingBackend(self._root, self._pattern)
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    @property
+    def paths(self) -> frozenset[Path]:
+        """
+        Get the files currently known to the detector.
+        """
+        return frozenset(self._snapshot)
+
+    def poll(self) -> Changes:
+        """
+        Find the changes since the last poll and update the snapshot.
+
+        Returns
+        -------
+        Changes
+            The changed, added, and removed files.
+        """
+        changed, added, removed = set(), set(), set()
+
+        for path in self._backend.candidates(set(self._snapshot)):
+            stat = self._stat(path)
+            previous = self._snapshot.get(path)
+
+            if stat is None:
+                if previous is not None:
+                    removed.add(path)
+                    del self._snapshot[path]
+            elif previous is None:
+                added.add(path)
+                self._snapshot[path] = stat
+            elif stat != previous:
+                changed.add(path)
+                self._snapshot[path] = stat
+
+        return Changes(frozenset(changed), frozenset(added), frozenset(removed))
+
+    def refresh(self, paths: Iterable[Path]) -> None:
+        """
+        Take the current state of the given files into the snapshot without reporting them.
+        --> Used for the files written by the app itself, so that they are not
+            reported as changes made on disk at the next poll.
+
+        Parameters
+        ----------
+        paths : Iterable[Path]
+            The files to refresh.
+        """
+        for path in paths:
+            if (stat := self._stat(path)) is None:
+                self._snapshot.pop(path, None)
+            else:
+                self._snapshot[path] = stat
+
+    def close(self) -> None:
+        """
+        Release any resources held by the backend.
+        """
+        self._backend.close()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import importlib.resources as importlib_resources
+import sys
+from argparse import ArgumentParser
+
+from rad import resources
+from rad.integration import _LATEST_CLOSURE, latest_closure
+
+_HEADER = """\
+# The resources reachable from the latest datamodels and static manifests, which
+# are registered in latest-only mode (RAD_LATEST_ONLY=1).
+# Generated by scripts/latest_closure.py, rerun it whenever the latest resources change.
+"""
+
+
+def _content(uris: list[str]) -> str:
+    """
+    Build the content of the precomputed closure of the latest manifests.
+    """
+    return _HEADER + "".join(f"{uri}\n" for uri in uris)
+
+
+def _argparser() -> ArgumentParser:
+    parser = ArgumentParser(description="Precompute the resources registered in latest-only mode.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that the precomputed closure is up to date.",
+    )
+
+    return parser
+
+
+if __name__ == "__main__":
+    args = _argparser().parse_args()
+
+    index = importlib_resources.files(resources) / _LATEST_CLOSURE
+    uris = latest_closure(importlib_resources.files(resources))
+    content = _content(uris)
+    if args.check:
+        if not index.is_file() or index.read_text() != content:
+            print(f"{_LATEST_CLOSURE} is out of date, run scripts/latest_closure.py to update it.")
+            sys.exit(1)
+
+        sys.exit(0)
+
+    with importlib_resources.as_file(index) as path:
+        path.write_text(content)
+
+    print(f"Wrote {len(uris)} URIs to {_LATEST_CLOSURE}.")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser
+from itertools import chain
+
+import asdf
+import yaml
+
+from rad._parser import LINT_RULES, is_known_violation, lint_schema
+from rad.versions import VersionIndex, split_uri
+
+_SCHEMA_URI_PREFIX = "asdf://stsci.edu/datamodels/roman/schemas/"
+_MANIFEST_URI_PREFIX = "asdf://stsci.edu/datamodels/roman/manifests/"
+_METASCHEMA_URI_PREFIX = f"{_SCHEMA_URI_PREFIX}rad_schema-"
+
+
+def _latest(uris: list[str]) -> list[str]:
+    """
+    Filter the URIs down to the latest version of each schema.
+    """
+    index = VersionIndex(uris)
+    return [uri for uri in uris if (split := split_uri(uri)) is None or index.latest(split[0]) == uri]
+
+
+def _lint(uris: list[str] | None, rules: list[str] | None, all_versions: bool = False, include_known: bool = False) -> int:
+    """
+    Lint the RAD schemas registered with ASDF.
+
+    Parameters
+    ----------
+    uris
+        The schema URIs to lint, if None all the RAD schemas are linted.
+    rules
+        The lint rules to run, if None all the lint rules are run.
+    all_versions
+        Lint every version of the schemas rather than only the latest ones.
+    include_known
+        Also report the known violations the test suite accepts (see LINT_SKIPS and LINT_XFAILS).
+
+    Returns
+    -------
+    int
+        The number of violations found.
+    """
+    resource_manager = asdf.get_config().resource_manager
+    resources = {
+        uri: yaml.safe_load(resource_manager[uri])
+        for uri in resource_manager
+        if uri.startswith(_SCHEMA_URI_PREFIX) and not uri.startswith(_METASCHEMA_URI_PREFIX)
+    }
+    manifests = [yaml.safe_load(resource_manager[uri]) for uri in resource_manager if uri.startswith(_MANIFEST_URI_PREFIX)]
+    tagged = {entry["schema_uri"] for entry in chain(*[manifest["tags"] for manifest in manifests])}
+
+    count = 0
+    for uri in uris or (list(resources) if all_versions else _latest(list(resources))):
+        for violation in lint_schema(resources[uri], uri=uri, tagged=uri in tagged, rules=rules):
+            if not include_known and is_known_violation(violation):
+                continue
+
+            print(f"{violation.uri}:{violation.path}: [{violation.rule}] {violation.message}")
+            count += 1
+
+    return count
+
+
+def _argparser() -> ArgumentParser:
+    """Create the argument parser for the lint script."""
+    parser = ArgumentParser(
+        "rad_lint",
+        description="Lint the RAD schemas for the features not covered by the metaschema.",
+    )
+    parser.add_argument(
+        "uris",
+        nargs="*",
+        help="The schema URIs to lint. If not specified, all the RAD schemas are linted.",
+    )
+    parser.add_argument(
+        "--rule",
+        "-r",
+        action="append",
+        choices=sorted(LINT_RULES),
+        help="Only run the given lint rule (can be repeated). If not specified, all the rules are run.",
+    )
+    parser.add_argument(
+        "--all_versions",
+        action="store_true",
+        help="Lint every version of the schemas, not only the latest ones.",
+    )
+    parser.add_argument(
+        "--include_known",
+        action="store_true",
+        help="Also report the known violations of the published schemas, which the test suite accepts.",
+    )
+
+    return parser
+
+
+if __name__ == "__main__":
+    args = _argparser().parse_args()
+
+    violations = _lint(args.uris, args.rule, args.all_versions, args.include_known)
+
+    print(f"Found {violations} violation(s).")
+    sys.exit(1 if violations else 0)
@@ -1,7 +1,44 @@
-from ._archive import archive_entries, archive_schema
+from ._archive import archive_array, archive_entries, archive_records, archive_schema
+from ._catalog import harvest_to_sqlite
+from ._destinations import destination_index
 from ._diff import diff
+from ._enum_codes import enum_code_tables, enum_codes
+from ._harvest import harvest, harvest_plan
+from ._index import path_index
+from ._load_plan import load_plans
+from ._lint import LINT_RULES, LINT_SKIPS, LINT_XFAILS, is_known_violation, lint_schema
 from ._process import dump
+from ._required import missing_paths, required_path_sets, required_paths
+from ._sdf import sdf_plan
 from ._ssc import asdf_ssc_config
 from ._super_schema import super_schema
+from ._table_dtype import table_dtype
 
-__all__ = ["archive_entries", "archive_schema", "asdf_ssc_config", "diff", "dump", "super_schema"]
+__all__ = [
+    "LINT_RULES",
+    "LINT_SKIPS",
+    "LINT_XFAILS",
+    "archive_array",
+    "archive_entries",
+    "archive_records",
+    "archive_schema",
+    "asdf_ssc_config",
+    "destination_index",
+    "diff",
+    "dump",
+    "enum_code_tables",
+    "enum_codes",
+    "harvest",
+    "harvest_plan",
+    "harvest_to_sqlite",
+    "is_known_violation",
+    "lint_schema",
+    "load_plans",
+    "missing_paths",
+    "path_index",
+    "required_path_sets",
+    "required_paths",
+    "sdf_plan",
+    "super_schema",
+    "table_dtype",
+]
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import copy
 from collections import abc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from rad.tracing import span
 
 if TYPE_CHECKING:
     from typing import Any, TypedDict
@@ -12,7 +16,20 @@ if TYPE_CHECKING:
         destination: list[str]
 
 
-__all__ = ["archive_entries", "archive_schema"]
+__all__ = ["ArchiveRecord", "archive_array", "archive_entries", "archive_records", "archive_schema"]
+
+
+class ArchiveRecord(NamedTuple):
+    """
+    A structured archive mapping, holding the same information as an archive mapping string.
+    """
+
+    archive_meta: str
+    path: str
+    table: str
+    column: str
+    datatype_code: int
+    schema_path: str
 
 
 def archive_schema(schema: dict[str, Any]) -> dict[str, Any]:
@@ -123,6 +140,16 @@ def _path_archive(schema: dict[str, Any]) -> dict[str, ArchiveInfo]:
     return data
 
 
+def _datatype_code(datatype: str | None) -> int:
+    """
+    Code the archive datatype as 1 for strings, 0 for anything else, and -1 if it is missing.
+    """
+    if datatype is None:
+        return -1
+
+    return int("char" in datatype.lower() or "str" in datatype.lower())
+
+
 def _archive_string(path: str, datatype: str | None, destination: list[str]) -> list[str]:
     """
     Produce a string representation of an archive mapping
@@ -150,10 +177,7 @@ def _archive_string(path: str, datatype: str | None, destination: list[str]) ->
     archive_path = "|".join(path.split(".")[-2:][::-1])
 
     if datatype is not None:
-        if "char" in datatype.lower() or "str" in datatype.lower():
-            schema_path = f"1||{schema_path}"
-        else:
-            schema_path = f"0||{schema_path}"
+        schema_path = f"{_datatype_code(datatype)}||{schema_path}"
 
     return ["|".join([archive_path, *(dest.split(".")), schema_path]) for dest in destination]
 
@@ -173,10 +197,65 @@ def archive_entries(schema: dict[str, Any]) -> list[str]:
         List of archive mapping strings
     """
     archive_meta = schema.get("archive_meta")
-    path_info = _path_archive(schema)
+    with span("archive_entries", archive_meta=archive_meta) as event:
+        path_info = _path_archive(schema)
 
-    archive_strings = []
-    for path, archive_info in path_info.items():
-        archive_strings.extend([f"{archive_meta}|{dest}" for dest in _archive_string(path, **archive_info)])
+        archive_strings = []
+        for path, archive_info in path_info.items():
+            archive_strings.extend([f"{archive_meta}|{dest}" for dest in _archive_string(path, **archive_info)])
+
+        event.set(entries=len(archive_strings))
 
     return archive_strings
+
+
+def archive_records(schema: dict[str, Any]) -> list[ArchiveRecord]:
+    """
+    Produce a list of structured archive mappings from a schema, one for each
+    archive mapping string produced by `archive_entries`.
+
+    Parameters
+    ----------
+    schema : dict[str, Any]
+        Schema to process
+
+    Returns
+    -------
+    list[ArchiveRecord]
+        List of structured archive mappings
+    """
+    archive_meta = schema.get("archive_meta")
+    with span("archive_records", archive_meta=archive_meta):
+        records = []
+        for path, archive_info in _path_archive(schema).items():
+            schema_path = f"meta.{path}" if "." in path else f"meta.top.{path}"
+            code = _datatype_code(archive_info.get("datatype"))
+            for dest in archive_info["destination"]:
+                table, column = dest.split(".", 1)
+                records.append(ArchiveRecord(str(archive_meta), path, table, column, code, schema_path))
+
+    return records
+
+
+def archive_array(records: list[ArchiveRecord]) -> np.ndarray:
+    """
+    Pack structured archive mappings into a NumPy structured array.
+
+    Parameters
+    ----------
+    records : list[ArchiveRecord]
+        The structured archive mappings.
+
+    Returns
+    -------
+    np.ndarray
+        The structured array with a (fixed-width) field for each field of `ArchiveRecord`.
+    """
+    dtype = []
+    for index, name in enumerate(ArchiveRecord._fields):
+        if name == "datatype_code":
+            dtype.append((name, np.int8))
+        else:
+            dtype.append((name, f"U{max((len(record[index]) for record in records), default=1)}"))
+
+    return np.array(records, dtype=dtype)
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import sqlite3
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import yaml
+
+from rad.tracing import span
+
+from ._harvest import harvest, harvest_plan
+from ._load_plan import _quote
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any
+
+    from ._harvest import Harvested
+
+
+__all__ = ["CatalogSummary", "harvest_to_sqlite", "sqlite_type"]
+
+# The column added to every table for the file the row was harvested from
+_SOURCE_COLUMN = "source_file"
+
+
+class CatalogSummary(NamedTuple):
+    """
+    The outcome of harvesting files into a catalog.
+    """
+
+    files: int
+    rows: int
+    errors: dict[str, str]
+
+
+def sqlite_type(datatype: str) -> str:
+    """
+    Get the SQLite column type for an archive_catalog datatype (e.g. "nvarchar(120)").
+
+    Parameters
+    ----------
+    datatype : str
+        The archive (SQL Server) datatype.
+
+    Returns
+    -------
+    str
+        The SQLite column type, one of INTEGER, REAL, or TEXT.
+    """
+    datatype = datatype.lower()
+    if "char" in datatype or "date" in datatype or "time" in datatype:
+        return "TEXT"
+    if "int" in datatype or "bit" in datatype or "bool" in datatype:
+        return "INTEGER"
+    if "float" in datatype or "real" in datatype or "decimal" in datatype or "numeric" in datatype:
+        return "REAL"
+
+    return "TEXT"
+
+
+def _adapt(value: Any) -> Any:
+    """
+    Adapt a harvested value to one which SQLite can store.
+    """
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, dict | list):
+        return json.dumps(value, default=str)
+
+    return value
+
+
+class _SQLiteCatalog:
+    """
+    Writes the harvested rows into the tables named by their destinations, in batches.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, batch_size: int) -> None:
+        self._connection = connection
+        self._batch_size = batch_size
+        self._columns: dict[str, set[str]] = {}
+        self._tables: dict[str, dict[str, tuple[str, ...]]] = {}
+        self._batches: dict[tuple[str, tuple[str, ...]], list[tuple[Any, ...]]] = {}
+        self.rows = 0
+
+    def _table_columns(self, table: str) -> set[str]:
+        if table not in self._columns:
+            self._connection.execute(f"CREATE TABLE IF NOT EXISTS {_quote(table)} ({_quote(_SOURCE_COLUMN)} TEXT PRIMARY KEY)")
+            self._columns[table] = {row[1] for row in self._connection.execute(f"PRAGMA table_info({_quote(table)})")}
+
+        return self._columns[table]
+
+    def _plan_tables(self, schema_uri: str) -> dict[str, tuple[str, ...]]:
+        """
+        Get the tables (and their columns) a datamodel is written to, creating any
+        which are missing from the database.
+        """
+        if schema_uri not in self._tables:
+            tables: dict[str, dict[str, str]] = {}
+            for field in harvest_plan(schema_uri).fields:
+                for dest in field.destination:
+                    table, column = dest.split(".", 1)
+                    tables.setdefault(table, {}).setdefault(column, field.datatype)
+
+            with self._connection:
+                for table, columns in tables.items():
+                    existing = self._table_columns(table)
+                    for column, datatype in columns.items():
+                        if column not in existing:
+                            self._connection.execute(
+                                f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)} {sqlite_type(datatype)}"
+                            )
+                            existing.add(column)
+
+            self._tables[schema_uri] = {table: tuple(columns) for table, columns in tables.items()}
+
+        return self._tables[schema_uri]
+
+    def add(self, harvested: Harvested) -> None:
+        for table, columns in self._plan_tables(harvested.schema_uri).items():
+            key = (table, columns)
+            batch = self._batches.setdefault(key, [])
+            batch.append((harvested.path, *(_adapt(harvested.row[f"{table}.{column}"]) for column in columns)))
+
+            if len(batch) >= self._batch_size:
+                self._flush(key)
+
+    def _flush(self, key: tuple[str, tuple[str, ...]]) -> None:
+        table, columns = key
+        if not (batch := self._batches.pop(key, [])):
+            return
+
+        # The identifiers are quoted, and all the values are bound as parameters
+        names = ", ".join(_quote(name) for name in (_SOURCE_COLUMN, *columns))
+        values = ", ".join("?" * (len(columns) + 1))
+        statement = f"INSERT OR REPLACE INTO {_quote(table)} ({names}) VALUES ({values})"  # noqa: S608
+        with span("catalog.insert", table=table, rows=len(batch)), self._connection:
+            self._connection.executemany(statement, batch)
+
+        self.rows += len(batch)
+
+    def flush(self) -> None:
+        for key in list(self._batches):
+            self._flush(key)
+
+
+# The errors for a file which cannot be harvested:
+#   OSError: the file cannot be read
+#   yaml.YAMLError: the tree is not valid YAML
+#   ValueError: the file is not ASDF, or its datamodel is not a RAD datamodel
+#   KeyError: the tree has no datamodel
+_HARVEST_ERRORS = (OSError, yaml.YAMLError, ValueError, KeyError)
+
+# The number of files queued for harvesting per process
+_QUEUE_DEPTH = 4
+
+
+def _harvest_file(path: str) -> tuple[str, Harvested | None, str | None]:
+    """
+    Harvest a file, capturing the error (rather than raising) if it cannot be harvested.
+    """
+    try:
+        return path, harvest(path), None
+    except _HARVEST_ERRORS as error:
+        return path, None, f"{type(error).__name__}: {error}"
+
+
+def _harvest_files(paths: Iterable[str], max_workers: int | None) -> Iterator[tuple[str, Harvested | None, str | None]]:
+    """
+    Harvest the files, in a pool of processes unless max_workers is 0.
+        -> Only a few files per process are queued at a time, and each file is yielded
+           as soon as it is harvested (in no particular order), so that neither the paths
+           nor the harvested rows pile up in memory.
+    """
+    if max_workers == 0:
+        yield from map(_harvest_file, paths)
+        return
+
+    limit = _QUEUE_DEPTH * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for path in paths:
+            pending.add(executor.submit(_harvest_file, path))
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+
+        yield from (future.result() for future in as_completed(pending))
+
+
+def harvest_to_sqlite(
+    root: str | os.PathLike[str],
+    database: str | os.PathLike[str],
+    pattern: str = "*.asdf",
+    max_workers: int | None = None,
+    batch_size: int = 1000,
+) -> CatalogSummary:
+    """
+    Harvest the archived values of all the ASDF files under a directory into a SQLite database.
+        -> The tables and their columns are named by the archive_catalog destinations, with
+           column types following the archive_catalog datatypes, plus a "source_file" key.
+        -> Each file is written to every table its datamodel has destinations in, replacing
+           any row already harvested from the same file.
+        -> Files are harvested by a pool of processes, and their rows are streamed into the
+           database in batched transactions as the files complete.
+
+    Parameters
+    ----------
+    root : str | PathLike[str]
+        The directory to search (recursively) for ASDF files.
+    database : str | PathLike[str]
+        The SQLite database to write to, it is created if it does not exist.
+    pattern : str, optional
+        The pattern for the file names to harvest, by default "*.asdf".
+    max_workers : int, optional
+        The number of processes to harvest with, by default the number of CPUs.
+        If 0, the files are harvested in this process.
+    batch_size : int, optional
+        The number of rows to insert into a table per transaction.
+
+    Returns
+    -------
+    CatalogSummary
+        The number of files harvested and rows written, and the errors for any files
+        which could not be harvested.
+    """
+    paths = (str(path) for path in Path(root).rglob(pattern) if path.is_file())
+
+    files = 0
+    errors = {}
+    connection = sqlite3.connect(database)
+    try:
+        catalog = _SQLiteCatalog(connection, batch_size)
+        for path, harvested, error in _harvest_files(paths, max_workers):
+            if harvested is None:
+                errors[path] = error
+                continue
+
+            catalog.add(harvested)
+            files += 1
+
+        catalog.flush()
+    finally:
+        connection.close()
+
+    return CatalogSummary(files, catalog.rows, errors)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections import abc
+from typing import TYPE_CHECKING, NamedTuple
+
+from ._index import path_index
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any
+
+
+__all__ = ["Contributor", "DestinationIndex", "destination_index"]
+
+
+class Contributor(NamedTuple):
+    """
+    A data path of a datamodel which is written to an archive destination.
+    """
+
+    schema_uri: str
+    archive_meta: str
+    path: str
+    datatype: str
+
+
+class DestinationIndex(abc.Mapping):
+    """
+    The contributors to each archive destination ("Table.column").
+        -> Contributors are added one at a time, and any which disagree with the
+           datatype of the earlier contributors to a destination are recorded
+           as a conflict when they are added.
+    """
+
+    def __init__(self) -> None:
+        self._contributors: dict[str, list[Contributor]] = {}
+        self.conflicts: dict[str, set[str]] = {}
+
+    def add(self, destination: str, contributor: Contributor) -> None:
+        """
+        Add a contributor to a destination.
+
+        Parameters
+        ----------
+        destination : str
+            The archive destination, "Table.column".
+        contributor : Contributor
+            The data path written to the destination.
+        """
+        contributors = self._contributors.setdefault(destination, [])
+        if contributors and contributor.datatype != contributors[0].datatype:
+            self.conflicts.setdefault(destination, {contributors[0].datatype}).add(contributor.datatype)
+
+        contributors.append(contributor)
+
+    def datatypes(self, destination: str) -> set[str]:
+        """
+        The datatypes the contributors to a destination give it.
+        """
+        return {contributor.datatype for contributor in self[destination]}
+
+    def __getitem__(self, destination: str) -> tuple[Contributor, ...]:
+        return tuple(self._contributors[destination])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._contributors)
+
+    def __len__(self) -> int:
+        return len(self._contributors)
+
+
+def destination_index(schemas: abc.Mapping[str, dict[str, Any]]) -> DestinationIndex:
+    """
+    Index every data path of the archive-bearing super schemas by the archive destinations it is written to.
+
+    Parameters
+    ----------
+    schemas : Mapping[str, dict[str, Any]]
+        schema-uri: the super schema (see `super_schema`), schemas without an
+        archive_meta are skipped.
+
+    Returns
+    -------
+    DestinationIndex
+        "Table.column": the (schema_uri, archive_meta, data path, datatype) of each
+        contributor, with the datatype conflicts found between the contributors.
+    """
+    index = DestinationIndex()
+    for schema_uri, schema in schemas.items():
+        if (archive_meta := schema.get("archive_meta")) is None:
+            continue
+
+        for path, info in path_index(schema).items():
+            if (archive_catalog := info["archive_catalog"]) is None:
+                continue
+
+            contributor = Contributor(schema_uri, archive_meta, path, archive_catalog["datatype"])
+            for dest in archive_catalog["destination"]:
+                index.add(dest, contributor)
+
+    return index
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import asdf.schema
+import numpy as np
+
+from rad.versions import get_version_index
+
+from ._index import path_index
+from ._super_schema import super_schema
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+
+__all__ = ["EnumCodes", "enum_code_tables", "enum_codes"]
+
+
+def _schema_versions(schema_uri: str) -> list[str]:
+    """
+    Find the URIs of the versions of a schema, oldest first, up to and including the schema.
+    """
+    versions = get_version_index().versions(schema_uri.rsplit("-", 1)[0])
+    return versions[: versions.index(schema_uri) + 1] if schema_uri in versions else [schema_uri]
+
+
+@cache
+def _inline_enums(schema_uri: str) -> dict[str, list[Any]]:
+    """
+    Find the inline enums of a datamodel, by their data path.
+    """
+    return {path: info["node"]["enum"] for path, info in path_index(super_schema(schema_uri)).items() if "enum" in info["node"]}
+
+
+def _enum_values(schema_uri: str, path: str | None) -> list[Any] | None:
+    """
+    Get the enum of a schema, or of the node of a datamodel at a data path.
+    """
+    if path is None:
+        return asdf.schema.load_schema(schema_uri, resolve_references=True).get("enum")
+
+    return _inline_enums(schema_uri).get(path)
+
+
+class EnumCodes:
+    """
+    A table of small integer codes for the values of an enum.
+        -> The codes are append-only across the versions of the schema, a value keeps
+           the code it was first given even if it is dropped by a later version.
+        -> Arrays of values are checked and encoded by binary search over the sorted
+           allowed values, rather than value by value.
+
+    Parameters
+    ----------
+    name : str
+        The name of the enum, e.g. its schema URI.
+    values : tuple[Any, ...]
+        The values of the enum ever coded, each value's code is its position.
+    allowed : Iterable[Any]
+        The values allowed by the current version of the enum.
+    """
+
+    def __init__(self, name: str, values: tuple[Any, ...], allowed: Iterable[Any]) -> None:
+        self.name = name
+        self.values = values
+        self.allowed = frozenset(allowed)
+        self.codes = {value: code for code, value in enumerate(values)}
+        self.dtype = np.min_scalar_type(max(len(values) - 1, 0))
+
+        self._sorted = np.array(sorted(self.allowed))
+        self._sorted_codes = np.array([self.codes[value] for value in self._sorted.tolist()], dtype=self.dtype)
+
+    def code(self, value: Any) -> int:
+        """
+        Get the code for a single value.
+
+        Raises
+        ------
+        ValueError
+            If the value is not allowed by the enum.
+        """
+        if value not in self.allowed:
+            raise ValueError(f"{value!r} is not a value of the enum {self.name}")
+
+        return self.codes[value]
+
+    def _search(self, values: Any) -> tuple[np.ndarray, np.ndarray]:
+        values = np.asarray(values)
+        index = np.searchsorted(self._sorted, values).clip(0, len(self._sorted) - 1)
+        return index, self._sorted[index] == values
+
+    def is_valid(self, values: Any) -> np.ndarray:
+        """
+        Check which of an array of values are allowed by the enum.
+
+        Parameters
+        ----------
+        values : array-like
+            The values, e.g. a NumPy string array.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean mask of the allowed values.
+        """
+        return self._search(values)[1]
+
+    def encode(self, values: Any) -> np.ndarray:
+        """
+        Check and encode an array of values in one pass.
+
+        Parameters
+        ----------
+        values : array-like
+            The values, e.g. a NumPy string array.
+
+        Returns
+        -------
+        np.ndarray
+            The codes of the values, with the smallest unsigned integer dtype
+            which holds all the codes.
+
+        Raises
+        ------
+        ValueError
+            If any of the values are not allowed by the enum.
+        """
+        index, valid = self._search(values)
+        if not valid.all():
+            invalid = np.unique(np.asarray(values)[~valid]).tolist()
+            raise ValueError(f"{invalid} are not values of the enum {self.name}")
+
+        return self._sorted_codes[index]
+
+    def decode(self, codes: Any) -> np.ndarray:
+        """
+        Decode an array of codes back into their values.
+        """
+        return np.array(self.values)[np.asarray(codes)]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@cache
+def enum_codes(schema_uri: str, path: str | None = None) -> EnumCodes:
+    """
+    Compile the code table of an enum, e.g. of the enums/exposure_type schema or
+    of an inline enum of a datamodel.
+        -> The codes are assigned in order of first appearance going through the
+           versions of the schema, oldest first, so they are stable across versions.
+
+    Parameters
+    ----------
+    schema_uri : str
+        The URI of the schema.
+    path : str, optional
+        The dotted data path of the enum in a datamodel, by default the enum is the schema.
+
+    Returns
+    -------
+    EnumCodes
+        The code table.
+    """
+    values: dict[Any, None] = {}
+    for uri in _schema_versions(schema_uri):
+        values.update(dict.fromkeys(_enum_values(uri, path) or ()))
+
+    if (allowed := _enum_values(schema_uri, path)) is None:
+        raise ValueError(f"There is no enum at {path or 'the root'} of the schema {schema_uri}")
+
+    return EnumCodes(f"{schema_uri}#{path}" if path else schema_uri, tuple(values), allowed)
+
+
+def enum_code_tables(schema_uri: str) -> dict[str, EnumCodes]:
+    """
+    Compile the code tables of all the inline enums of a datamodel.
+
+    Parameters
+    ----------
+    schema_uri : str
+        The URI of the datamodel's schema.
+
+    Returns
+    -------
+    dict[str, EnumCodes]
+        data-path: the code table of the enum at that path.
+    """
+    return {path: enum_codes(schema_uri, path) for path in _inline_enums(schema_uri)}
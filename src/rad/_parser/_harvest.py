@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections import abc
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
+
+import asdf.tagged
+import asdf.util
+
+from rad.tracing import span
+from rad.manifests import get_manifest_index
+
+from ._index import path_index
+from ._super_schema import super_schema
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from typing import Any
+
+
+__all__ = ["ArchiveField", "HarvestPlan", "Harvested", "harvest", "harvest_plan"]
+
+
+class ArchiveField(NamedTuple):
+    """
+    A field of a datamodel which is archived.
+    """
+
+    path: tuple[str, ...]
+    datatype: str
+    destination: tuple[str, ...]
+
+
+class HarvestPlan(NamedTuple):
+    """
+    The plan for extracting the archived fields of a datamodel from an ASDF tree.
+    """
+
+    schema_uri: str
+    archive_meta: str | None
+    fields: tuple[ArchiveField, ...]
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """
+        The destination "table.column"s of the plan, in order.
+        """
+        return tuple(dict.fromkeys(dest for field in self.fields for dest in field.destination))
+
+    def extract(self, tree: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extract the archived values from the tree of a datamodel.
+
+        Parameters
+        ----------
+        tree : dict[str, Any]
+            The tree of the datamodel (i.e. the node tagged with the datamodel's tag).
+
+        Returns
+        -------
+        dict[str, Any]
+            "table.column": value, where missing fields have the value None.
+        """
+        row = dict.fromkeys(self.columns)
+        for field in self.fields:
+            node = tree
+            for key in field.path:
+                if not isinstance(node, abc.Mapping) or key not in node:
+                    break
+                node = node[key]
+            else:
+                value = _plain(node)
+                for dest in field.destination:
+                    row[dest] = value
+
+        return row
+
+
+class Harvested(NamedTuple):
+    """
+    The archived values harvested from an ASDF file.
+    """
+
+    path: str
+    schema_uri: str
+    row: dict[str, Any]
+
+
+def _plain(value: Any) -> Any:
+    """
+    Reduce a (tagged) node to the plain value which is archived.
+        -> Tagged objects with a value (e.g. times and quantities) are reduced to that value.
+    """
+    if isinstance(value, asdf.tagged.TaggedDict) and "value" in value:
+        return _plain(value["value"])
+    if isinstance(value, asdf.tagged.TaggedString):
+        return str(value)
+    if isinstance(value, asdf.tagged.TaggedList):
+        return list(value)
+
+    return value
+
+
+@cache
+def harvest_plan(schema_uri: str) -> HarvestPlan:
+    """
+    Compile the plan for extracting the archived fields of a datamodel.
+
+    Parameters
+    ----------
+    schema_uri : str
+        The URI of the datamodel's schema.
+
+    Returns
+    -------
+    HarvestPlan
+        The fields with an archive_catalog, located by their full data path.
+    """
+    schema = super_schema(schema_uri)
+
+    fields = []
+    for path, info in path_index(schema).items():
+        if (archive_catalog := info["archive_catalog"]) is not None:
+            fields.append(
+                ArchiveField(tuple(path.split(".")), archive_catalog["datatype"], tuple(archive_catalog["destination"]))
+            )
+
+    return HarvestPlan(schema_uri, schema.get("archive_meta"), tuple(fields))
+
+
+def harvest(path: str | PathLike[str], root: str = "roman") -> Harvested:
+    """
+    Harvest the archived values from an ASDF file.
+        -> Only the YAML tree of the file is read, none of the array blocks are loaded.
+        -> The datamodel (and so the plan) is determined from the tag of the root node.
+
+    Parameters
+    ----------
+    path : str | PathLike[str]
+        The ASDF file.
+    root : str, optional
+        The key of the datamodel in the tree, by default "roman".
+
+    Returns
+    -------
+    Harvested
+        The file, the schema of its datamodel and its row of archived values.
+    """
+    with span("harvest", path=str(path)):
+        tree = asdf.util.load_yaml(path, tagged=True)[root]
+        plan = harvest_plan(get_manifest_index().schema_uri(asdf.tagged.get_tag(tree)))
+
+        return Harvested(str(path), plan.schema_uri, plan.extract(tree))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections import abc
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, TypedDict
+
+    class PathInfo(TypedDict):
+        node: dict[str, Any]
+        required: bool
+        datatype: str | None
+        archive_catalog: dict[str, Any] | None
+        sdf: dict[str, Any] | None
+
+
+__all__ = ["path_index"]
+
+
+def _path_info(node: dict[str, Any], required: bool) -> PathInfo:
+    """
+    Summarize a node of a super schema for the path index.
+        -> The node is kept without its properties, as those are indexed under their own paths.
+        -> The datatype is the array datatype of a node, or failing that its tag or JSON type.
+    """
+    return {
+        "node": {key: value for key, value in node.items() if key != "properties"},
+        "required": required,
+        "datatype": node.get("datatype", node.get("tag", node.get("type"))),
+        "archive_catalog": node.get("archive_catalog"),
+        "sdf": node.get("sdf"),
+    }
+
+
+def path_index(schema: dict[str, Any], parent_path: str | None = None) -> dict[str, PathInfo]:
+    """
+    Index every node of a super schema by its dotted data path (e.g. "meta.exposure.start_time").
+
+    Parameters
+    ----------
+    schema : dict[str, Any]
+        The super schema to index (see `super_schema`).
+    parent_path : str, optional
+        The data path of the schema, by default the root.
+
+    Returns
+    -------
+    dict[str, PathInfo]
+        data-path: the node, whether it is required by its parent, its datatype,
+        and its archive and SDF annotations. This only contains plain data so it
+        can be serialized (e.g. to JSON).
+    """
+    index = {}
+    properties = schema.get("properties", {}) if isinstance(schema, abc.Mapping) else {}
+    required = schema.get("required", []) if isinstance(schema, abc.Mapping) else []
+
+    for key, node in properties.items():
+        path = f"{parent_path}.{key}" if parent_path else key
+        if isinstance(node, abc.Mapping):
+            index[path] = _path_info(node, key in required)
+            index.update(path_index(node, path))
+
+    return index
@@ -0,0 +1,440 @@
+from __future__ import annotations
+
+from collections import abc
+from re import match
+from typing import TYPE_CHECKING, NamedTuple
+
+import asdf
+import asdf.schema
+import asdf.treeutil
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable
+    from typing import Any
+
+    NodePath = tuple[str | int, ...]
+
+
+__all__ = [
+    "LINT_RULES",
+    "LINT_SKIPS",
+    "LINT_XFAILS",
+    "LintContext",
+    "LintRule",
+    "Violation",
+    "is_known_violation",
+    "lint_rule",
+    "lint_schema",
+]
+
+
+class Violation(NamedTuple):
+    """
+    A single lint violation found in a schema.
+    """
+
+    rule: str
+    uri: str | None
+    path: str
+    message: str
+
+
+class LintContext(NamedTuple):
+    """
+    Information about the schema being linted that is shared by all the rules.
+
+    Parameters
+    ----------
+    uri : str | None
+        The URI of the schema being linted.
+    tagged : bool
+        Whether the schema is the schema for a tag in a manifest.
+    """
+
+    uri: str | None
+    tagged: bool
+
+
+class LintRule:
+    """
+    Base class for the lint rules.
+        -> A new instance is created for each schema that is linted, so rules
+           can keep state between `visit` and `finish`.
+
+    Rules implement ``visit`` which is called once for every mapping in the
+    schema during the shared traversal, and optionally ``finish`` which is
+    called after the traversal is complete. Both yield the violation messages.
+    """
+
+    name: str = ""
+
+    def __init__(self, context: LintContext) -> None:
+        self.context = context
+
+    def visit(self, node: abc.Mapping, path: NodePath) -> Iterable[str]:
+        return ()
+
+    def finish(self) -> Iterable[str]:
+        return ()
+
+
+LINT_RULES: dict[str, type[LintRule]] = {}
+
+# The violations the published schemas are known to have, which are accepted rather than fixed
+#   rule name: the URIs of the schemas the rule is not checked for
+LINT_SKIPS: dict[str, tuple[str, ...]] = {
+    "required": (
+        "asdf://stsci.edu/datamodels/roman/schemas/wfi_mosaic-1.7.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/wfi_mosaic-2.0.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/wfi_mosaic-2.1.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_catalog_common-1.1.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_catalog_common-2.0.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_catalog_common-2.1.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/multiband_source_catalog-1.2.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/multiband_source_catalog-2.0.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/multiband_source_catalog-2.1.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/CCSP/EXAMPLE/example_custom_product-1.1.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/CCSP/EXAMPLE/example_custom_product-2.0.0",
+    ),
+    "metadata_force_required": (
+        "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_common-1.1.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_common-2.0.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_common-2.1.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/CCSP/ccsp_custom_product-1.1.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/CCSP/ccsp_custom_product-2.0.0",
+    ),
+}
+#   rule name: the URIs of the schemas the rule is expected to fail for
+LINT_XFAILS: dict[str, tuple[str, ...]] = {
+    "array_tag": (),
+    "metadata_force_required": (),
+    "varchar_length": (
+        "asdf://stsci.edu/datamodels/roman/schemas/meta/ref_file-2.0.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/meta/program-2.1.0",
+        "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_common-2.1.0",
+    ),
+}
+
+
+def is_known_violation(violation: Violation) -> bool:
+    """
+    Check if a violation is one of the accepted violations of the published schemas
+    (see LINT_SKIPS and LINT_XFAILS).
+    """
+    return violation.uri in LINT_SKIPS.get(violation.rule, ()) or violation.uri in LINT_XFAILS.get(violation.rule, ())
+
+
+def lint_rule(name: str) -> Callable[[type[LintRule]], type[LintRule]]:
+    """
+    Register a lint rule under the given name.
+
+    Parameters
+    ----------
+    name : str
+        The name of the rule.
+
+    Returns
+    -------
+    Callable
+        The class decorator registering the rule.
+    """
+
+    def decorator(cls: type[LintRule]) -> type[LintRule]:
+        if name in LINT_RULES:
+            raise ValueError(f"Lint rule {name} is already registered")
+
+        cls.name = name
+        LINT_RULES[name] = cls
+        return cls
+
+    return decorator
+
+
+def _iter_mappings(schema: Any) -> Generator[tuple[abc.Mapping, NodePath], None, None]:
+    """
+    Traverse the schema once yielding every mapping and its path within the schema.
+    """
+    stack: list[tuple[Any, NodePath]] = [(schema, ())]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, abc.Mapping):
+            yield node, path
+            stack.extend((value, (*path, key)) for key, value in reversed(node.items()))
+        elif isinstance(node, list | tuple):
+            stack.extend((value, (*path, index)) for index, value in reversed(list(enumerate(node))))
+
+
+def _format_path(path: NodePath) -> str:
+    return "/".join(str(item) for item in path) or "/"
+
+
+def lint_schema(
+    schema: dict[str, Any], *, uri: str | None = None, tagged: bool = False, rules: Iterable[str] | None = None
+) -> list[Violation]:
+    """
+    Lint a schema by running all the lint rules during a single traversal of the schema.
+
+    Parameters
+    ----------
+    schema : dict[str, Any]
+        The (unresolved) schema to lint.
+    uri : str, optional
+        The URI of the schema, by default the ``id`` of the schema.
+    tagged : bool, optional
+        Whether the schema is the schema for a tag, by default False.
+    rules : Iterable[str], optional
+        The names of the rules to run, by default all the registered rules.
+
+    Returns
+    -------
+    list[Violation]
+        All the violations found in the schema.
+    """
+    context = LintContext(uri or schema.get("id"), tagged)
+    active = [LINT_RULES[name](context) for name in (LINT_RULES if rules is None else rules)]
+
+    violations = []
+    for node, path in _iter_mappings(schema):
+        for rule in active:
+            violations.extend(Violation(rule.name, context.uri, _format_path(path), msg) for msg in rule.visit(node, path))
+
+    for rule in active:
+        violations.extend(Violation(rule.name, context.uri, "/", msg) for msg in rule.finish())
+
+    return violations
+
+
+@lint_rule("required")
+class _Required(LintRule):
+    """
+    All required properties are present in the schema.
+    """
+
+    def visit(self, node, path):
+        if "required" in node:
+            if node.get("type", "object") != "object":
+                yield "required is only valid for objects"
+
+            if missing := set(node["required"]) - set(node.get("properties", {}).keys()):
+                yield f"required references names that do not exist: {','.join(sorted(missing))}"
+
+
+@lint_rule("exact_datatype")
+class _ExactDatatype(LintRule):
+    """
+    ``datatype`` and ``exact_datatype`` are defined for all arrays.
+    """
+
+    def visit(self, node, path):
+        if (
+            path
+            and isinstance(path[-1], str)
+            and "tag" in node
+            and isinstance(node["tag"], str)
+            and node["tag"].startswith("tag:stsci.edu:asdf/core/ndarray-")
+        ):
+            if "datatype" not in node:
+                yield f"datatype not found for ndarray entry {path[-1]}"
+            if "exact_datatype" not in node:
+                yield f"exact_datatype not found for ndarray entry {path[-1]}"
+            elif node["exact_datatype"] is not True:
+                yield f"exact_datatype not True for ndarray entry {path[-1]}"
+
+
+@lint_rule("array_tag")
+class _ArrayTag(LintRule):
+    """
+    Any schema using ndim, datatype, etc also has an array tag.
+    """
+
+    def visit(self, node, path):
+        if "destination" in node or "byteorder" in node or isinstance(node.get("datatype"), abc.Mapping):
+            # skip archive_catalog entries, sub-dtypes, and table datatypes
+            return
+
+        if any(key in node for key in ("ndim", "datatype", "exact_datatype")):
+            if not node.get("tag", "").startswith("tag:stsci.edu:asdf/core/ndarray-"):
+                yield "array keywords used without an ndarray tag"
+
+
+@lint_rule("ref_loneliness")
+class _RefLoneliness(LintRule):
+    """
+    An object with a $ref contains no other items.
+    """
+
+    def visit(self, node, path):
+        if "$ref" in node and len(node) != 1:
+            yield f"$ref is not alone, also found: {', '.join(key for key in node if key != '$ref')}"
+
+
+@lint_rule("no_default")
+class _NoDefault(LintRule):
+    """
+    The default keyword is not used.
+    """
+
+    def visit(self, node, path):
+        if "default" in node:
+            yield "default keyword is not allowed"
+
+
+@lint_rule("absolute_ref")
+class _AbsoluteRef(LintRule):
+    """
+    All $ref are absolute URIs registered with ASDF.
+    """
+
+    def __init__(self, context):
+        super().__init__(context)
+        self._resources = asdf.get_config().resource_manager
+
+    def visit(self, node, path):
+        if "$ref" in node:
+            ref_uri = node["$ref"].split("#", maxsplit=1)[0]
+            if ref_uri not in self._resources:
+                yield f"$ref {node['$ref']} is not registered with ASDF"
+
+
+@lint_rule("metadata_force_required")
+class _MetadataForceRequired(LintRule):
+    """
+    Properties with nested required lists or archive/sdf metadata are listed as required.
+    """
+
+    metadata = ("archive_catalog", "sdf")
+
+    def visit(self, node, path):
+        if "properties" in node:
+            for prop_name, prop in node["properties"].items():
+                if not isinstance(prop, abc.Mapping):
+                    continue
+
+                for key in ("required", *self.metadata):
+                    if key in prop and prop_name not in node.get("required", ()):
+                        yield f"{key} in {prop_name} requires {prop_name} in the required list"
+
+
+@lint_rule("string_max_length")
+class _StringMaxLength(LintRule):
+    """
+    maxLength is only specified along with a type of string.
+    """
+
+    def visit(self, node, path):
+        if "maxLength" in node and node.get("type") != "string":
+            yield "maxLength is only valid for strings"
+
+
+@lint_rule("varchar_length")
+class _VarcharLength(LintRule):
+    """
+    nvarchar(N) archive datatypes have a matching maxLength: N for strings.
+    """
+
+    @staticmethod
+    def _check_max_length(schema: Any, length: int) -> tuple[bool, list[str]]:
+        found = False
+        messages = []
+
+        def callback(node):
+            nonlocal found
+            if isinstance(node, abc.Mapping) and "enum" in node:
+                if (max_enum_length := max(len(v) for v in node["enum"])) > length:
+                    messages.append(
+                        f"archive_catalog.datatype nvarchar indicates maxLength={length}, "
+                        f"but enum of length {max_enum_length} found."
+                    )
+                found = True
+            elif isinstance(node, abc.Mapping) and "type" in node:
+                if node["type"] == "string":
+                    if "maxLength" not in node:
+                        messages.append(
+                            "archive_catalog.datatype nvarchar indicates maxLength is required, but it is not present"
+                        )
+                    elif node["maxLength"] != length:
+                        messages.append(
+                            f"archive_catalog.datatype nvarchar indicates maxLength={length}, but found {node['maxLength']}."
+                        )
+                    found = True
+
+                # Arrays may have a nvarchar described for archive, but they don't have a maxLength
+                elif node["type"] == "array":
+                    found = True
+
+        asdf.treeutil.walk(schema, callback)
+        return found, messages
+
+    def visit(self, node, path):
+        if "archive_catalog" not in node or not (m := match(r"^nvarchar\(([0-9]+)\)$", node["archive_catalog"]["datatype"])):
+            return
+
+        length = int(m.group(1))
+        if "type" in node:
+            found, messages = self._check_max_length(node, length)
+            yield from messages
+            if not found:
+                yield "archive_catalog.datatype nvarchar indicates maxLength is required, none is found"
+            return
+
+        for sub_schema in node.get("allOf", []) + node.get("anyOf", []):
+            if isinstance(sub_schema, abc.Mapping):
+                ref_uri = sub_schema.get("$ref")
+                found, messages = self._check_max_length(asdf.schema.load_schema(ref_uri) if ref_uri else sub_schema, length)
+                yield from (f"{message} (in {ref_uri})" if ref_uri else message for message in messages)
+                if not found:
+                    yield f"archive_catalog.datatype nvarchar indicates there should be a maxLength in {ref_uri}"
+                return
+
+        yield "archive_catalog.datatype is nvarchar but no maxLength found."
+
+
+@lint_rule("property_order")
+class _PropertyOrder(LintRule):
+    """
+    propertyOrder matches the properties and is only used in tagged schemas.
+    """
+
+    def visit(self, node, path):
+        if "propertyOrder" not in node:
+            return
+
+        if not self.context.tagged:
+            yield "Only schemas associated with a tag may specify propertyOrder"
+            return
+
+        if node.get("type") != "object":
+            yield "propertyOrder is only valid for objects"
+
+        property_names = set(node.get("properties", {}).keys())
+        property_order_names = set(node["propertyOrder"])
+        if property_order_names != property_names:
+            yield (
+                "propertyOrder does not match list of properties:\n\n"
+                f"missing properties: {', '.join(property_order_names - property_names)}\n"
+                f"extra properties: {', '.join(property_names - property_order_names)}"
+            )
+
+
+@lint_rule("flowstyle")
+class _FlowStyle(LintRule):
+    """
+    Tagged schemas have flowStyle: block, untagged schemas do not have flowStyle.
+    """
+
+    def __init__(self, context):
+        super().__init__(context)
+        self._found = False
+
+    def visit(self, node, path):
+        if "flowStyle" not in node:
+            return
+
+        if not self.context.tagged:
+            yield "Only schemas associated with a tag may specify flowStyle"
+        elif node["flowStyle"] == "block":
+            self._found = True
+
+    def finish(self):
+        if self.context.tagged and not self._found:
+            yield "Schemas associated with a tag must specify flowStyle: block"
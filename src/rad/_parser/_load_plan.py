@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from typing import Any
+
+    from ._index import PathInfo
+
+
+__all__ = ["TablePlan", "load_plans"]
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class TablePlan(NamedTuple):
+    """
+    The plan for bulk loading the rows of an archive (destination) table.
+    """
+
+    table: str
+    columns: dict[str, str]
+    sources: dict[str, dict[str, str]]
+
+    def ddl(self, column_type: Callable[[str], str] | None = None) -> str:
+        """
+        The CREATE TABLE statement for the table, with the columns in load order.
+
+        Parameters
+        ----------
+        column_type : Callable[[str], str], optional
+            Maps the archive datatypes to the column types of the target database,
+            e.g. `sqlite_type`. By default the archive (SQL Server) datatypes are used.
+
+        Returns
+        -------
+        str
+            The DDL for the table.
+        """
+        columns = ",\n".join(
+            f"    {_quote(column)} {column_type(datatype) if column_type else datatype}"
+            for column, datatype in self.columns.items()
+        )
+        return f"CREATE TABLE {_quote(self.table)} (\n{columns}\n);"
+
+    def manifest(self) -> dict[str, Any]:
+        """
+        The column-order manifest for COPY-style bulk loads of the table.
+            -> For each datamodel the source data paths are listed in column order,
+               with None for the columns the datamodel does not provide.
+        """
+        return {
+            "columns": list(self.columns),
+            "datatypes": list(self.columns.values()),
+            "sources": {schema_uri: [paths.get(column) for column in self.columns] for schema_uri, paths in self.sources.items()},
+        }
+
+
+def load_plans(path_indexes: Mapping[str, Mapping[str, PathInfo]]) -> dict[str, TablePlan]:
+    """
+    Group the archive_catalog destinations of the schemas by their destination table.
+        -> The columns of a table are ordered by their first appearance, going through
+           the schemas (and their data paths) in order.
+        -> The type of a column is the archive_catalog datatype of its contributors, which
+           must all agree on it.
+
+    Parameters
+    ----------
+    path_indexes : Mapping[str, Mapping[str, PathInfo]]
+        schema-uri: the path index of the schema (see `path_index`).
+
+    Returns
+    -------
+    dict[str, TablePlan]
+        table-name: the columns (and their types) of the table, and which data path
+        of each schema is loaded into each column. The tables are sorted by name.
+
+    Raises
+    ------
+    ValueError
+        If the schemas give a destination different datatypes.
+    """
+    tables: dict[str, TablePlan] = {}
+    conflicts: dict[str, set[str]] = {}
+    for schema_uri, index in path_indexes.items():
+        for path, info in index.items():
+            if (archive_catalog := info["archive_catalog"]) is None:
+                continue
+
+            for dest in archive_catalog["destination"]:
+                table, column = dest.split(".", 1)
+                plan = tables.setdefault(table, TablePlan(table, {}, {}))
+                datatype = plan.columns.setdefault(column, archive_catalog["datatype"])
+                if datatype != archive_catalog["datatype"]:
+                    conflicts.setdefault(dest, {datatype}).add(archive_catalog["datatype"])
+                plan.sources.setdefault(schema_uri, {}).setdefault(column, path)
+
+    if conflicts:
+        raise ValueError(
+            "Conflicting archive_catalog datatypes: "
+            + "; ".join(f"{dest}: {', '.join(sorted(datatypes))}" for dest, datatypes in sorted(conflicts.items()))
+        )
+
+    return dict(sorted(tables.items()))
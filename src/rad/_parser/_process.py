@@ -1,45 +1,56 @@
 from __future__ import annotations
 
+import csv
+import io
 import json
+from collections import abc
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
-import asdf
+import numpy as np
 import yaml
-from semantic_version import Version
 
-from ._archive import archive_entries, archive_schema
+from rad.manifests import get_manifest_index
+from rad.tracing import get_tracer, span, tracing
+from rad.versions import latest_uri
+
+from ._archive import ArchiveRecord, archive_array, archive_entries, archive_records, archive_schema
+from ._destinations import destination_index
+from ._index import path_index
+from ._load_plan import load_plans
+from ._sdf import _sdf_plan
 from ._ssc import asdf_ssc_config
 from ._super_schema import super_schema
 
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
-    from typing import Any, TypeDict
+    from collections.abc import Callable, Generator
+    from typing import Any, NotRequired, TypedDict
+
+    from ._destinations import DestinationIndex
+    from ._index import PathInfo
+    from ._load_plan import TablePlan
+    from ._sdf import SDFPlan
 
-    class ArchiveOutput(TypeDict):
+    class ArchiveOutput(TypedDict):
         super_schemas: dict[Path, dict[str, Any]]
         archive_schemas: dict[str, dict[str, Any]]
         archive_data: list[str]
+        archive_records: NotRequired[list[ArchiveRecord]]
+        path_indexes: NotRequired[dict[str, dict[str, PathInfo]]]
+        load_plans: NotRequired[dict[str, TablePlan]]
+        destination_index: NotRequired[DestinationIndex]
+        sdf_plans: NotRequired[dict[str, SDFPlan]]
+        timings: NotRequired[dict[str, URITiming]]
+        changed_outputs: NotRequired[list[Path]]
 
 
 def _get_latest_uris() -> Generator[str, None, None]:
-    # Find latest datamodels manifest URI
-    latest_version = "0.0.0"
-    for uri in asdf.get_config().resource_manager:
-        if uri.startswith("asdf://stsci.edu/datamodels/roman/manifests/datamodels-"):
-            version = uri.rsplit("-", 1)[-1]
-
-            # First manifest has a bad semantic version "1.0", so convert to "1.0.0"
-            version = "1.0.0" if version == "1.0" else version
-
-            if Version(version) > Version(latest_version):
-                latest_version = version
-
-    datamodels_uri = f"asdf://stsci.edu/datamodels/roman/manifests/datamodels-{latest_version}"
-
-    # Only need to worry about the tagged objects so the manifest will tell us the latest schema URIs
-    for entry in asdf.schema.load_schema(datamodels_uri)["tags"]:
-        yield entry["schema_uri"]
+    # Only need to worry about the tagged objects so the latest manifest will tell us the latest schema URIs
+    yield from get_manifest_index().tags(latest_uri("asdf://stsci.edu/datamodels/roman/manifests/datamodels")).values()
 
     # Now find the latest SSC schema URIs
     with asdf_ssc_config() as config:
@@ -48,32 +59,159 @@ def _get_latest_uris() -> Generator[str, None, None]:
                 yield uri
 
 
-def _process(verbose: bool = False) -> ArchiveOutput:
+class URITiming(NamedTuple):
+    """
+    The wall time (s) taken to process a URI, and the outputs it contributed to
+    ("super_schema" and/or "archive").
+    """
+
+    duration: float
+    products: tuple[str, ...]
+
+
+# The outputs of _process which are only computed when they are asked for
+_EXTRAS = frozenset({"archive_records", "path_indexes", "load_plans", "destination_index", "sdf_plans"})
+
+
+def _process(verbose: bool = False, extras: abc.Set[str] = frozenset()) -> ArchiveOutput:
+    """
+    Process the latest schemas into the super schemas and archive information.
+        -> The super schemas, archive schemas, and archive data are always produced,
+           the other outputs (see _EXTRAS) only when they are listed in extras.
+        -> When tracing is enabled (verbose enables it if it is not already), the
+           time taken by each URI and what was produced for it are returned as the
+           "timings", verbose runs also report them.
+    """
+    if unknown := set(extras) - _EXTRAS:
+        raise ValueError(f"Unknown outputs: {', '.join(sorted(unknown))}")
+
+    datamodel_indexes = "path_indexes" in extras or "sdf_plans" in extras
+    archive_indexes = "load_plans" in extras
+
     super_schemas: dict[Path, dict[str, Any]] = {}
     archive_schemas: dict[str, dict[str, Any]] = {}
     archive_data: list[str] = []
+    records: list[ArchiveRecord] = []
+    path_indexes: dict[str, dict[str, PathInfo]] = {}
+    archive_path_indexes: dict[str, dict[str, PathInfo]] = {}
+    archive_super_schemas: dict[str, dict[str, Any]] = {}
+    timings: dict[str, URITiming] = {}
 
-    for uri in _get_latest_uris():
-        schema = super_schema(uri)
-        if verbose:
-            print(f"    processing {uri}")
-        if "datamodel_name" in schema:
-            if verbose:
-                print("        -> datamodel super_schema")
-            path = Path(uri.replace("asdf://stsci.edu/datamodels/roman/schemas/", "")).with_suffix(".yaml")
-            super_schemas[path] = schema
+    with tracing() if verbose and get_tracer() is None else nullcontext():
+        traced = get_tracer() is not None
+        for uri in _get_latest_uris():
+            products = []
+            with span("process", uri=uri) as event:
+                schema = super_schema(uri)
+                datamodel = "datamodel_name" in schema
+                archive = "archive_meta" in schema
+
+                index = path_index(schema) if (datamodel and datamodel_indexes) or (archive and archive_indexes) else None
+
+                if datamodel:
+                    path = Path(uri.replace("asdf://stsci.edu/datamodels/roman/schemas/", "")).with_suffix(".yaml")
+                    super_schemas[path] = schema
+                    if datamodel_indexes:
+                        path_indexes[uri] = index
+                    products.append("super_schema")
+
+                if archive:
+                    archive_schemas[uri] = archive_schema(schema)
+                    archive_data.extend(archive_entries(schema))
+                    if "archive_records" in extras:
+                        records.extend(archive_records(schema))
+                    if archive_indexes:
+                        archive_path_indexes[uri] = index
+                    archive_super_schemas[uri] = schema
+                    products.append("archive")
 
-        if "archive_meta" in schema:
+                event.set(products=products)
+
+            if traced:
+                timings[uri] = URITiming(event.duration / 1e9, tuple(products))
+
+        output: ArchiveOutput = {
+            "super_schemas": super_schemas,
+            "archive_schemas": archive_schemas,
+            "archive_data": archive_data,
+        }
+        if traced:
+            output["timings"] = timings
+            if verbose:
+                for uri, timing in timings.items():
+                    print(f"    {timing.duration * 1e3:8.1f} ms  {uri}  -> {', '.join(timing.products) or 'nothing'}")
+        if "archive_records" in extras:
+            output["archive_records"] = records
+        if datamodel_indexes:
+            output["path_indexes"] = path_indexes
+        if "load_plans" in extras:
+            output["load_plans"] = load_plans(archive_path_indexes)
+        if "destination_index" in extras:
+            output["destination_index"] = destinations = destination_index(archive_super_schemas)
             if verbose:
-                print("        -> archive information")
-            archive_schemas[uri] = archive_schema(schema)
-            archive_data.extend(archive_entries(schema))
-
-    return {
-        "super_schemas": super_schemas,
-        "archive_schemas": archive_schemas,
-        "archive_data": archive_data,
+                for destination, datatypes in destinations.conflicts.items():
+                    print(f"    datatype conflict for {destination}: {', '.join(sorted(datatypes))}")
+        if "sdf_plans" in extras:
+            output["sdf_plans"] = {uri: _sdf_plan(uri, index) for uri, index in path_indexes.items()}
+
+    return output
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    """
+    Write the content to a file, unless the file already holds exactly that content.
+        -> Unchanged outputs keep their modification times, so make-style steps
+           downstream of the dump do not rebuild them.
+    """
+    if path.is_file() and path.stat().st_size == len(content) and path.read_bytes() == content:
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return True
+
+
+def _yaml_bytes(data: Any) -> bytes:
+    return yaml.dump(data, Dumper=_Dumper, sort_keys=True).encode("utf-8")
+
+
+def _json_bytes(data: Any) -> bytes:
+    return json.dumps(data).encode("utf-8")
+
+
+def _npy_bytes(records: list[ArchiveRecord]) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, archive_array(records), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _csv_bytes(records: list[ArchiveRecord]) -> bytes:
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(ArchiveRecord._fields)
+    writer.writerows(records)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _parquet_bytes(records: list[ArchiveRecord]) -> bytes:
+    """
+    Serialize the structured archive mappings as a Parquet table (pyarrow is optional).
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required to write the archive data in Parquet format. Please install it with `pip install pyarrow`."
+        ) from e
+
+    columns = {
+        name: pa.array([getattr(record, name) for record in records], type=pa.int8() if name == "datatype_code" else pa.string())
+        for name in ArchiveRecord._fields
     }
+    buffer = pa.BufferOutputStream()
+    pq.write_table(pa.table(columns), buffer)
+    return buffer.getvalue().to_pybytes()
 
 
 def dump(
@@ -82,31 +220,81 @@ def dump(
     archive_json: bool = True,
     archive_yaml: bool = True,
     archive_txt: bool = True,
+    archive_npy: bool = False,
+    archive_csv: bool = False,
+    archive_parquet: bool = False,
+    path_index_json: bool = False,
+    load_plan: bool = False,
+    sdf_plan_json: bool = False,
     verbose: bool = False,
 ) -> ArchiveOutput:
-    output = _process(verbose=verbose)
+    """
+    Process the latest schemas and write the selected outputs under base_dir.
+        -> The outputs after archive_txt are opt-in, and what they are built from
+           is only computed when they are selected.
+        -> Each output is serialized in memory first and only written if its
+           bytes differ from the existing file, the outputs which were
+           actually written are listed in the "changed_outputs" of the result.
+    """
+    extras = set()
+    if archive_npy or archive_csv or archive_parquet:
+        extras.add("archive_records")
+    if path_index_json:
+        extras.add("path_indexes")
+    if load_plan:
+        extras.add("load_plans")
+    if sdf_plan_json:
+        extras.add("sdf_plans")
+
+    output = _process(verbose=verbose, extras=extras)
 
     base_dir.mkdir(parents=True, exist_ok=True)
 
+    # output path: a function serializing the content of the output
+    outputs: dict[Path, Callable[[], bytes]] = {}
+
     if super_schema:
-        super_dir = base_dir / "super_schemas"
         for path, schema in output["super_schemas"].items():
-            save_path = super_dir / path
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with save_path.open("w") as f:
-                yaml.dump(schema, f, sort_keys=True)
+            outputs[base_dir / "super_schemas" / path] = partial(_yaml_bytes, schema)
 
     if archive_json:
-        with (base_dir / "archive_schemas.json").open("w") as f:
-            json.dump(output["archive_schemas"], f)
+        outputs[base_dir / "archive_schemas.json"] = partial(_json_bytes, output["archive_schemas"])
 
     if archive_yaml:
-        with (base_dir / "archive_schemas.yaml").open("w") as f:
-            yaml.dump(output["archive_schemas"], f, sort_keys=True)
+        outputs[base_dir / "archive_schemas.yaml"] = partial(_yaml_bytes, output["archive_schemas"])
 
     if archive_txt:
-        with (base_dir / "archive_data.txt").open("w") as f:
-            f.write("\n".join(output["archive_data"]))
+        outputs[base_dir / "archive_data.txt"] = partial(str.encode, "\n".join(output["archive_data"]))
+
+    if archive_npy:
+        outputs[base_dir / "archive_data.npy"] = partial(_npy_bytes, output["archive_records"])
+
+    if archive_csv:
+        outputs[base_dir / "archive_data.csv"] = partial(_csv_bytes, output["archive_records"])
+
+    if archive_parquet:
+        outputs[base_dir / "archive_data.parquet"] = partial(_parquet_bytes, output["archive_records"])
+
+    if path_index_json:
+        outputs[base_dir / "path_indexes.json"] = partial(_json_bytes, output["path_indexes"])
+
+    if load_plan:
+        ddl = "\n\n".join(plan.ddl() for plan in output["load_plans"].values()) + "\n"
+        outputs[base_dir / "load_plan.sql"] = partial(str.encode, ddl)
+        outputs[base_dir / "load_plan.json"] = partial(
+            _json_bytes, {table: plan.manifest() for table, plan in output["load_plans"].items()}
+        )
+
+    if sdf_plan_json:
+        outputs[base_dir / "sdf_plans.json"] = partial(
+            _json_bytes, {uri: plan.to_dict() for uri, plan in output["sdf_plans"].items()}
+        )
+
+    output["changed_outputs"] = [path for path, content in outputs.items() if _write_if_changed(path, content())]
+
+    if verbose:
+        print(f"{len(output['changed_outputs'])} of {len(outputs)} outputs changed")
+        for path in output["changed_outputs"]:
+            print(f"    {path.relative_to(base_dir)}")
 
     return output
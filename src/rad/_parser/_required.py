@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections import abc
+from functools import cache
+from typing import TYPE_CHECKING
+
+from rad.manifests import get_manifest_index
+from rad.versions import latest_uri
+
+from ._index import path_index
+from ._super_schema import super_schema
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ._index import PathInfo
+
+
+__all__ = ["missing_paths", "required_path_sets", "required_paths"]
+
+_DATAMODELS_MANIFEST = "asdf://stsci.edu/datamodels/roman/manifests/datamodels"
+
+
+def _required_paths(index: abc.Mapping[str, PathInfo]) -> frozenset[str]:
+    """
+    Find the data paths which must be present, i.e. those required by their
+    parent where the parent itself must be present.
+    """
+    required = set()
+    for path, info in index.items():
+        parent = path.rpartition(".")[0]
+        if info["required"] and (not parent or parent in required):
+            required.add(path)
+
+    return frozenset(required)
+
+
+@cache
+def required_paths(tag: str) -> frozenset[str]:
+    """
+    Get the dotted data paths which must be present in the tree of a tagged object.
+        -> The required lists are resolved through all the references and allOf
+           combiners of the schema (see `super_schema`).
+
+    Parameters
+    ----------
+    tag : str
+        The tag URI.
+
+    Returns
+    -------
+    frozenset[str]
+        The required data paths, e.g. "meta.exposure.start_time".
+    """
+    return _required_paths(path_index(super_schema(get_manifest_index().schema_uri(tag))))
+
+
+def required_path_sets(manifest_uri: str | None = None) -> dict[str, frozenset[str]]:
+    """
+    Get the required data paths for every tag of a manifest.
+
+    Parameters
+    ----------
+    manifest_uri : str, optional
+        The manifest, by default the latest datamodels manifest.
+
+    Returns
+    -------
+    dict[str, frozenset[str]]
+        tag-uri: the required data paths (see `required_paths`).
+    """
+    return {tag: required_paths(tag) for tag in get_manifest_index().tags(manifest_uri or latest_uri(_DATAMODELS_MANIFEST))}
+
+
+def _flat_paths(tree: abc.Mapping[str, Any], parent_path: str | None = None) -> set[str]:
+    paths = set()
+    for key, value in tree.items():
+        path = f"{parent_path}.{key}" if parent_path else str(key)
+        paths.add(path)
+        if isinstance(value, abc.Mapping):
+            paths |= _flat_paths(value, path)
+
+    return paths
+
+
+def missing_paths(tag: str, tree: abc.Mapping[str, Any]) -> set[str]:
+    """
+    Quickly find the required data paths which are missing from a tree, before running the full validation.
+
+    Parameters
+    ----------
+    tag : str
+        The tag URI of the tree.
+    tree : Mapping[str, Any]
+        The tree of the tagged object, as read by ASDF.
+
+    Returns
+    -------
+    set[str]
+        The missing data paths, the tree cannot be valid unless this is empty.
+    """
+    return required_paths(tag) - _flat_paths(tree)
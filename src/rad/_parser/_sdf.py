@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from ._index import path_index
+from ._super_schema import super_schema
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from typing import Any
+
+    from ._index import PathInfo
+
+
+__all__ = ["SDFPlan", "SourceField", "sdf_plan"]
+
+# The special_processing flag for the fields which must be present in a Level 1 file
+_VALUE_REQUIRED = "VALUE_REQUIRED"
+
+
+class SourceField(NamedTuple):
+    """
+    A field of a datamodel which is filled when a Level 1 file is created.
+    """
+
+    path: str
+    origin: str
+    function: str | None
+    required: bool
+
+
+class SDFPlan(NamedTuple):
+    """
+    The plan for filling the fields of a datamodel from their SDF sources.
+    """
+
+    schema_uri: str
+    fields: tuple[SourceField, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        The plan as plain data, so it can be serialized (e.g. to JSON).
+        """
+        return {"schema_uri": self.schema_uri, "fields": [field._asdict() for field in self.fields]}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SDFPlan:
+        """
+        Rebuild a plan from its plain data (see `to_dict`).
+        """
+        return cls(data["schema_uri"], tuple(SourceField(**field) for field in data["fields"]))
+
+    def apply(self, records: Mapping[str, Any], functions: Mapping[str, Callable[[Any], Any]] | None = None) -> dict[str, Any]:
+        """
+        Fill the fields of a batch of Level 1 files from their source values.
+            -> Each source column is looked up (and transformed) once for the whole batch,
+               so the functions should operate on whole columns (e.g. NumPy arrays).
+
+        Parameters
+        ----------
+        records : Mapping[str, Any]
+            origin: the column of source values, one for each file in the batch.
+        functions : Mapping[str, Callable[[Any], Any]], optional
+            function-name: the transform named by the SDF source of a field.
+
+        Returns
+        -------
+        dict[str, Any]
+            data-path: the column of values for the field, the optional fields whose
+            origin is not in the records are left out.
+
+        Raises
+        ------
+        ValueError
+            If the origin of a required field is not in the records, or the function
+            of a field is not given.
+        """
+        functions = functions or {}
+        if missing := [field.path for field in self.fields if field.required and field.origin not in records]:
+            raise ValueError(f"The records are missing the sources of the required fields: {', '.join(missing)}")
+
+        if unknown := sorted({field.function for field in self.fields if field.function and field.function not in functions}):
+            raise ValueError(f"The SDF functions are not given: {', '.join(unknown)}")
+
+        values = {}
+        for field in self.fields:
+            if field.origin in records:
+                column = records[field.origin]
+                values[field.path] = functions[field.function](column) if field.function else column
+
+        return values
+
+
+def _sdf_plan(schema_uri: str, index: Mapping[str, PathInfo]) -> SDFPlan:
+    """
+    Compile the SDF plan of a datamodel from its path index.
+    """
+    fields = []
+    for path, info in index.items():
+        if (sdf := info["sdf"]) is not None:
+            source = sdf["source"]
+            fields.append(
+                SourceField(path, source["origin"], source.get("function"), sdf["special_processing"] == _VALUE_REQUIRED)
+            )
+
+    return SDFPlan(schema_uri, tuple(fields))
+
+
+@cache
+def sdf_plan(schema_uri: str) -> SDFPlan:
+    """
+    Compile the plan for filling the fields of a datamodel when a Level 1 file is created.
+
+    Parameters
+    ----------
+    schema_uri : str
+        The URI of the datamodel's schema.
+
+    Returns
+    -------
+    SDFPlan
+        The fields with an sdf annotation, by their full data path, with the origin
+        and (optional) transform of their value and whether the value is required.
+    """
+    return _sdf_plan(schema_uri, path_index(super_schema(schema_uri)))
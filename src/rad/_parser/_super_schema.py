@@ -10,6 +10,8 @@ import asdf.schema
 import asdf.treeutil
 from asdf.generic_io import resolve_uri
 
+from rad.tracing import span
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -32,7 +34,8 @@ def _get_schema_from_uri(schema_uri: str) -> dict[str, Any]:
         The loaded schema as a dictionary.
     """
     # See Issue https://github.com/asdf-format/asdf/issues/1977
-    schema = asdf.schema.load_schema(schema_uri, resolve_references=False)
+    with span("super_schema.load_schema", uri=schema_uri):
+        schema = asdf.schema.load_schema(schema_uri, resolve_references=False)
 
     def resolve_refs(node, json_id):
         if json_id is None:
@@ -51,7 +54,8 @@ def _get_schema_from_uri(schema_uri: str) -> dict[str, Any]:
 
         return node
 
-    return asdf.treeutil.walk_and_modify(schema, resolve_refs)
+    with span("super_schema.resolve_refs", uri=schema_uri):
+        return asdf.treeutil.walk_and_modify(schema, resolve_refs)
 
 
 def _deep_merge(target: dict[str, Any], source: dict[str, Any]) -> dict[str, Any]:
@@ -62,7 +66,8 @@ def _deep_merge(target: dict[str, Any], source: dict[str, Any]) -> dict[str, Any
                     raise ValueError(f"Cannot merge non-mapping value {value} into {target[key]}")
                 _deep_merge(target[key], value)
             elif isinstance(target[key], list) and isinstance(value, list) and key == "required":
-                target[key] = list(set(target[key]) | set(value))
+                # Keep the order of the schemas so the super schema does not depend on the hash seed
+                target[key] = list(dict.fromkeys([*target[key], *value]))
             elif key in ("title", "description"):
                 target[key] += f"\n- {value}"
             elif target[key] != value:
@@ -108,20 +113,21 @@ def super_schema(schema_uri: str) -> dict[str, Any]:
                 del node["allOf"]
                 return node
 
-            target = copy.deepcopy(node["allOf"][0])
-            for item in node["allOf"][1:]:
-                if isinstance(item, abc.Mapping):
-                    item = copy.deepcopy(item)
-                    if "$schema" in item:
-                        del item["$schema"]
-                    if "id" in item:
-                        del item["id"]
-                    target = _deep_merge(target, item)
-                else:
-                    raise ValueError(f"Expected a mapping in allOf, got {item}")
-
-            del node["allOf"]
-            return _deep_merge(node, target)
+            with span("super_schema.merge_all_of", uri=schema_uri, items=len(node["allOf"])):
+                target = copy.deepcopy(node["allOf"][0])
+                for item in node["allOf"][1:]:
+                    if isinstance(item, abc.Mapping):
+                        item = copy.deepcopy(item)
+                        if "$schema" in item:
+                            del item["$schema"]
+                        if "id" in item:
+                            del item["id"]
+                        target = _deep_merge(target, item)
+                    else:
+                        raise ValueError(f"Expected a mapping in allOf, got {item}")
+
+                del node["allOf"]
+                return _deep_merge(node, target)
         return node
 
     id_ = schema.get("id")
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import re
+from collections import abc
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
+
+import asdf.schema
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+
+__all__ = ["ColumnSpec", "TableDtype", "table_dtype"]
+
+# The ASDF ndarray datatypes whose names NumPy does not accept
+_NUMPY_DATATYPES = {"bool8": "bool"}
+
+# Column name patterns which only match a single name, e.g. "^label$"
+_LITERAL_PATTERN = re.compile(r"^\^(\w+)\$$")
+
+
+class ColumnSpec(NamedTuple):
+    """
+    The specification of the column(s) of a catalog table matching a name pattern.
+    """
+
+    pattern: str
+    datatype: str
+    unit: str | None
+    description: str | None
+
+    @property
+    def name(self) -> str | None:
+        """
+        The column name, if the pattern only matches a single name.
+        """
+        return match.group(1) if (match := _LITERAL_PATTERN.match(self.pattern)) else None
+
+
+class TableDtype:
+    """
+    The column specifications of a catalog table compiled for building NumPy structured arrays.
+        -> The columns with a fixed name are looked up directly, only the other
+           names are matched against the (compiled) column name patterns.
+
+    Parameters
+    ----------
+    schema_uri : str
+        The URI of the table schema.
+    columns : tuple[ColumnSpec, ...]
+        The column specifications, in the order of the schema.
+    """
+
+    def __init__(self, schema_uri: str, columns: tuple[ColumnSpec, ...]) -> None:
+        self.schema_uri = schema_uri
+        self.columns = columns
+        self._literals = {column.name: column for column in columns if column.name is not None}
+        self._patterns = tuple((re.compile(column.pattern), column) for column in columns if column.name is None)
+
+    def column(self, name: str) -> ColumnSpec:
+        """
+        Find the specification of a column by its name.
+
+        Parameters
+        ----------
+        name : str
+            The column name, e.g. "label" or "kron_f158_flux".
+
+        Returns
+        -------
+        ColumnSpec
+            The specification whose pattern matches the name.
+
+        Raises
+        ------
+        ValueError
+            If the table does not allow a column with the name.
+        """
+        if (column := self._literals.get(name)) is not None:
+            return column
+
+        for pattern, column in self._patterns:
+            if pattern.search(name):
+                return column
+
+        raise ValueError(f"The table {self.schema_uri} has no column matching {name}")
+
+    def dtype(self, names: Iterable[str] | None = None) -> np.dtype:
+        """
+        Build the structured dtype for the columns of a table.
+
+        Parameters
+        ----------
+        names : Iterable[str], optional
+            The column names, by default the columns with a fixed name
+            (i.e. those which are not named by a pattern).
+
+        Returns
+        -------
+        np.dtype
+            The structured dtype, with the fields in the order of the names.
+        """
+        if names is None:
+            names = self._literals
+
+        datatypes = [(name, self.column(name).datatype) for name in names]
+        return np.dtype([(name, _NUMPY_DATATYPES.get(datatype, datatype)) for name, datatype in datatypes])
+
+    def units(self, names: Iterable[str] | None = None) -> dict[str, str | None]:
+        """
+        Get the units of the columns of a table.
+
+        Parameters
+        ----------
+        names : Iterable[str], optional
+            The column names, by default the columns with a fixed name.
+
+        Returns
+        -------
+        dict[str, str | None]
+            column-name: the unit of the column.
+        """
+        if names is None:
+            names = self._literals
+
+        return {name: self.column(name).unit for name in names}
+
+    def empty(self, size: int, names: Iterable[str] | None = None) -> np.ndarray:
+        """
+        Preallocate a table, to be filled column by column.
+
+        Parameters
+        ----------
+        size : int
+            The number of rows.
+        names : Iterable[str], optional
+            The column names, by default the columns with a fixed name.
+
+        Returns
+        -------
+        np.ndarray
+            The (uninitialized) structured array.
+        """
+        return np.empty(size, dtype=self.dtype(names))
+
+
+def _find(schema: Any, key: str) -> Any:
+    """
+    Find the first value of a key in a schema, searching depth first.
+    """
+    if isinstance(schema, abc.Mapping):
+        if key in schema:
+            return schema[key]
+        values = schema.values()
+    elif isinstance(schema, list):
+        values = schema
+    else:
+        return None
+
+    for value in values:
+        if (found := _find(value, key)) is not None:
+            return found
+
+    return None
+
+
+def _column_spec(schema: dict[str, Any]) -> ColumnSpec | None:
+    """
+    Compile the specification of a column from its subschema.
+        -> The subschemas are of the form `not: {items: {not: {allOf: [<definition>, <name pattern>]}}}`
+           meaning that any column matching the name pattern must match the definition.
+    """
+    definition: dict[str, Any] = {}
+    pattern = None
+    for subschema in _find(schema, "allOf") or ():
+        if (name := subschema.get("properties", {}).get("name")) is not None and "pattern" in name:
+            pattern = name["pattern"]
+        else:
+            definition.update(subschema)
+
+    datatype = _find(definition.get("properties", {}).get("data", {}), "datatype")
+    if pattern is None or datatype is None:
+        return None
+
+    return ColumnSpec(
+        pattern,
+        datatype["enum"][0] if isinstance(datatype, abc.Mapping) else datatype,
+        definition.get("unit"),
+        definition.get("description"),
+    )
+
+
+@cache
+def table_dtype(schema_uri: str) -> TableDtype:
+    """
+    Compile the column specifications of a catalog table schema, e.g. prompt_catalog_table.
+
+    Parameters
+    ----------
+    schema_uri : str
+        The URI of the table schema.
+
+    Returns
+    -------
+    TableDtype
+        The datatype, unit, and description of the columns, by their name pattern.
+
+    Raises
+    ------
+    ValueError
+        If the schema specifies no columns, e.g. it only holds column definitions
+        (source_catalog_columns) for the table schemas to reference.
+    """
+    schema = asdf.schema.load_schema(schema_uri, resolve_references=True)
+
+    columns = []
+    for subschema in schema.get("properties", {}).get("columns", {}).get("allOf", []):
+        if (column := _column_spec(subschema)) is not None:
+            columns.append(column)
+
+    if not columns:
+        raise ValueError(f"{schema_uri} is not a catalog table schema, it specifies no columns")
+
+    return TableDtype(schema_uri, tuple(columns))
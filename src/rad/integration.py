@@ -1,9 +1,48 @@
 import importlib.resources as importlib_resources
+import os
+import re
+from collections.abc import Mapping
 
+import yaml
 from asdf.resource import DirectoryResourceMapping
 
+from .keywords import ANNOTATION_KEYWORDS, LITERAL_KEYWORDS, NAMED_SUBSCHEMA_KEYWORDS
+from .tracing import span
+from .versions import VersionIndex
 
-class RadDirectoryResourceMapping(DirectoryResourceMapping):
+_SCHEMA_URI_PREFIX = "asdf://stsci.edu/datamodels/roman/schemas/"
+_MANIFEST_URI_PREFIX = "asdf://stsci.edu/datamodels/roman/manifests/"
+_SCHEMA_URI_PATTERN = re.compile(rb"asdf://stsci\.edu/datamodels/roman/schemas/[\w./-]*\w")
+_LATEST_ONLY_ENV = "RAD_LATEST_ONLY"
+_LATEST_FALLBACK_ENV = "RAD_LATEST_FALLBACK"
+# The precomputed closure of the latest manifests, relative to the resources root
+_LATEST_CLOSURE = "latest_closure.txt"
+_LATEST_FAMILIES = ("datamodels", "static")
+_STRIPPED_ENV = "RAD_STRIP_ANNOTATIONS"
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _env_flag(name):
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+class TracedDirectoryResourceMapping(DirectoryResourceMapping):
+    """
+    A DirectoryResourceMapping which records the time and bytes of each resource
+    read when tracing is enabled (see `rad.tracing`).
+    """
+
+    def __getitem__(self, uri):
+        with span("integration.read_resource", uri=uri) as event:
+            content = super().__getitem__(uri)
+            event.bytes = len(content)
+
+        return content
+
+
+class RadDirectoryResourceMapping(TracedDirectoryResourceMapping):
     """
     A Custom DirectoryResourceMapping that avoids the SSC schemas.
 
@@ -20,12 +59,306 @@ class RadDirectoryResourceMapping(DirectoryResourceMapping):
                 yield file, components
 
 
-def get_resource_mappings():
+def _latest_manifest(root, family):
+    # The files are indexed directly, as this is called while ASDF is loading its resources
+    manifests = VersionIndex(f"{_MANIFEST_URI_PREFIX}{file.stem}" for file in (root / "manifests").iterdir())
+    return manifests.latest(f"{_MANIFEST_URI_PREFIX}{family}")
+
+
+def _resource_path(root, uri):
+    """
+    Get the path of the file for a RAD URI (None for the SSC schemas and non-RAD URIs).
+    """
+    for prefix, directory in ((_SCHEMA_URI_PREFIX, "schemas"), (_MANIFEST_URI_PREFIX, "manifests")):
+        if uri.startswith(prefix):
+            name = uri.removeprefix(prefix)
+            if "SSC" not in name:
+                return root.joinpath(directory, *f"{name}.yaml".split("/"))
+
+    return None
+
+
+def latest_closure(root, families=_LATEST_FAMILIES):
+    """
+    Find the URIs of the resources reachable from the latest manifests, by
+    following the schema URIs referenced in the content of each resource.
+
+    Parameters
+    ----------
+    root : importlib.resources.abc.Traversable
+        The root of the RAD resources, containing the schemas and manifests directories.
+    families : tuple of str
+        The manifests whose latest versions the closure starts from.
+
+    Returns
+    -------
+    list of str
+        The URIs, sorted.
+    """
+    found = set()
+    pending = [_latest_manifest(root, family) for family in families]
+    while pending:
+        uri = pending.pop()
+        if uri in found or (file := _resource_path(root, uri)) is None or not file.is_file():
+            continue
+
+        found.add(uri)
+        pending.extend(match.decode("ascii") for match in _SCHEMA_URI_PATTERN.findall(file.read_bytes()))
+
+    return sorted(found)
+
+
+class LatestResourceMapping(Mapping):
+    """
+    A resource mapping which only registers the manifests and schemas reachable
+    from the latest datamodels and static manifests.
+
+    Note:
+        For the default manifests, the closure is read from the list precomputed by
+        scripts/latest_closure.py and shipped with the resources, so no resource is
+        read until ASDF looks it up. Otherwise, it is found by reading the resources
+        (see `latest_closure`). Either way this relies on the file paths matching the
+        URIs, so no index of the whole directory is built. ASDF only serves the URIs a
+        mapping registers, so the other (historical) resources are only available
+        through the `fallback` mapping. Like RadDirectoryResourceMapping, the SSC
+        schemas are avoided.
+
+    Parameters
+    ----------
+    root : importlib.resources.abc.Traversable
+        The root of the RAD resources, containing the schemas and manifests directories.
+    families : tuple of str
+        The manifests whose latest versions the closure starts from.
+    """
+
+    def __init__(self, root, families=_LATEST_FAMILIES):
+        self._root = root
+
+        if tuple(families) == _LATEST_FAMILIES and (index := root / _LATEST_CLOSURE).is_file():
+            uris = [line for line in index.read_text().splitlines() if line and not line.startswith("#")]
+        else:
+            uris = latest_closure(root, families)
+
+        self._uri_to_file = {uri: _resource_path(root, uri) for uri in uris}
+
+    def _walk(self, directory, prefix):
+        """
+        Walk the RAD files of a directory, yielding their URIs and files.
+        """
+        pending = [(self._root / directory, prefix)]
+        while pending:
+            path, path_prefix = pending.pop()
+            for child in sorted(path.iterdir(), key=lambda child: child.name):
+                if child.is_dir():
+                    if child.name != "SSC":
+                        pending.append((child, f"{path_prefix}{child.name}/"))
+                elif child.name.endswith(".yaml"):
+                    yield f"{path_prefix}{child.name.removesuffix('.yaml')}", child
+
+    def fallback(self):
+        """
+        Get the mapping of all the other RAD resources, which are not reachable from the latest manifests.
+
+        Returns
+        -------
+        FallbackResourceMapping
+        """
+        return FallbackResourceMapping(self)
+
+    def _read(self, uri, file):
+        with span("integration.read_resource", uri=uri) as event:
+            content = file.read_bytes()
+            event.bytes = len(content)
+
+        return content
+
+    def __getitem__(self, uri):
+        return self._read(uri, self._uri_to_file[uri])
+
+    def __contains__(self, uri):
+        return uri in self._uri_to_file
+
+    def __iter__(self):
+        yield from self._uri_to_file
+
+    def __len__(self):
+        return len(self._uri_to_file)
+
+    def __repr__(self):
+        return f"LatestResourceMapping({self._root!r})"
+
+
+class FallbackResourceMapping(Mapping):
+    """
+    A resource mapping which registers the RAD resources a `LatestResourceMapping`
+    does not, so the historical schemas and manifests stay available through ASDF.
+
+    Note:
+        ASDF lists the URIs of every mapping when it builds its resource manager, so
+        the fallback has to register its URIs rather than look them up on demand.
+        The directories are only listed when the mapping is first iterated (or a URI
+        looked up), and a file is only read when its URI is looked up.
+
+    Parameters
+    ----------
+    latest : LatestResourceMapping
+        The mapping of the latest resources.
+    """
+
+    def __init__(self, latest):
+        self._latest = latest
+        self._uri_to_file = None
+
+    @property
+    def _files(self):
+        if self._uri_to_file is None:
+            with span("integration.list_fallback"):
+                self._uri_to_file = {
+                    uri: file
+                    for directory, prefix in (("schemas", _SCHEMA_URI_PREFIX), ("manifests", _MANIFEST_URI_PREFIX))
+                    for uri, file in self._latest._walk(directory, prefix)
+                    if uri not in self._latest
+                }
+
+        return self._uri_to_file
+
+    def __getitem__(self, uri):
+        return self._latest._read(uri, self._files[uri])
+
+    def __contains__(self, uri):
+        return uri in self._files
+
+    def __iter__(self):
+        yield from self._files
+
+    def __len__(self):
+        return len(self._files)
+
+    def __repr__(self):
+        return f"FallbackResourceMapping({self._latest!r})"
+
+
+def strip_annotations(schema, keywords=ANNOTATION_KEYWORDS):
+    """
+    Remove the annotation keywords (sdf, archive_catalog, title, and description)
+    from a schema, leaving only what is used for validation.
+
+    Note:
+        Properties (and definitions) with the same name as one of these keywords
+        are kept, as are the values of enum, const, default, and examples.
+
+    Parameters
+    ----------
+    schema : dict
+        The schema to strip, it is not modified.
+    keywords : collections.abc.Set of str, optional
+        The keywords to remove, by default the annotation keywords.
+
+    Returns
+    -------
+    dict
+        The stripped schema.
+    """
+    if isinstance(schema, dict):
+        stripped = {}
+        for key, value in schema.items():
+            if key in keywords:
+                continue
+            if key in LITERAL_KEYWORDS:
+                stripped[key] = value
+            elif key in NAMED_SUBSCHEMA_KEYWORDS and isinstance(value, dict):
+                stripped[key] = {name: strip_annotations(subschema, keywords) for name, subschema in value.items()}
+            else:
+                stripped[key] = strip_annotations(value, keywords)
+
+        return stripped
+
+    if isinstance(schema, list):
+        return [strip_annotations(item, keywords) for item in schema]
+
+    return schema
+
+
+class StrippedResourceMapping(Mapping):
+    """
+    A resource mapping which serves the validation-only view of the RAD schemas,
+    with the annotation keywords removed (see `strip_annotations`).
+
+    Note:
+        The schemas are stripped when they are first read and the result is kept,
+        so that ASDF parses and walks the smaller schemas. The manifests are served
+        unchanged, and the full documentation view of every resource stays
+        available from the wrapped mapping as ``full``.
+
+    Parameters
+    ----------
+    full : collections.abc.Mapping
+        The resource mapping for the full schemas.
+    """
+
+    def __init__(self, full):
+        self.full = full
+        self._stripped = {}
+
+    def __getitem__(self, uri):
+        if not uri.startswith(_SCHEMA_URI_PREFIX):
+            return self.full[uri]
+
+        if uri not in self._stripped:
+            content = self.full[uri]
+            with span("integration.strip_annotations", uri=uri) as event:
+                schema = strip_annotations(yaml.load(content, Loader=_Loader))  # noqa: S506
+                self._stripped[uri] = b"%YAML 1.1\n---\n" + yaml.dump(
+                    schema, Dumper=_Dumper, sort_keys=False, width=1000, encoding="utf-8"
+                )
+                # Like the other spans, bytes counts what was read, the reduction is recorded separately
+                event.bytes = len(content)
+                event.set(saved=len(content) - len(self._stripped[uri]))
+
+        return self._stripped[uri]
+
+    def __contains__(self, uri):
+        return uri in self.full
+
+    def __iter__(self):
+        yield from self.full
+
+    def __len__(self):
+        return len(self.full)
+
+    def __repr__(self):
+        return f"StrippedResourceMapping({self.full!r})"
+
+
+def get_resource_mappings(latest_only=None, stripped=None, fallback=None):
     """
     Get the resource mapping instances for the datamodel schemas
     and manifests.  This method is registered with the
     asdf.resource_mappings entry point.
 
+    Parameters
+    ----------
+    latest_only : bool, optional
+        Only register the resources reachable from the latest manifests (see
+        `LatestResourceMapping`). By default, this is enabled by setting the
+        ``RAD_LATEST_ONLY`` environment variable to ``1``.
+
+        This is a trade-off: ASDF registers about a third of the RAD resources
+        and none of them are read (or their directories listed) when the mappings
+        are built, but the schemas and manifests of older versions are not
+        available, so files written against them cannot be validated.
+    stripped : bool, optional
+        Serve the validation-only view of the schemas, without their annotations
+        (see `StrippedResourceMapping`). By default, this is enabled by setting the
+        ``RAD_STRIP_ANNOTATIONS`` environment variable to ``1``.
+    fallback : bool, optional
+        With latest_only, also register the other RAD resources after the latest ones
+        (see `FallbackResourceMapping`), so that files written against older manifests
+        can still be read. As ASDF registers every URI of its mappings, this gives up
+        the smaller index (and lists the resource directories when the mappings are
+        built); only the order of the lookups changes. By default, this is enabled by
+        setting the ``RAD_LATEST_FALLBACK`` environment variable to ``1``.
+
     Returns
     -------
     list of collections.abc.Mapping
@@ -34,7 +367,26 @@ def get_resource_mappings():
 
     resources_root = importlib_resources.files(resources)
 
-    return [
-        RadDirectoryResourceMapping(resources_root / "schemas", "asdf://stsci.edu/datamodels/roman/schemas/", recursive=True),
-        DirectoryResourceMapping(resources_root / "manifests", "asdf://stsci.edu/datamodels/roman/manifests/"),
-    ]
+    if latest_only is None:
+        latest_only = _env_flag(_LATEST_ONLY_ENV)
+    if stripped is None:
+        stripped = _env_flag(_STRIPPED_ENV)
+    if fallback is None:
+        fallback = _env_flag(_LATEST_FALLBACK_ENV)
+
+    with span("integration.get_resource_mappings", latest_only=latest_only, stripped=stripped):
+        if latest_only:
+            latest = LatestResourceMapping(resources_root)
+            mappings = [latest, latest.fallback()] if fallback else [latest]
+        else:
+            mappings = [
+                RadDirectoryResourceMapping(
+                    resources_root / "schemas", "asdf://stsci.edu/datamodels/roman/schemas/", recursive=True
+                ),
+                TracedDirectoryResourceMapping(resources_root / "manifests", "asdf://stsci.edu/datamodels/roman/manifests/"),
+            ]
+
+        if stripped:
+            return [StrippedResourceMapping(mapping) for mapping in mappings]
+
+        return mappings
@@ -0,0 +1,15 @@
+"""
+Groups of JSON schema keywords shared by the tools which rewrite the RAD schemas.
+"""
+
+__all__ = ["ANNOTATION_KEYWORDS", "LITERAL_KEYWORDS", "NAMED_SUBSCHEMA_KEYWORDS", "SERIALIZATION_KEYWORDS"]
+
+# Keywords which only annotate the schemas, they are not used by ASDF validation
+ANNOTATION_KEYWORDS = frozenset({"sdf", "archive_catalog", "title", "description"})
+# Keywords whose values are mappings of names to subschemas
+NAMED_SUBSCHEMA_KEYWORDS = frozenset({"properties", "patternProperties", "definitions", "dependencies"})
+# Keywords whose values are data rather than subschemas
+LITERAL_KEYWORDS = frozenset({"enum", "const", "default", "examples"})
+# Keywords ASDF uses to store serialization hints on tagged nodes, these are
+# not checks and cannot be applied to the untagged nodes of a subtree
+SERIALIZATION_KEYWORDS = frozenset({"flowStyle", "propertyOrder", "style"})
@@ -0,0 +1,195 @@
+"""
+An index of the RAD manifests across all their versions.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING
+
+import asdf
+import yaml
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+__all__ = ["ManifestIndex", "get_manifest_index"]
+
+_MANIFEST_URI_PREFIX = "asdf://stsci.edu/datamodels/roman/manifests/"
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class ManifestIndex:
+    """
+    The tags of every version of the RAD manifests (datamodels-* and static-*),
+    indexed for constant time lookups between the tag URIs, schema URIs, and
+    datamodel names.
+
+    Note:
+        The manifests are only read when the index is first used, and the
+        datamodel name of a schema is only read when it is first looked up.
+
+    Parameters
+    ----------
+    resource_manager : Mapping[str, bytes], optional
+        The resources to read the manifests (and schemas) from, by default the
+        ASDF resource manager.
+    """
+
+    def __init__(self, resource_manager: Mapping[str, bytes] | None = None) -> None:
+        self._resource_manager = resource_manager
+        self._lock = threading.Lock()
+        self._manifests: dict[str, dict[str, str]] | None = None
+        self._tag_schemas: dict[str, str] = {}
+        self._schema_tags: dict[str, tuple[str, ...]] = {}
+        self._tag_manifests: dict[str, tuple[str, ...]] = {}
+        self._datamodel_names: dict[str, str | None] = {}
+
+    @property
+    def _resources(self) -> Mapping[str, bytes]:
+        return asdf.get_config().resource_manager if self._resource_manager is None else self._resource_manager
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        with self._lock:
+            if self._manifests is None:
+                resource_manager = self._resources
+
+                manifests = {}
+                schema_tags: dict[str, list[str]] = {}
+                tag_manifests: dict[str, list[str]] = {}
+                for uri in resource_manager:
+                    if not uri.startswith(_MANIFEST_URI_PREFIX):
+                        continue
+
+                    manifest = yaml.load(resource_manager[uri], Loader=_Loader)  # noqa: S506
+                    manifests[uri] = {entry["tag_uri"]: entry["schema_uri"] for entry in manifest["tags"]}
+                    for tag, schema_uri in manifests[uri].items():
+                        self._tag_schemas[tag] = schema_uri
+                        tags = schema_tags.setdefault(schema_uri, [])
+                        if tag not in tags:
+                            tags.append(tag)
+                        tag_manifests.setdefault(tag, []).append(uri)
+
+                self._schema_tags = {schema_uri: tuple(tags) for schema_uri, tags in schema_tags.items()}
+                self._tag_manifests = {tag: tuple(uris) for tag, uris in tag_manifests.items()}
+                self._manifests = manifests
+
+        return self._manifests
+
+    @property
+    def manifest_uris(self) -> tuple[str, ...]:
+        """
+        The URIs of all the RAD manifests.
+        """
+        return tuple(self._load())
+
+    def tags(self, manifest_uri: str) -> dict[str, str]:
+        """
+        Map the tag URIs of a manifest to their schema URIs.
+
+        Parameters
+        ----------
+        manifest_uri : str
+            The manifest URI, e.g. "asdf://stsci.edu/datamodels/roman/manifests/datamodels-2.1.0".
+
+        Returns
+        -------
+        dict[str, str]
+            tag-uri: schema-uri, in the order of the manifest.
+        """
+        if (tags := self._load().get(manifest_uri)) is None:
+            raise ValueError(f"{manifest_uri} is not a RAD manifest")
+
+        return dict(tags)
+
+    def schema_uri(self, tag: str) -> str:
+        """
+        Get the schema URI the RAD manifests register for a tag.
+
+        Raises
+        ------
+        ValueError
+            If no RAD manifest registers the tag.
+        """
+        self._load()
+        if (schema_uri := self._tag_schemas.get(tag)) is None:
+            raise ValueError(f"No RAD schema is registered for the tag {tag}")
+
+        return schema_uri
+
+    def tag_uris(self, schema_uri: str) -> tuple[str, ...]:
+        """
+        Get the tags the RAD manifests register for a schema (empty if it is not tagged).
+        """
+        self._load()
+        return self._schema_tags.get(schema_uri, ())
+
+    def manifests_of(self, tag: str) -> tuple[str, ...]:
+        """
+        Get the URIs of the manifests which list a tag.
+        """
+        self._load()
+        return self._tag_manifests.get(tag, ())
+
+    def datamodel_name(self, uri: str) -> str | None:
+        """
+        Get the datamodel name of a tagged schema.
+
+        Parameters
+        ----------
+        uri : str
+            The tag URI (e.g. from the tree of a file), or the schema URI.
+
+        Returns
+        -------
+        str | None
+            The datamodel_name of the schema, or None if the schema is not a datamodel.
+
+        Raises
+        ------
+        ValueError
+            If the URI is neither a tag nor a schema registered by the RAD manifests.
+        """
+        self._load()
+        schema_uri = self._tag_schemas.get(uri, uri)
+        if schema_uri not in self._schema_tags:
+            raise ValueError(f"No RAD tag or tagged schema has the URI {uri}")
+
+        if schema_uri not in self._datamodel_names:
+            schema = yaml.load(self._resources[schema_uri], Loader=_Loader)  # noqa: S506
+            self._datamodel_names[schema_uri] = schema.get("datamodel_name")
+
+        return self._datamodel_names[schema_uri]
+
+    def __contains__(self, tag: str) -> bool:
+        self._load()
+        return tag in self._tag_schemas
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._tag_schemas)
+
+
+# id of a resource manager: the manifest index of its resources, ASDF builds a new resource
+# manager for each configuration (and whenever its resource mappings change), the entry is
+# dropped when the resource manager is (resource managers are mappings, so are unhashable)
+_MANIFEST_INDEXES: dict[int, ManifestIndex] = {}
+_MANIFEST_INDEX_LOCK = threading.Lock()
+
+
+def get_manifest_index() -> ManifestIndex:
+    """
+    Get the manifest index of the resources of the ASDF resource manager.
+        -> The index is cached for the resource manager of the current ASDF
+           configuration, so a different configuration (e.g. within
+           `asdf.config_context`) with other resource mappings gets its own index.
+    """
+    with _MANIFEST_INDEX_LOCK:
+        resource_manager = asdf.get_config().resource_manager
+        if (index := _MANIFEST_INDEXES.get(id(resource_manager))) is None:
+            index = _MANIFEST_INDEXES[id(resource_manager)] = ManifestIndex(resource_manager)
+            weakref.finalize(resource_manager, _MANIFEST_INDEXES.pop, id(resource_manager), None)
+
+    return index
@@ -0,0 +1,248 @@
+"""
+Opt-in timing and tracing of the hot paths in rad.
+
+Tracing is enabled either with the `tracing` context manager or, for a whole process,
+by setting the ``RAD_TRACE`` environment variable to the path the trace should be
+written to when the process exits (``RAD_TRACE_FORMAT`` selects ``json``, the
+default, or ``chrome`` for the Chrome trace event format).
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from typing import Any
+
+
+__all__ = ["Tracer", "get_tracer", "span", "tracing"]
+
+
+class _Span:
+    """
+    A single timed event recorded by a tracer.
+    """
+
+    __slots__ = ("args", "bytes", "duration", "name", "start", "thread")
+
+    def __init__(self, name: str, args: dict[str, Any]) -> None:
+        self.name = name
+        self.args = args
+        self.bytes = 0
+        self.start = 0
+        self.duration = 0
+        self.thread = threading.get_ident()
+
+    def set(self, **kwargs: Any) -> None:
+        """
+        Add arguments to the event.
+        """
+        self.args.update(kwargs)
+
+
+class _NullSpan:
+    """
+    Stand in for a span when tracing is disabled, it records nothing.
+    """
+
+    __slots__ = ()
+
+    duration = 0
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+    def set(self, **kwargs: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Records the events for the traced operations.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[_Span] = []
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Generator[_Span, None, None]:
+        """
+        Time the enclosed block as an event.
+
+        Parameters
+        ----------
+        name : str
+            The name of the operation.
+        **args
+            Additional information to record with the event (e.g. the URI).
+        """
+        event = _Span(name, args)
+        event.start = time.perf_counter_ns() - self._origin
+        try:
+            yield event
+        finally:
+            event.duration = time.perf_counter_ns() - self._origin - event.start
+            with self._lock:
+                self.spans.append(event)
+
+    def summary(self) -> dict[str, dict[str, int | float]]:
+        """
+        Aggregate the events by name.
+
+        Returns
+        -------
+        dict[str, dict[str, int | float]]
+            The call count, total wall time (s), and bytes read for each operation.
+        """
+        summary = {}
+        for event in self.spans:
+            entry = summary.setdefault(event.name, {"count": 0, "wall_time": 0.0, "bytes": 0})
+            entry["count"] += 1
+            entry["wall_time"] += event.duration / 1e9
+            entry["bytes"] += event.bytes
+
+        return summary
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Get the trace as a JSON serializable dictionary of the summary and events.
+        """
+        return {
+            "summary": self.summary(),
+            "events": [
+                {
+                    "name": event.name,
+                    "start": event.start / 1e9,
+                    "duration": event.duration / 1e9,
+                    "bytes": event.bytes,
+                    "thread": event.thread,
+                    "args": event.args,
+                }
+                for event in sorted(self.spans, key=lambda event: event.start)
+            ],
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Get the trace in the Chrome trace event format (e.g. for chrome://tracing or Perfetto).
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": event.name,
+                    "cat": "rad",
+                    "ph": "X",
+                    "ts": event.start / 1e3,
+                    "dur": event.duration / 1e3,
+                    "pid": pid,
+                    "tid": event.thread,
+                    "args": {**event.args, "bytes": event.bytes},
+                }
+                for event in self.spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, path: str | Path, format: str = "json") -> None:
+        """
+        Write the trace to a file.
+
+        Parameters
+        ----------
+        path : str | Path
+            The file to write to.
+        format : str, optional
+            Either "json" (default) or "chrome".
+        """
+        match format:
+            case "json":
+                data = self.to_json()
+            case "chrome":
+                data = self.to_chrome_trace()
+            case _:
+                raise ValueError(f"Unknown trace format: {format}")
+
+        with Path(path).open("w") as f:
+            json.dump(data, f, default=str)
+
+
+_TRACER: Tracer | None = None
+
+
+def get_tracer() -> Tracer | None:
+    """
+    Get the active tracer, if tracing is enabled.
+    """
+    return _TRACER
+
+
+def span(name: str, **args: Any) -> _Span | _NullSpan:
+    """
+    Time the enclosed block as an event of the active tracer, this does
+    nothing if tracing is not enabled.
+
+    Parameters
+    ----------
+    name : str
+        The name of the operation.
+    **args
+        Additional information to record with the event (e.g. the URI).
+    """
+    if _TRACER is None:
+        return _NULL_SPAN
+
+    return _TRACER.span(name, **args)
+
+
+@contextmanager
+def tracing(path: str | Path | None = None, format: str = "json") -> Generator[Tracer, None, None]:
+    """
+    Enable tracing for the enclosed block.
+
+    Parameters
+    ----------
+    path : str | Path, optional
+        If given, the file to write the trace to when the block exits.
+    format : str, optional
+        The format of the trace file, either "json" (default) or "chrome".
+
+    Yields
+    ------
+    Tracer
+        The tracer recording the events.
+    """
+    global _TRACER
+
+    previous = _TRACER
+    _TRACER = Tracer()
+    try:
+        yield _TRACER
+    finally:
+        tracer, _TRACER = _TRACER, previous
+        if path is not None:
+            tracer.write(path, format)
+
+
+if _TRACE_PATH := os.environ.get("RAD_TRACE"):
+    _TRACER = Tracer()
+    atexit.register(_TRACER.write, _TRACE_PATH, os.environ.get("RAD_TRACE_FORMAT", "json"))
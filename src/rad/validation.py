@@ -0,0 +1,608 @@
+"""
+Reusable validators for the RAD tagged schemas.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from functools import cache
+from itertools import islice, product
+from typing import TYPE_CHECKING, NamedTuple
+
+import asdf
+import asdf.schema
+import asdf.tagged
+import asdf.yamlutil
+
+from .integration import strip_annotations
+from .keywords import ANNOTATION_KEYWORDS, LITERAL_KEYWORDS, NAMED_SUBSCHEMA_KEYWORDS, SERIALIZATION_KEYWORDS
+from .manifests import get_manifest_index
+from .tracing import span
+from .versions import latest_uri
+
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = [
+    "PatternKeys",
+    "ValidatorCache",
+    "expand_pattern",
+    "expand_pattern_properties",
+    "get_validator_cache",
+    "pattern_keys",
+    "subtree_schema",
+]
+
+_MANIFEST_URI_PREFIX = "asdf://stsci.edu/datamodels/roman/manifests/"
+
+# The most keys a patternProperties pattern is expanded into
+_EXPANSION_LIMIT = 1024
+
+
+class _Infinite(Exception):
+    """
+    Raised when a pattern matches too many keys to expand, or keys which cannot be enumerated.
+    """
+
+
+# Characters with a special meaning outside of a character set
+_METACHARACTERS = frozenset(".^$*+?{}[]()|\\")
+
+
+class _PatternExpander:
+    """
+    A recursive descent parser for the finite subset of regular expressions:
+    literals, escaped punctuation, character sets of literals and ranges,
+    (non-capturing) groups, alternations, and the "?", "{n}", and "{m,n}" repeats.
+        -> Expands the body of an anchored pattern into all the strings it matches,
+           raising _Infinite for anything outside of this subset.
+    """
+
+    def __init__(self, body: str, limit: int) -> None:
+        self._body = body
+        self._index = 0
+        self._limit = limit
+
+    def _peek(self) -> str:
+        return self._body[self._index : self._index + 1]
+
+    def _next(self) -> str:
+        if not (char := self._peek()):
+            raise _Infinite
+        self._index += 1
+        return char
+
+    def _escape(self) -> str:
+        # Only escaped punctuation is a literal, e.g. \d, \w, and \b are classes or assertions
+        if (char := self._next()).isalnum() or char == "_":
+            raise _Infinite
+        return char
+
+    def _check(self, count: int) -> None:
+        if count > self._limit:
+            raise _Infinite
+
+    def expand(self) -> list[str]:
+        strings = self._sequence()
+        if self._peek():
+            # A top-level alternation, e.g. "^a|b$", is not anchored at both ends
+            raise _Infinite
+        return strings
+
+    def _alternation(self) -> list[str]:
+        strings = self._sequence()
+        while self._peek() == "|":
+            self._index += 1
+            strings += self._sequence()
+            self._check(len(strings))
+        return list(dict.fromkeys(strings))
+
+    def _sequence(self) -> list[str]:
+        strings = [""]
+        while (char := self._peek()) and char not in "|)":
+            options = self._repeat(self._atom())
+            self._check(len(strings) * len(options))
+            strings = [string + option for string in strings for option in options]
+        return strings
+
+    def _atom(self) -> list[str]:
+        char = self._next()
+        if char == "(":
+            if self._body.startswith("?:", self._index):
+                self._index += 2
+            elif self._peek() == "?":
+                # Flags, lookarounds, and named groups
+                raise _Infinite
+            options = self._alternation()
+            if self._next() != ")":
+                raise _Infinite
+            return options
+        if char == "[":
+            return self._set()
+        if char == "\\":
+            return [self._escape()]
+        if char in _METACHARACTERS:
+            raise _Infinite
+        return [char]
+
+    def _set(self) -> list[str]:
+        if self._peek() == "^":
+            raise _Infinite
+
+        chars: list[str] = []
+        first = True
+        while (char := self._next()) != "]" or first:
+            first = False
+            if char == "\\":
+                char = self._escape()
+            elif char == "[":
+                # Possible nested sets or POSIX classes, which Python warns about
+                raise _Infinite
+            if self._peek() == "-" and self._body[self._index + 1 : self._index + 2] not in ("]", ""):
+                self._index += 1
+                if (high := self._next()) == "\\":
+                    high = self._escape()
+                if ord(high) < ord(char):
+                    raise _Infinite
+                chars.extend(map(chr, range(ord(char), ord(high) + 1)))
+            else:
+                chars.append(char)
+            self._check(len(chars))
+
+        return list(dict.fromkeys(chars))
+
+    def _repeat(self, options: list[str]) -> list[str]:
+        char = self._peek()
+        if char == "?":
+            self._index += 1
+            low, high = 0, 1
+        elif char == "{":
+            close = self._body.find("}", self._index)
+            bounds = self._body[self._index + 1 : close].split(",") if close > 0 else []
+            if not 1 <= len(bounds) <= 2 or not all(bound.isdigit() for bound in bounds):
+                raise _Infinite
+            self._index = close + 1
+            low, high = int(bounds[0]), int(bounds[-1])
+        elif char in ("*", "+"):
+            raise _Infinite
+        else:
+            return options
+
+        # A lazy repeat matches the same strings
+        if self._peek() == "?":
+            self._index += 1
+        elif self._peek() in ("*", "+", "{"):
+            raise _Infinite
+
+        repeated = []
+        for count in range(low, high + 1):
+            self._check(len(options) ** count)
+            repeated.extend("".join(parts) for parts in product(options, repeat=count))
+            self._check(len(repeated))
+
+        return list(dict.fromkeys(repeated))
+
+
+@cache
+def _expand(pattern: str, limit: int) -> tuple[frozenset[str], bool] | None:
+    """
+    Expand an anchored pattern into the keys it matches in full, and whether its
+    end anchor is "$", which also lets it match each key followed by a newline.
+    """
+    if pattern.startswith("^"):
+        body = pattern[1:]
+    elif pattern.startswith("\\A"):
+        body = pattern[2:]
+    else:
+        return None
+
+    if body.endswith("\\Z"):
+        body, newline = body[:-2], False
+    elif body.endswith("$"):
+        body, newline = body[:-1], True
+    else:
+        return None
+
+    # The end anchor is a literal if it is escaped
+    if (len(body) - len(body.rstrip("\\"))) % 2:
+        return None
+
+    try:
+        keys = _PatternExpander(body, limit).expand()
+    except _Infinite:
+        return None
+
+    return frozenset(keys), newline
+
+
+def expand_pattern(pattern: str, limit: int = _EXPANSION_LIMIT) -> frozenset[str] | None:
+    """
+    Expand a pattern which only matches a finite set of keys into those keys.
+        -> Only patterns anchored at both ends (e.g. "^WFI(0[1-9]|1[0-8])$") and made of
+           literals, character sets, alternations, and bounded repeats are expanded.
+        -> The keys are those the pattern matches in full (\\Z semantics). Python's "$"
+           also matches before a trailing newline, so a pattern ending in "$" also
+           matches each of the keys followed by "\\n"; these are not included (see
+           `pattern_keys` and `expand_pattern_properties`, which do account for them).
+
+    Parameters
+    ----------
+    pattern : str
+        The regular expression, e.g. of a patternProperties keyword.
+    limit : int, optional
+        The most keys to expand the pattern into.
+
+    Returns
+    -------
+    frozenset[str] | None
+        The keys the pattern matches, or None if they cannot be expanded.
+    """
+    return None if (expanded := _expand(pattern, limit)) is None else expanded[0]
+
+
+class PatternKeys(NamedTuple):
+    """
+    The keys allowed by the patternProperties of a schema.
+    """
+
+    keys: frozenset[str]
+    patterns: tuple[re.Pattern[str], ...]
+    newline_keys: frozenset[str] = frozenset()
+
+    def match(self, key: str) -> bool:
+        """
+        Check if a key is matched by any of the patterns.
+            -> newline_keys are the keys of patterns ending in "$", which also match them
+               followed by a newline.
+        """
+        return (
+            key in self.keys
+            or (key.endswith("\n") and key[:-1] in self.newline_keys)
+            or any(pattern.search(key) for pattern in self.patterns)
+        )
+
+
+def pattern_keys(schema: dict[str, Any]) -> PatternKeys:
+    """
+    Compile the patternProperties of a schema into the set of keys of its finite
+    patterns, and the precompiled regular expressions of the others.
+
+    Parameters
+    ----------
+    schema : dict[str, Any]
+        The schema with the patternProperties.
+
+    Returns
+    -------
+    PatternKeys
+        The expanded keys and compiled patterns.
+    """
+    keys: set[str] = set()
+    newline_keys: set[str] = set()
+    patterns = []
+    for pattern in schema.get("patternProperties", {}):
+        if (expanded := _expand(pattern, _EXPANSION_LIMIT)) is None:
+            patterns.append(re.compile(pattern))
+            continue
+
+        keys |= expanded[0]
+        if expanded[1]:
+            newline_keys |= expanded[0]
+
+    return PatternKeys(frozenset(keys), tuple(patterns), frozenset(newline_keys))
+
+
+def expand_pattern_properties(schema: Any, limit: int = _EXPANSION_LIMIT) -> Any:
+    """
+    Rewrite the finite patternProperties of a schema as explicit properties.
+        -> Each key matched by a finite pattern becomes a property with the pattern's
+           subschema (combined with allOf where a key has several subschemas), so
+           validation looks the key up rather than running the pattern against it.
+        -> A pattern ending in "$" also matches its keys followed by a newline, so
+           these keys become properties too.
+        -> Patterns which cannot be expanded are kept, the schema validates the same.
+
+    Parameters
+    ----------
+    schema : Any
+        The schema to rewrite, it is not modified.
+    limit : int, optional
+        The most keys to expand a single pattern into.
+
+    Returns
+    -------
+    Any
+        The rewritten schema.
+    """
+    if isinstance(schema, list):
+        return [expand_pattern_properties(item, limit) for item in schema]
+
+    if not isinstance(schema, dict):
+        return schema
+
+    expanded = {}
+    for key, value in schema.items():
+        if key in LITERAL_KEYWORDS:
+            expanded[key] = value
+        elif key in NAMED_SUBSCHEMA_KEYWORDS and isinstance(value, dict):
+            expanded[key] = {name: expand_pattern_properties(subschema, limit) for name, subschema in value.items()}
+        else:
+            expanded[key] = expand_pattern_properties(value, limit)
+
+    if not isinstance(expanded.get("patternProperties"), dict):
+        return expanded
+
+    properties = dict(expanded.get("properties", {}))
+    patterns = {}
+    for pattern, subschema in expanded["patternProperties"].items():
+        if (expanded_keys := _expand(pattern, limit)) is None:
+            patterns[pattern] = subschema
+            continue
+
+        keys, newline = expanded_keys
+        for name in sorted(keys | {f"{key}\n" for key in keys} if newline else keys):
+            properties[name] = {"allOf": [properties[name], subschema]} if name in properties else subschema
+
+    expanded["properties"] = properties
+    if patterns:
+        expanded["patternProperties"] = patterns
+    else:
+        del expanded["patternProperties"]
+
+    return expanded
+
+
+def _subschemas(schema: dict[str, Any], key: str) -> list[dict[str, Any]]:
+    """
+    Find the subschemas for a property, looking through any allOf combiners.
+    """
+    subschemas = []
+    if key in schema.get("properties", {}):
+        subschemas.append(schema["properties"][key])
+
+    for subschema in schema.get("allOf", []):
+        subschemas.extend(_subschemas(subschema, key))
+
+    return subschemas
+
+
+def subtree_schema(schema_uri: str, path: str) -> dict[str, Any]:
+    """
+    Get the schema for the subtree of a schema at a dotted path.
+        -> Resolves all the references of the schema, then follows the path
+           through the properties (and allOf combiners) of the schema.
+        -> The annotations and serialization hints are removed, leaving only
+           the validation keywords.
+
+    Parameters
+    ----------
+    schema_uri : str
+        The URI of the schema, e.g. a datamodel schema.
+    path : str
+        The dotted path to the subtree, e.g. "meta" or "meta.exposure".
+
+    Returns
+    -------
+    dict[str, Any]
+        The schema for the subtree.
+    """
+    schemas = [asdf.schema.load_schema(schema_uri, resolve_references=True)]
+    for key in path.split("."):
+        schemas = [subschema for schema in schemas for subschema in _subschemas(schema, key)]
+        if not schemas:
+            raise ValueError(f"{path} is not a subtree of the schema {schema_uri}")
+
+    schema = schemas[0] if len(schemas) == 1 else {"allOf": schemas}
+    return strip_annotations(schema, ANNOTATION_KEYWORDS | SERIALIZATION_KEYWORDS)
+
+
+class ValidatorCache:
+    """
+    A thread-safe LRU cache of ready-to-use validators for the RAD tags.
+
+    Note:
+        The validators are built when first requested, from the schema the RAD
+        manifests register for the tag with all its references resolved, and its
+        finite patternProperties expanded into explicit properties. The cache lock
+        is only held to look up and insert the validators, they are built outside
+        of it so a slow build does not block the lookups of other threads. ASDF
+        keeps the state of a validation on the (process-wide) validator class, so
+        the validations themselves are serialized by a separate lock; threads share
+        the compiled validators rather than each building their own.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of validators to keep.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        self.maxsize = maxsize
+        self._validators: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._validate_lock = threading.Lock()
+        self._ctx = asdf.AsdfFile()
+
+    def _lookup(self, key: Any) -> Any | None:
+        """
+        Get a cached validator, marking it as the most recently used.
+        """
+        with self._lock:
+            if key in self._validators:
+                self._validators.move_to_end(key)
+                return self._validators[key]
+
+        return None
+
+    def _insert(self, key: Any, validator: Any) -> Any:
+        """
+        Cache a validator, evicting the least recently used one if the cache is full.
+            -> If another thread built the validator in the meantime, that one is kept.
+        """
+        with self._lock:
+            if key in self._validators:
+                self._validators.move_to_end(key)
+                return self._validators[key]
+
+            self._validators[key] = validator
+            if len(self._validators) > self.maxsize:
+                self._validators.popitem(last=False)
+
+        return validator
+
+    def get(self, tag: str) -> Any:
+        """
+        Get the validator for a tag, building it if it is not cached.
+
+        Parameters
+        ----------
+        tag : str
+            The tag URI.
+
+        Returns
+        -------
+        jsonschema.Validator
+            The validator for the tag's schema.
+        """
+        if (validator := self._lookup(tag)) is not None:
+            return validator
+
+        schema_uri = get_manifest_index().schema_uri(tag)
+        with span("validation.build_validator", tag=tag):
+            schema = asdf.schema.load_schema(schema_uri, resolve_references=True)
+            validator = asdf.schema.get_validator(expand_pattern_properties(schema), ctx=self._ctx)
+
+        return self._insert(tag, validator)
+
+    def validate(self, tag: str, instance: Any) -> None:
+        """
+        Validate an instance against the schema for a tag.
+
+        Parameters
+        ----------
+        tag : str
+            The tag URI.
+        instance : Any
+            The tree to validate, as read by ASDF. If it is not tagged, it is
+            tagged with the tag (as ASDF would when reading it).
+
+        Raises
+        ------
+        asdf.exceptions.ValidationError
+            If the instance is not valid.
+        """
+        if not isinstance(instance, asdf.tagged.Tagged):
+            instance = asdf.tagged.tag_object(tag, instance)
+
+        validator = self.get(tag)
+        with self._validate_lock, span("validation.validate", tag=tag):
+            validator.validate(instance)
+
+    def get_subtree(self, schema_uri: str, path: str) -> Any:
+        """
+        Get the validator for a subtree of a schema, building it if it is not cached.
+
+        Parameters
+        ----------
+        schema_uri : str
+            The URI of the schema, e.g. a datamodel schema.
+        path : str
+            The dotted path to the subtree, e.g. "meta".
+
+        Returns
+        -------
+        jsonschema.Validator
+            The validator for the subtree (see `subtree_schema`).
+        """
+        key = (schema_uri, path)
+        if (validator := self._lookup(key)) is not None:
+            return validator
+
+        with span("validation.build_subtree_validator", uri=schema_uri, path=path):
+            validator = asdf.schema.get_validator(expand_pattern_properties(subtree_schema(schema_uri, path)), ctx=self._ctx)
+
+        return self._insert(key, validator)
+
+    def validate_subtree(self, schema_uri: str, path: str, instance: Any) -> None:
+        """
+        Validate only a subtree of a file against the corresponding part of a schema,
+        so that validation is proportional to the size of the subtree.
+
+        Parameters
+        ----------
+        schema_uri : str
+            The URI of the schema, e.g. a datamodel schema.
+        path : str
+            The dotted path to the subtree, e.g. "meta".
+        instance : Any
+            The subtree to validate, either as read by ASDF or as custom objects
+            (which are converted to their tagged representation first).
+
+        Raises
+        ------
+        asdf.exceptions.ValidationError
+            If the subtree is not valid.
+        """
+        validator = self.get_subtree(schema_uri, path)
+        tree = asdf.yamlutil.custom_tree_to_tagged_tree(instance, self._ctx)
+        with self._validate_lock, span("validation.validate_subtree", uri=schema_uri, path=path):
+            validator.validate(tree)
+
+    def warm(self, manifest_uri: str | None = None) -> int:
+        """
+        Build the validators for the tags of a manifest ahead of use.
+            -> If the manifest has more tags than maxsize, only the first maxsize are warmed.
+
+        Parameters
+        ----------
+        manifest_uri : str, optional
+            The manifest to warm the validators for, by default the latest datamodels manifest.
+
+        Returns
+        -------
+        int
+            The number of validators built.
+        """
+        tags = get_manifest_index().tags(manifest_uri or latest_uri(f"{_MANIFEST_URI_PREFIX}datamodels"))
+
+        built = 0
+        for tag in islice(tags, self.maxsize):
+            built += tag not in self
+            self.get(tag)
+
+        return built
+
+    def clear(self) -> None:
+        """
+        Drop all the cached validators.
+        """
+        with self._lock:
+            self._validators.clear()
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._validators
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+
+_VALIDATOR_CACHE: ValidatorCache | None = None
+_VALIDATOR_CACHE_LOCK = threading.Lock()
+
+
+def get_validator_cache() -> ValidatorCache:
+    """
+    Get the validator cache shared by the whole process.
+    """
+    global _VALIDATOR_CACHE
+
+    with _VALIDATOR_CACHE_LOCK:
+        if _VALIDATOR_CACHE is None:
+            _VALIDATOR_CACHE = ValidatorCache()
+
+    return _VALIDATOR_CACHE
@@ -0,0 +1,237 @@
+"""
+Sorted version indexes for resolving wildcard and latest tag and schema URIs.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING
+
+import asdf
+from asdf.util import uri_match
+from semantic_version import Version
+
+from .manifests import get_manifest_index
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ["VersionIndex", "get_version_index", "latest_uri", "parse_version", "split_uri"]
+
+
+def parse_version(version: str) -> Version:
+    """
+    Parse the version of a URI, normalizing the legacy forms.
+        -> The first manifest has the version "1.0", which is coerced to "1.0.0".
+
+    Parameters
+    ----------
+    version : str
+        The version, e.g. "2.1.0".
+
+    Returns
+    -------
+    Version
+        The semantic version.
+    """
+    return Version.coerce(version)
+
+
+def split_uri(uri: str) -> tuple[str, Version] | None:
+    """
+    Split a versioned URI into its base name and version.
+
+    Parameters
+    ----------
+    uri : str
+        The URI, e.g. "asdf://stsci.edu/datamodels/roman/tags/wfi_image-2.1.0".
+
+    Returns
+    -------
+    tuple[str, Version] | None
+        The base name (e.g. "asdf://stsci.edu/datamodels/roman/tags/wfi_image") and
+        the version, or None if the URI is not versioned.
+    """
+    base, sep, version = uri.rpartition("-")
+    if not sep or not version[:1].isdigit():
+        return None
+
+    try:
+        return base, parse_version(version)
+    except ValueError:
+        return None
+
+
+def _version_bounds(version: str) -> tuple[Version, Version] | None:
+    """
+    Get the range of versions, [low, high), matched by a version wildcard such as "1.*" or "1.2.*".
+    """
+    parts = version.removesuffix(".*").split(".")
+    if not version.endswith(".*") or len(parts) > 2 or not all(part.isdigit() for part in parts):
+        return None
+
+    numbers = [int(part) for part in parts]
+    low = Version(major=numbers[0], minor=numbers[1] if len(numbers) > 1 else 0, patch=0)
+    high = low.next_major() if len(numbers) == 1 else low.next_minor()
+
+    return low, high
+
+
+class VersionIndex:
+    """
+    The versions of each base name, kept sorted.
+        -> Finding the latest version of a base name, or the versions matching a
+           wildcard such as "tag:stsci.edu:asdf/core/ndarray-1.*", is a binary search
+           over the versions of the base name rather than a scan of every URI.
+
+    Parameters
+    ----------
+    uris : Iterable[str], optional
+        The URIs to index, URIs without a version are ignored.
+    """
+
+    def __init__(self, uris: Iterable[str] = ()) -> None:
+        self._versions: dict[str, list[tuple[Version, str]]] = {}
+        for uri in uris:
+            self.add(uri)
+
+    def add(self, uri: str) -> None:
+        """
+        Add a URI to the index.
+        """
+        if (split := split_uri(uri)) is None:
+            return
+
+        base, version = split
+        versions = self._versions.setdefault(base, [])
+        entry = (version, uri)
+        index = bisect_left(versions, entry)
+        if index == len(versions) or versions[index] != entry:
+            insort(versions, entry)
+
+    def versions(self, base: str) -> list[str]:
+        """
+        The URIs of all the versions of a base name, oldest first.
+        """
+        return [uri for _, uri in self._versions.get(base, ())]
+
+    def latest(self, base: str) -> str | None:
+        """
+        The URI of the latest version of a base name, or None if there are no versions.
+        """
+        return versions[-1][1] if (versions := self._versions.get(base)) else None
+
+    def match(self, pattern: str) -> list[str]:
+        """
+        Find the URIs matching a URI or wildcard pattern, oldest first.
+            -> The pattern is resolved against the versions of its base name, patterns
+               with a version wildcard ("-*", "-1.*", or "-1.2.*") by binary search.
+            -> Patterns with a wildcard in the base name are matched against every URI.
+
+        Parameters
+        ----------
+        pattern : str
+            The URI or pattern, e.g. "tag:stsci.edu:gwcs/wcs-*".
+
+        Returns
+        -------
+        list[str]
+            The matching URIs.
+        """
+        base, sep, version = pattern.rpartition("-")
+        if not sep or "*" in base:
+            return [uri for versions in self._versions.values() for _, uri in versions if uri_match(pattern, uri)]
+
+        versions = self._versions.get(base, [])
+        if version == "*":
+            return [uri for _, uri in versions]
+
+        if (bounds := _version_bounds(version)) is not None:
+            low, high = bounds
+            return [uri for _, uri in versions[bisect_left(versions, (low,)) : bisect_left(versions, (high,))]]
+
+        if "*" in version:
+            return [uri for _, uri in versions if uri_match(pattern, uri)]
+
+        if (split := split_uri(pattern)) is None:
+            return []
+
+        index = bisect_left(versions, (split[1], pattern))
+        return [pattern] if index < len(versions) and versions[index][1] == pattern else []
+
+    def latest_match(self, pattern: str) -> str | None:
+        """
+        The URI of the latest version matching a pattern, or None if there is no match.
+        """
+        return matches[-1] if (matches := self.match(pattern)) else None
+
+    def __contains__(self, base: str) -> bool:
+        return base in self._versions
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+
+# id of a resource manager: the version index of its resources, ASDF builds a new resource
+# manager for each configuration (and whenever its resource mappings change), the entry is
+# dropped when the resource manager is (resource managers are mappings, so are unhashable)
+_VERSION_INDEXES: dict[int, VersionIndex] = {}
+_VERSION_INDEX_LOCK = threading.Lock()
+
+
+def get_version_index() -> VersionIndex:
+    """
+    Get the version index of all the resources (of the ASDF resource manager) and
+    tags (of the ASDF extensions and RAD manifests), built on first use.
+        -> The index is cached for the resource manager of the current ASDF
+           configuration, so a different configuration (e.g. within
+           `asdf.config_context`) with other resource mappings gets its own index.
+        -> The extension tags are read when the index is built, extensions added
+           later without changing the resource mappings are not indexed.
+    """
+    with _VERSION_INDEX_LOCK:
+        config = asdf.get_config()
+        resource_manager = config.resource_manager
+        if (index := _VERSION_INDEXES.get(id(resource_manager))) is None:
+            index = VersionIndex(resource_manager)
+            for extension in config.extensions:
+                for tag in extension.tags:
+                    index.add(tag.tag_uri)
+
+            # The RAD tags are only registered as extensions when roman_datamodels is installed
+            manifests = get_manifest_index()
+            for manifest_uri in manifests.manifest_uris:
+                for tag in manifests.tags(manifest_uri):
+                    index.add(tag)
+
+            _VERSION_INDEXES[id(resource_manager)] = index
+            weakref.finalize(resource_manager, _VERSION_INDEXES.pop, id(resource_manager), None)
+
+    return index
+
+
+def latest_uri(base: str) -> str:
+    """
+    Resolve the latest version of a tag, schema, or manifest.
+
+    Parameters
+    ----------
+    base : str
+        The base name, e.g. "asdf://stsci.edu/datamodels/roman/manifests/datamodels".
+
+    Returns
+    -------
+    str
+        The URI of the latest version, e.g. "asdf://stsci.edu/datamodels/roman/manifests/datamodels-2.1.0".
+
+    Raises
+    ------
+    ValueError
+        If there are no versions of the base name.
+    """
+    if (uri := get_version_index().latest(base)) is None:
+        raise ValueError(f"There are no versions of {base}")
+
+    return uri
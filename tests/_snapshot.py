@@ -0,0 +1,274 @@
+"""
+Disk-backed snapshot of the parsed RAD resources.
+--> Parsing the YAML of every resource dominates the start up time of the test session,
+    so the parsed resources are pickled into a single snapshot keyed by the hash of the
+    content they were parsed from. Resources whose content has not changed are then
+    read from the snapshot rather than re-parsed on the next run.
+--> Each entry is pickled separately and only unpickled when it is used, so every
+    table gets its own copy of the parsed content even when tables share content.
+--> Entries are kept until they have not been used for a while, not just while the
+    running session uses them, as a session may only register part of the content
+    (e.g. the xdist controller or a run of a single test module).
+--> Under pytest-xdist the controller fills the snapshot before the workers start,
+    and `shared` lets the workers compute any other expensive setup only once per run.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+import yaml
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterator
+    from typing import Any
+
+__all__ = ["SNAPSHOT", "Snapshot", "shared"]
+
+_CACHE_DIR = Path(__file__).parent.parent / ".pytest_cache"
+
+# Entries which have not been used for this long (in seconds) are dropped from the snapshot
+_MAX_AGE = 30 * 24 * 60 * 60
+# The last use of the entries is only updated on disk once it is this old (in seconds)
+_REFRESH_AGE = 24 * 60 * 60
+
+
+class _LazyMapping(Mapping):
+    """
+    Read-only mapping which parses the content of an entry on first access.
+    --> Each mapping holds its own copy of the parsed content (see `Snapshot.parse`).
+    """
+
+    def __init__(self, snapshot: Snapshot, keys: dict[Any, str]) -> None:
+        self._snapshot = snapshot
+        self._keys = keys
+        self._cache: dict[Any, Any] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        if key not in self._cache:
+            self._cache[key] = self._snapshot.parse(self._keys[key])
+
+        return self._cache[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class Snapshot:
+    """
+    A snapshot of parsed YAML content keyed by the sha256 hash of the content.
+
+    Parameters
+    ----------
+    path : Path
+        The file the snapshot is stored in.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._entries: dict[str, tuple[float, bytes]] | None = None
+        self._contents: dict[str, bytes] = {}
+        self._dirty = False
+
+    def _read(self) -> dict[str, tuple[float, bytes]]:
+        """
+        Read the snapshot from disk, an unreadable snapshot (or one in an older layout) is empty.
+        """
+        try:
+            with self._path.open("rb") as f:
+                entries = pickle.load(f)  # noqa: S301
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return {}
+
+        if not isinstance(entries, dict) or not all(
+            isinstance(entry, tuple) and len(entry) == 2 and isinstance(entry[1], bytes) for entry in entries.values()
+        ):
+            return {}
+
+        return entries
+
+    @property
+    def entries(self) -> dict[str, tuple[float, bytes]]:
+        """
+        The (time of last use, pickled parsed content) stored in the snapshot, read from disk on first use.
+        """
+        if self._entries is None:
+            self._entries = self._read()
+
+        return self._entries
+
+    def lazy(self, contents: Mapping[Any, bytes]) -> Mapping[Any, Any]:
+        """
+        Get a read-only mapping of the parsed contents, where each entry is
+        only parsed (or read from the snapshot) when it is first accessed.
+
+        Parameters
+        ----------
+        contents : Mapping[Any, bytes]
+            The raw YAML content to parse.
+
+        Returns
+        -------
+        Mapping[Any, Any]
+            The mapping of the same keys to the parsed content.
+        """
+        keys = {}
+        for key, content in contents.items():
+            keys[key] = sha256(content).hexdigest()
+            self._contents[keys[key]] = content
+
+        return _LazyMapping(self, keys)
+
+    def parse_content(self, content: bytes) -> Any:
+        """
+        Get the parsed content for some raw YAML content.
+
+        Parameters
+        ----------
+        content : bytes
+            The raw YAML content to parse.
+
+        Returns
+        -------
+        Any
+            The parsed content.
+        """
+        digest = sha256(content).hexdigest()
+        self._contents[digest] = content
+
+        return self.parse(digest)
+
+    def warm(self) -> None:
+        """
+        Parse all the registered content which is not yet in the snapshot.
+        """
+        for digest in self._contents:
+            self._pickled(digest)
+
+    def _pickled(self, digest: str) -> bytes:
+        entries = self.entries
+        if digest not in entries:
+            entries[digest] = (
+                time.time(),
+                pickle.dumps(yaml.safe_load(self._contents[digest]), protocol=pickle.HIGHEST_PROTOCOL),
+            )
+            self._dirty = True
+
+        return entries[digest][1]
+
+    def parse(self, digest: str) -> Any:
+        """
+        Get the parsed content for the given content hash.
+        --> A new copy is returned by each call, so callers may modify it freely.
+        """
+        return pickle.loads(self._pickled(digest))  # noqa: S301
+
+    def save(self) -> None:
+        """
+        Write the snapshot to disk if anything new was parsed (or the last use of the
+        entries registered by this session needs updating).
+        --> The entries on disk are merged in, so that the entries other sessions
+            (e.g. the other xdist workers) have added since this one read the snapshot are kept.
+        --> The entries registered by this session are marked as used, and entries which
+            have not been used for `_MAX_AGE` are dropped so the snapshot does not grow.
+        --> The write is atomic so that concurrent sessions never read a partial snapshot.
+        """
+        if self._entries is None:
+            return
+
+        now = time.time()
+        used = {digest for digest in self._contents if digest in self._entries}
+        if not self._dirty and all(now - self._entries[digest][0] < _REFRESH_AGE for digest in used):
+            return
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with _lock(self._path.with_suffix(".lock")) if fcntl is not None else nullcontext():
+            entries = self._read()
+            for digest, (last_used, value) in self._entries.items():
+                if digest not in entries or entries[digest][0] < last_used:
+                    entries[digest] = (last_used, value)
+            for digest in used:
+                entries[digest] = (now, entries[digest][1])
+
+            entries = {digest: entry for digest, entry in entries.items() if now - entry[0] < _MAX_AGE}
+
+            with NamedTemporaryFile("wb", dir=self._path.parent, delete=False) as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(f.name, self._path)
+
+        self._entries = entries
+        self._dirty = False
+
+
+SNAPSHOT = Snapshot(Path(os.environ.get("RAD_TEST_SNAPSHOT", _CACHE_DIR / "rad_snapshot.pickle")))
+
+
+@contextmanager
+def _lock(path: Path) -> Generator[None, None, None]:
+    """
+    Hold an exclusive lock on the given file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def shared(name: str, factory: Callable[[], Any]) -> Any:
+    """
+    Compute a value once per test run and share it between the pytest-xdist workers.
+    --> The first worker to get here computes the value and stores it (tagged with
+        the test run's id) while holding a lock, the others wait and then read it.
+    --> Outside of xdist (or without file locking) the value is simply computed.
+
+    Parameters
+    ----------
+    name : str
+        The name to store the value under.
+    factory : Callable[[], Any]
+        Computes the value.
+
+    Returns
+    -------
+    Any
+        The value computed by the factory.
+    """
+    if (run_id := os.environ.get("PYTEST_XDIST_TESTRUNUID")) is None or fcntl is None:
+        return factory()
+
+    path = _CACHE_DIR / f"rad_shared_{name}.pickle"
+    with _lock(path.with_suffix(".lock")):
+        try:
+            with path.open("rb") as f:
+                stored_id, value = pickle.load(f)  # noqa: S301
+            if stored_id == run_id:
+                return value
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError):
+            pass
+
+        value = factory()
+        with NamedTemporaryFile("wb", dir=path.parent, delete=False) as f:
+            pickle.dump((run_id, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, path)
+
+    return value
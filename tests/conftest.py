@@ -1,26 +1,17 @@
 import importlib.resources as importlib_resources
-from itertools import chain
 from pathlib import Path
-from re import compile, match
+from re import compile
 from types import MappingProxyType
 
 import asdf
 import pytest
 import yaml
-from semantic_version import Version
 
 from rad import resources
+from rad import versions
+from rad.manifests import get_manifest_index
 
-
-def _find_latest(uris):
-    version = Version("0.0.0")
-    uri = None
-    latest_uri = None
-    for uri in uris:
-        if version < (new := Version("1.0.0" if (v := uri.split("-")[-1]) == "1.0" else v)):
-            version = new
-            latest_uri = uri
-    return latest_uri
+from ._snapshot import SNAPSHOT
 
 
 # Defined directly so that the value can be reused to find the URIs from the ASDF resource manager
@@ -30,8 +21,7 @@ _MANIFEST_URI_PREFIX = f"{_RAD_URI_PREFIX}manifests/"
 _SCHEMA_URI_PREFIX = f"{_RAD_URI_PREFIX}schemas/"
 
 _BASE_METASCHEMA_URI = f"{_SCHEMA_URI_PREFIX}rad_schema"
-_METASCHEMA_URIS = tuple(u for u in asdf.get_config().resource_manager if u.startswith(_BASE_METASCHEMA_URI))
-_METASCHEMA_URI = _find_latest(_METASCHEMA_URIS)
+_METASCHEMA_URI = versions.latest_uri(_BASE_METASCHEMA_URI)
 
 
 # Get all the schema URIs from the ASDF resource manager cached to the current session
@@ -41,22 +31,43 @@ _SCHEMA_URIS = tuple(u for u in asdf.get_config().resource_manager if u.startswi
 _URIS = _SCHEMA_URIS + _MANIFEST_URIS + (_METASCHEMA_URI,)
 
 # load all the schemas from the ASDF resource manager
+#   the YAML is parsed through the snapshot, so that it is only parsed when its content
+#   changes and then only for the resources that are actually used by the session
 _CURRENT_CONTENT = MappingProxyType({uri: asdf.get_config().resource_manager[uri] for uri in _URIS})
-_CURRENT_RESOURCES = MappingProxyType({uri: yaml.safe_load(content) for uri, content in _CURRENT_CONTENT.items()})
-_MANIFEST_ENTRIES = tuple(chain(*[_CURRENT_RESOURCES[uri]["tags"] for uri in _MANIFEST_URIS]))
+_CURRENT_RESOURCES = SNAPSHOT.lazy(_CURRENT_CONTENT)
+# (manifest-uri, tag-uri) of each manifest entry, the entries themselves are only parsed when used
+_MANIFEST_ENTRY_KEYS = tuple((uri, tag_uri) for uri in _MANIFEST_URIS for tag_uri in get_manifest_index().tags(uri))
 
 
 # Look directly at the latest schemas storage directory to infer latest schemas
 _LATEST_DIR = Path(__file__).parent.parent.absolute() / "latest"
-_LATEST_PATHS = MappingProxyType(
-    {
-        latest_path.relative_to(_LATEST_DIR): yaml.safe_load(latest_path.read_bytes())
-        for latest_path in _LATEST_DIR.glob("**/*.yaml")
-    }
+_LATEST_CONTENT = MappingProxyType(
+    {latest_path.relative_to(_LATEST_DIR): latest_path.read_bytes() for latest_path in _LATEST_DIR.glob("**/*.yaml")}
 )
-_LATEST_URI_PATHS = MappingProxyType({schema["id"]: path for path, schema in _LATEST_PATHS.items()})
+_LATEST_PATHS = SNAPSHOT.lazy(_LATEST_CONTENT)
+
+# The tables used as fixture parameters are needed when the tests are collected, so they are
+# found from the top level keys of the raw content rather than by parsing every file
+#   -> In a block mapping a line starting with the key can only be a top level key, and
+#      that line alone is parsed as YAML so the value is read as YAML would (e.g. quoted)
+#   -> test_latest.py checks these tables agree with the parsed content
+_ID_PATTERN = compile(rb"(?m)^id:.*$")
+_ARCHIVE_META_PATTERN = compile(rb"(?m)^archive_meta:")
+
+
+def _top_level_id(path, content):
+    """
+    Get the top level id of the raw content of a resource.
+    """
+    if (match := _ID_PATTERN.search(content)) is None:
+        raise ValueError(f"{path} has no top level id")
+
+    return yaml.safe_load(match.group(0))["id"]
+
+
+_LATEST_URI_PATHS = MappingProxyType({_top_level_id(path, content): path for path, content in _LATEST_CONTENT.items()})
 _LATEST_MANIFEST_URIS = MappingProxyType(
-    {schema["id"]: schema for schema in _LATEST_PATHS.values() if "manifests" in schema["id"]}
+    {uri: _LATEST_PATHS[path] for uri, path in _LATEST_URI_PATHS.items() if uri.startswith(_MANIFEST_URI_PREFIX)}
 )
 _LATEST_TOP_LEVEL_PATHS = tuple(latest_path for latest_path in _LATEST_PATHS if latest_path.parent == Path("."))
 
@@ -65,12 +76,31 @@ _LATEST_MANIFEST_TAGS = MappingProxyType(
 )
 _LATEST_DATAMODELS_URI = next(uri for uri in _LATEST_MANIFEST_URIS if "static" not in uri)
 _LATEST_DATAMODEL_URIS = tuple(uri["schema_uri"] for uri in _LATEST_MANIFEST_URIS[_LATEST_DATAMODELS_URI]["tags"])
-_LATEST_ARCHIVE_URIS = tuple(schema["id"] for schema in _LATEST_PATHS.values() if "archive_meta" in schema)
+_LATEST_ARCHIVE_URIS = tuple(
+    uri for uri, path in _LATEST_URI_PATHS.items() if _ARCHIVE_META_PATTERN.search(_LATEST_CONTENT[path])
+)
 
 
-_PREVIOUS_DATAMODELS_URI = _find_latest(
-    [uri for uri in _MANIFEST_URIS if "static" not in uri and "datamodels" in uri and uri != _LATEST_DATAMODELS_URI]
-)
+_PREVIOUS_DATAMODELS_URI = [
+    uri for uri in versions.get_version_index().versions(f"{_MANIFEST_URI_PREFIX}datamodels") if uri != _LATEST_DATAMODELS_URI
+][-1]
+
+
+def pytest_configure(config):
+    """
+    When running under pytest-xdist, fill the snapshot in the controller before the
+    workers are started so that each worker only has to read the snapshot.
+    """
+    if not hasattr(config, "workerinput") and getattr(config.option, "numprocesses", None):
+        SNAPSHOT.warm()
+        SNAPSHOT.save()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Save any newly parsed resources into the snapshot for the next session.
+    """
+    SNAPSHOT.save()
 
 
 ### Fixtures for directly accessing resources via Python
@@ -141,6 +171,14 @@ def latest_uri(latest_schema):
     return latest_schema["id"]
 
 
+@pytest.fixture(scope="session")
+def latest_archive_uris():
+    """
+    Get the latest archive resource URIs
+    """
+    return _LATEST_ARCHIVE_URIS
+
+
 @pytest.fixture(scope="session", params=_LATEST_ARCHIVE_URIS)
 def latest_archive_uri(request):
     """
@@ -231,7 +269,7 @@ def latest_schemas(latest_dir, latest_paths, latest_uris):
     }
 
 
-@pytest.fixture(scope="session", params=tuple(entry["tag_uri"] for entry in _CURRENT_RESOURCES[_PREVIOUS_DATAMODELS_URI]["tags"]))
+@pytest.fixture(scope="session", params=tuple(get_manifest_index().tags(_PREVIOUS_DATAMODELS_URI)))
 def previous_datamodels_tag(request):
     """
     Get a tag in the previous datamodel
@@ -441,19 +479,20 @@ def ccsp_model_schema(ccsp_model_uri, current_resources):
 
 ### Fixtures for working with the content within the manifests like tags
 @pytest.fixture(scope="session")
-def manifest_entries():
+def manifest_entries(current_resources, manifest_uris):
     """
     Get the manifest entries.
     """
-    return _MANIFEST_ENTRIES
+    return tuple(entry for uri in manifest_uris for entry in current_resources[uri]["tags"])
 
 
-@pytest.fixture(scope="session", params=_MANIFEST_ENTRIES)
-def manifest_entry(request):
+@pytest.fixture(scope="session", params=_MANIFEST_ENTRY_KEYS)
+def manifest_entry(request, current_resources):
     """
     Get an entry from a manifest.
     """
-    return request.param
+    manifest_uri, tag_uri = request.param
+    return next(entry for entry in current_resources[manifest_uri]["tags"] if entry["tag_uri"] == tag_uri)
 
 
 @pytest.fixture(scope="session")
@@ -498,21 +537,21 @@ def tag_schema_map(schema_tag_map):
 
 
 @pytest.fixture(scope="session")
-def datamodel_tag_uris(current_resources, manifest_uris):
+def datamodel_tag_uris(manifest_uris):
     """
     Get the set of all tags defined in any datamodels manifest
     """
-    return frozenset(
-        chain(*[[entry["tag_uri"] for entry in current_resources[uri]["tags"]] for uri in manifest_uris if "static" not in uri])
-    )
+    manifest_index = get_manifest_index()
+    return frozenset(tag_uri for uri in manifest_uris if "static" not in uri for tag_uri in manifest_index.tags(uri))
 
 
 @pytest.fixture(scope="session")
-def tagged_schema_uris(manifest_entries):
+def tagged_schema_uris(manifest_uris):
     """
     Get the tags from the manifest entries.
     """
-    return frozenset(entry["schema_uri"] for entry in manifest_entries)
+    manifest_index = get_manifest_index()
+    return frozenset(schema_uri for uri in manifest_uris for schema_uri in manifest_index.tags(uri).values())
 
 
 @pytest.fixture(scope="session")
@@ -534,11 +573,12 @@ def allowed_schema_tag_validators():
 
 
 @pytest.fixture(scope="session")
-def valid_tag_uris(manifest_entries, allowed_schema_tag_validators):
+def valid_tag_uris(manifest_uris, allowed_schema_tag_validators):
     """
     Get the set of all things that can be used under a tag: keyword
     """
-    uris = set(entry["tag_uri"] for entry in manifest_entries)
+    manifest_index = get_manifest_index()
+    uris = {tag_uri for uri in manifest_uris for tag_uri in manifest_index.tags(uri)}
     uris.update(allowed_schema_tag_validators)
     return frozenset(uris)
 
@@ -546,17 +586,9 @@ def valid_tag_uris(manifest_entries, allowed_schema_tag_validators):
 ### Fixtures for working with reading regex patterns from the schemas
 def _get_latest_uri(prefix):
     """
-    Get the latest exposure type URI.
+    Get the latest URI of a schema.
     """
-    pattern = rf"{prefix}-\d+\.\d+\.\d+$"
-    uris = []
-    for uri in _CURRENT_RESOURCES:
-        if match(pattern, uri):
-            uris.append(uri)
-
-    assert len(uris) > 0, "There should be at least one exposure type URI"
-
-    uri = _find_latest(uris)
+    uri = versions.latest_uri(prefix)
     assert uri in _LATEST_URI_PATHS
 
     return uri
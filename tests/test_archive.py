@@ -0,0 +1,121 @@
+"""
+Test the structured exports of the archive mappings.
+"""
+
+import csv
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+import yaml
+
+from rad._parser import archive_array, archive_entries, archive_records, dump, super_schema
+from rad.versions import latest_uri
+
+_WFI_IMAGE_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_image")
+
+
+def test_archive_records():
+    """
+    Check that the structured archive mappings hold the same information as the strings.
+    """
+    schema = super_schema(_WFI_IMAGE_URI)
+    records = archive_records(schema)
+    entries = archive_entries(schema)
+
+    assert len(records) == len(entries)
+    for record, entry in zip(records, entries, strict=True):
+        path = record.schema_path.removeprefix("meta.")
+        code = "" if record.datatype_code < 0 else f"{record.datatype_code}||"
+        key = "|".join(path.split(".")[-2:][::-1])
+        assert entry == f"{record.archive_meta}|{key}|{record.table}|{record.column}|{code}{record.schema_path}|"
+
+    array = archive_array(records)
+    assert array.dtype.names == records[0]._fields
+    assert tuple(array[0]) == records[0]
+
+
+def test_dump_archive_data(tmp_path):
+    """
+    Check that the archive mappings are dumped as NumPy, CSV, and (if pyarrow is installed) Parquet tables.
+    """
+    parquet = importlib.util.find_spec("pyarrow") is not None
+    output = dump(
+        tmp_path,
+        super_schema=False,
+        archive_json=False,
+        archive_yaml=False,
+        archive_npy=True,
+        archive_csv=True,
+        archive_parquet=parquet,
+    )
+    records = output["archive_records"]
+    assert len(records) == len(output["archive_data"])
+
+    array = np.load(tmp_path / "archive_data.npy", allow_pickle=False)
+    assert [tuple(row) for row in array.tolist()] == records
+
+    with (tmp_path / "archive_data.csv").open(newline="") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == records[0]._fields
+    assert [tuple(row) for row in rows[1:]] == [tuple(map(str, record)) for record in records]
+
+    if parquet:
+        import pyarrow.parquet as pq
+
+        assert [tuple(row.values()) for row in pq.read_table(tmp_path / "archive_data.parquet").to_pylist()] == records
+    else:
+        with pytest.raises(ImportError, match=r"pyarrow is required"):
+            dump(tmp_path, super_schema=False, archive_json=False, archive_yaml=False, archive_parquet=True)
+
+
+def test_dump_unchanged(tmp_path):
+    """
+    Check that a repeated dump only rewrites the outputs whose content changed.
+    """
+    output = dump(tmp_path)
+    assert not {"archive_records", "path_indexes", "load_plans", "destination_index", "sdf_plans"} & output.keys()
+    assert (tmp_path / "archive_schemas.yaml") in output["changed_outputs"]
+    assert len(output["changed_outputs"]) == len(output["super_schemas"]) + 3
+
+    archive_txt = tmp_path / "archive_data.txt"
+    archive_txt.write_text("stale")
+    mtimes = {path: path.stat().st_mtime_ns for path in output["changed_outputs"]}
+
+    assert dump(tmp_path)["changed_outputs"] == [archive_txt]
+    assert all(path.stat().st_mtime_ns == mtime for path, mtime in mtimes.items() if path != archive_txt)
+    assert archive_txt.read_text() == "\n".join(output["archive_data"])
+    assert yaml.safe_load((tmp_path / "archive_schemas.yaml").read_text()) == output["archive_schemas"]
+
+
+_DUMP_SCRIPT = """
+import json, sys
+from pathlib import Path
+
+from rad._parser import dump
+
+output = dump(Path(sys.argv[1]), path_index_json=True, load_plan=True, sdf_plan_json=True)
+print(json.dumps([str(path) for path in output["changed_outputs"]]))
+"""
+
+
+def _dump_subprocess(base_dir, hash_seed):
+    env = {**os.environ, "PYTHONHASHSEED": str(hash_seed)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _DUMP_SCRIPT, str(base_dir)], env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_dump_unchanged_across_processes(tmp_path):
+    """
+    Check that the outputs do not depend on the hash seed of the process, so that
+    dumping again from a fresh process does not rewrite anything.
+    """
+    assert _dump_subprocess(tmp_path, 1)
+    assert _dump_subprocess(tmp_path, 2) == []
+    assert _dump_subprocess(tmp_path, 7) == []
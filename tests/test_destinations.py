@@ -0,0 +1,50 @@
+"""
+Test the reverse index of the archive destinations.
+"""
+
+from rad._parser import archive_records, destination_index, super_schema
+from rad.versions import latest_uri
+
+_WFI_IMAGE_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_image")
+_WFI_SCIENCE_RAW_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_science_raw")
+
+
+def _archived(datatype, destination):
+    return {"archive_catalog": {"datatype": datatype, "destination": [destination]}}
+
+
+def test_destination_index():
+    """
+    Check that every archived data path is found under each of its destinations.
+    """
+    schemas = {uri: super_schema(uri) for uri in (_WFI_IMAGE_URI, _WFI_SCIENCE_RAW_URI)}
+    index = destination_index(schemas)
+
+    for uri, schema in schemas.items():
+        for record in archive_records(schema):
+            assert any(
+                contributor.schema_uri == uri and contributor.archive_meta == record.archive_meta
+                for contributor in index[f"{record.table}.{record.column}"]
+            )
+
+    contributors = index["WFIExposure.exposure_start_time"]
+    assert {contributor.schema_uri for contributor in contributors} == set(schemas)
+    assert {contributor.path for contributor in contributors} == {"meta.exposure.start_time"}
+    assert index.datatypes("WFIExposure.exposure_start_time") == {"datetime2"}
+    assert not index.conflicts
+
+
+def test_destination_index_conflicts():
+    """
+    Check that contributors which disagree on the datatype of a destination are reported.
+    """
+    schemas = {
+        "a": {"archive_meta": "A", "properties": {"x": _archived("float", "T.x"), "y": _archived("int", "T.y")}},
+        "b": {"archive_meta": "B", "properties": {"meta": {"properties": {"x": _archived("nvarchar(10)", "T.x")}}}},
+        "c": {"properties": {"x": _archived("int", "T.x")}},
+    }
+    index = destination_index(schemas)
+
+    assert sorted(index) == ["T.x", "T.y"]
+    assert [(contributor.archive_meta, contributor.path) for contributor in index["T.x"]] == [("A", "x"), ("B", "meta.x")]
+    assert index.conflicts == {"T.x": {"float", "nvarchar(10)"}}
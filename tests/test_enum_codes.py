@@ -0,0 +1,71 @@
+"""
+Test the integer code tables of the enums.
+"""
+
+import numpy as np
+import pytest
+
+from rad._parser import enum_code_tables, enum_codes
+from rad.versions import latest_uri
+
+_ENUM_URI = "asdf://stsci.edu/datamodels/roman/schemas/enums/{}-{}"
+_WFI_IMAGE_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_image")
+
+
+@pytest.mark.parametrize("enum", ["cal_step_flag", "exposure_type", "wfi_detector", "wfi_optical_element"])
+def test_enum_codes_append_only(enum):
+    """
+    Check that the codes of the older versions of an enum are kept by the later versions.
+    """
+    older = enum_codes(_ENUM_URI.format(enum, "1.0.0"))
+    latest = enum_codes(_ENUM_URI.format(enum, "2.0.0"))
+
+    assert latest.values[: len(older)] == older.values
+    assert latest.allowed <= set(latest.values)
+    assert latest.dtype == np.uint8
+
+
+def test_enum_codes_encode():
+    """
+    Check that arrays of values are checked, encoded, and decoded in one call.
+    """
+    codes = enum_codes(_ENUM_URI.format("wfi_detector", "2.0.0"))
+    assert codes.code("WFI01") == 0
+    assert codes.code("WFI18") == 17
+
+    values = np.array(["WFI03", "WFI18", "WFI01", "WFI03"])
+    encoded = codes.encode(values)
+    assert encoded.dtype == np.uint8
+    assert encoded.tolist() == [2, 17, 0, 2]
+    assert (codes.decode(encoded) == values).all()
+
+    assert codes.is_valid(np.array(["WFI19", "WFI02", "", "WFI"])).tolist() == [False, True, False, False]
+    with pytest.raises(ValueError, match=r"\['WFI00', 'WFI19'\] are not values of the enum"):
+        codes.encode(np.array(["WFI01", "WFI19", "WFI00"]))
+
+    with pytest.raises(ValueError, match=r"is not a value of the enum"):
+        codes.code("WFI19")
+
+
+def test_enum_codes_retired():
+    """
+    Check that values dropped from an enum keep their codes, but are no longer valid.
+    """
+    codes = enum_codes(_WFI_IMAGE_URI, "meta.exposure.type")
+    retired = set(codes.values) - codes.allowed
+    assert retired
+
+    assert not codes.is_valid(np.array(sorted(retired))).any()
+    assert {codes.codes[value] for value in codes.allowed} | {codes.codes[value] for value in retired} == set(range(len(codes)))
+
+
+def test_enum_code_tables():
+    """
+    Check that every inline enum of a datamodel is compiled.
+    """
+    tables = enum_code_tables(_WFI_IMAGE_URI)
+    assert tables["meta.instrument.detector"].allowed == enum_codes(_ENUM_URI.format("wfi_detector", "2.0.0")).allowed
+    assert all(table.allowed <= set(table.values) for table in tables.values())
+
+    with pytest.raises(ValueError, match=r"There is no enum at meta\.filename"):
+        enum_codes(_WFI_IMAGE_URI, "meta.filename")
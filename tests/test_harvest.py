@@ -0,0 +1,108 @@
+"""
+Test the harvesting of the archived values from ASDF files.
+"""
+
+import sqlite3
+
+import asdf
+import numpy as np
+import pytest
+from asdf.tagged import TaggedDict, TaggedString
+
+from rad._parser import harvest, harvest_plan, harvest_to_sqlite, super_schema
+from rad._parser._archive import _path_archive
+from rad.versions import latest_uri
+
+_WFI_IMAGE_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_image")
+_WFI_IMAGE_TAG = latest_uri("asdf://stsci.edu/datamodels/roman/tags/wfi_image")
+
+
+@pytest.fixture()
+def wfi_image_file(tmp_path):
+    """
+    A (partial) wfi_image file with some archived values and a data array.
+    """
+    start_time = TaggedString("2020-01-01T00:00:00.000")
+    start_time._tag = "tag:stsci.edu:asdf/time/time-1.2.0"
+    exposure_time = TaggedDict({"value": 60.0, "unit": "s"}, "tag:stsci.edu:asdf/unit/quantity-1.2.0")
+
+    roman = {
+        "meta": {
+            "observation": {"program": 12},
+            "exposure": {"start_time": start_time, "exposure_time": exposure_time},
+        },
+        "data": np.zeros((64, 64), dtype=np.float32),
+    }
+
+    path = tmp_path / "wfi_image.asdf"
+    asdf.AsdfFile({"roman": TaggedDict(roman, _WFI_IMAGE_TAG)}).write_to(path)
+    return path
+
+
+def test_harvest_plan():
+    """
+    Check that the plan covers the same archived fields as the archive entries.
+    """
+    plan = harvest_plan(_WFI_IMAGE_URI)
+
+    assert plan.archive_meta == "Science WFI Level 2"
+    assert {".".join(key for key in field.path if key != "meta") for field in plan.fields} == set(
+        _path_archive(super_schema(_WFI_IMAGE_URI))
+    )
+    assert "WFIExposure.program" in plan.columns
+
+
+def test_harvest(wfi_image_file):
+    """
+    Check that the archived values are harvested from the file, keyed by their destinations.
+    """
+    harvested = harvest(wfi_image_file)
+
+    assert harvested.schema_uri == _WFI_IMAGE_URI
+    assert harvested.row.keys() == set(harvest_plan(_WFI_IMAGE_URI).columns)
+    assert harvested.row["WFIExposure.program"] == 12
+    assert harvested.row["SourceCatalog.program"] == 12
+    assert harvested.row["WFIExposure.exposure_start_time"] == "2020-01-01T00:00:00.000"
+    assert harvested.row["WFIExposure.filename"] is None
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_harvest_to_sqlite(wfi_image_file, tmp_path, max_workers):
+    """
+    Check that the files are harvested into tables named by the destinations, and
+    that harvesting again replaces the rows.
+    """
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "broken.asdf").write_text("not an ASDF file")
+    database = tmp_path / "catalog.sqlite"
+
+    summary = harvest_to_sqlite(tmp_path, database, max_workers=max_workers, batch_size=2)
+    assert summary.files == 1
+    assert summary.rows == len({column.split(".")[0] for column in harvest_plan(_WFI_IMAGE_URI).columns})
+    assert list(summary.errors) == [str(tmp_path / "nested" / "broken.asdf")]
+
+    assert harvest_to_sqlite(tmp_path, database, max_workers=max_workers).rows == summary.rows
+
+    connection = sqlite3.connect(database)
+    try:
+        rows = connection.execute('SELECT "source_file", "program", "exposure_start_time" FROM "WFIExposure"').fetchall()
+        assert rows == [(str(wfi_image_file), 12, "2020-01-01T00:00:00.000")]
+
+        types = {row[1]: row[2] for row in connection.execute('PRAGMA table_info("WFIExposure")')}
+        assert types["program"] == "INTEGER"
+        assert types["exposure_start_time"] == "TEXT"
+    finally:
+        connection.close()
+
+
+def test_harvest_to_sqlite_queue(wfi_image_file, tmp_path):
+    """
+    Check that every file is harvested when there are more files than can be queued at once.
+    """
+    for index in range(10):
+        (tmp_path / f"broken_{index}.asdf").write_text("not an ASDF file")
+
+    summary = harvest_to_sqlite(tmp_path, tmp_path / "catalog.sqlite", max_workers=1)
+    assert summary.files == 1
+    assert sorted(summary.errors) == sorted(str(tmp_path / f"broken_{index}.asdf") for index in range(10))
+    assert all(error.startswith("DelimiterNotFoundError") for error in summary.errors.values())
@@ -0,0 +1,54 @@
+"""
+Test the dotted data path index of the super schemas.
+"""
+
+import json
+
+import pytest
+
+from rad._parser import path_index, super_schema
+from rad.versions import latest_uri
+
+from .test_moc_metadata import REQUIRED, TRUTH
+
+_WFI_IMAGE_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_image")
+
+
+@pytest.fixture(scope="module")
+def wfi_image_index():
+    return path_index(super_schema(_WFI_IMAGE_URI))
+
+
+@pytest.mark.parametrize("path, truth", TRUTH.items())
+def test_path_index_node(wfi_image_index, path, truth):
+    """
+    Check that the indexed nodes agree with the MOC critical metadata.
+    """
+    node = wfi_image_index[path]["node"]
+    for key, value in truth.items():
+        assert (set(node[key]) if isinstance(value, set) else node[key]) == value
+
+
+@pytest.mark.parametrize("path, required", REQUIRED.items())
+def test_path_index_required(wfi_image_index, path, required):
+    """
+    Check that the indexed required flags agree with the MOC critical metadata.
+    """
+    for key in required:
+        assert wfi_image_index[f"{path}.{key}" if path else key]["required"]
+
+
+def test_path_index(wfi_image_index):
+    """
+    Check the datatypes and annotations of the index, and that it can be serialized.
+    """
+    start_time = wfi_image_index["meta.exposure.start_time"]
+    assert start_time["datatype"] == "tag:stsci.edu:asdf/time/time-1.*"
+    assert start_time["archive_catalog"]["datatype"] == "datetime2"
+    assert start_time["sdf"] is not None
+    assert "properties" not in wfi_image_index["meta.exposure"]["node"]
+
+    assert wfi_image_index["data"]["datatype"] == "float32"
+    assert wfi_image_index["meta.observation.program"]["datatype"] == "integer"
+
+    assert json.loads(json.dumps(wfi_image_index)) == wfi_image_index
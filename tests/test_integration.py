@@ -8,7 +8,17 @@ import asdf
 import pytest
 import yaml
 
-from rad import resources
+from rad import resources, tracing
+from rad.integration import (
+    LatestResourceMapping,
+    StrippedResourceMapping,
+    get_resource_mappings,
+    latest_closure,
+    strip_annotations,
+)
+from rad.versions import get_version_index, latest_uri
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def test_manifest_integration(manifest_path, manifest_uris):
@@ -49,3 +59,137 @@ def test_schema_filename(schema_path):
     schema = yaml.safe_load(schema_path.read_bytes())
     id_suffix = str(schema_path.with_suffix("")).split(str(importlib_resources.files(resources)))[-1]
     assert schema["id"].endswith(id_suffix)
+
+
+@pytest.fixture(scope="module")
+def latest_mapping():
+    """
+    The latest-only resource mapping for the RAD resources.
+    """
+    return LatestResourceMapping(importlib_resources.files(resources))
+
+
+def test_latest_resource_mapping(latest_mapping, manifest_uris):
+    """
+    Check that the latest-only mapping registers exactly the latest manifests, and
+    the fallback mapping registers all the others.
+    """
+    registered = {uri for uri in latest_mapping if uri.startswith("asdf://stsci.edu/datamodels/roman/manifests/")}
+    assert registered == {
+        latest_uri(f"asdf://stsci.edu/datamodels/roman/manifests/{family}") for family in ("datamodels", "static")
+    }
+
+    for uri in latest_mapping:
+        assert latest_mapping[uri] == asdf.get_config().resource_manager[uri]
+
+    fallback = latest_mapping.fallback()
+    assert not set(latest_mapping) & set(fallback)
+    assert set(latest_mapping) | set(fallback) == {
+        uri for uri in asdf.get_config().resource_manager if uri.startswith("asdf://stsci.edu/datamodels/roman/")
+    }
+
+    old_uri = "asdf://stsci.edu/datamodels/roman/manifests/datamodels-1.0"
+    assert old_uri not in latest_mapping
+    assert fallback[old_uri] == asdf.get_config().resource_manager[old_uri]
+
+    with pytest.raises(KeyError):
+        fallback["asdf://stsci.edu/datamodels/roman/schemas/SSC/does_not_exist-1.0.0"]
+
+
+def test_latest_only_fallback(monkeypatch):
+    """
+    Check that latest-only mode only registers the latest resources, unless the
+    fallback is enabled so that ASDF can still load the historical schemas.
+    """
+    old_uri = get_version_index().versions("asdf://stsci.edu/datamodels/roman/schemas/wfi_image")[0]
+
+    monkeypatch.setenv("RAD_LATEST_ONLY", "1")
+    monkeypatch.delenv("RAD_LATEST_FALLBACK", raising=False)
+    with asdf.config_context() as config:
+        config.remove_resource_mapping(package="rad")
+        (mapping,) = get_resource_mappings()
+        config.add_resource_mapping(mapping)
+
+        assert old_uri not in config.resource_manager
+
+    monkeypatch.setenv("RAD_LATEST_FALLBACK", "1")
+    with asdf.config_context() as config:
+        config.remove_resource_mapping(package="rad")
+        for mapping in get_resource_mappings():
+            config.add_resource_mapping(mapping)
+
+        assert asdf.schema.load_schema(old_uri, resolve_references=True)["id"] == old_uri
+
+
+def test_latest_closure(latest_mapping):
+    """
+    Check that the precomputed closure shipped with the resources is up to date,
+    and that no resource is read when the latest-only mapping is built from it.
+        -> If this fails, run scripts/latest_closure.py to update the closure.
+    """
+    root = importlib_resources.files(resources)
+    assert list(latest_mapping) == latest_closure(root)
+
+    with tracing.tracing() as tracer:
+        LatestResourceMapping(root)
+
+    assert not [event for event in tracer.spans if event.name == "integration.read_resource"]
+
+
+def test_latest_resource_mapping_closure(latest_mapping):
+    """
+    Check that the schemas of the latest manifests resolve using only the latest-only mapping.
+    """
+    with asdf.config_context() as config:
+        config.remove_resource_mapping(package="rad")
+        config.add_resource_mapping(latest_mapping)
+
+        for uri in latest_mapping:
+            if uri.startswith("asdf://stsci.edu/datamodels/roman/manifests/"):
+                for entry in yaml.safe_load(latest_mapping[uri])["tags"]:
+                    asdf.schema.load_schema(entry["schema_uri"], resolve_references=True)
+
+
+def test_strip_annotations():
+    """
+    Check that only the annotation keywords are stripped.
+    """
+    schema = {
+        "title": "Example",
+        "description": "An example schema",
+        "type": "object",
+        "properties": {
+            "title": {"title": "Title", "type": "string", "enum": [{"description": "kept"}]},
+            "sdf": {"sdf": {"source": {"origin": "TBD"}}, "archive_catalog": {"datatype": "int"}, "type": "integer"},
+        },
+        "allOf": [{"description": "Subschema", "required": ["title"]}],
+    }
+
+    assert strip_annotations(schema) == {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string", "enum": [{"description": "kept"}]},
+            "sdf": {"type": "integer"},
+        },
+        "allOf": [{"required": ["title"]}],
+    }
+    assert schema["title"] == "Example"
+
+
+def test_stripped_resource_mapping():
+    """
+    Check that the stripped mapping serves the stripped schemas and unchanged manifests,
+    while keeping the full view available.
+    """
+    for mapping in get_resource_mappings(stripped=True):
+        assert isinstance(mapping, StrippedResourceMapping)
+        assert set(mapping) == set(mapping.full)
+
+        for uri in mapping:
+            content = asdf.get_config().resource_manager[uri]
+            assert mapping.full[uri] == content
+
+            if uri.startswith("asdf://stsci.edu/datamodels/roman/manifests/"):
+                assert mapping[uri] == content
+            else:
+                assert yaml.load(mapping[uri], Loader=_Loader) == strip_annotations(yaml.load(content, Loader=_Loader))  # noqa: S506
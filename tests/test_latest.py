@@ -38,6 +38,16 @@ class TestLastestResources:
         """
         assert latest_paths
 
+    def test_latest_uri_tables(self, latest_paths, latest_uris, latest_archive_uris):
+        """
+        Check that the tables found from the raw content of the latest resources
+        agree with their parsed content.
+        """
+        assert {path: uri for uri, path in latest_uris.items()} == {path: schema["id"] for path, schema in latest_paths.items()}
+        assert set(latest_archive_uris) == {
+            schema["id"] for schema in latest_paths.values() if isinstance(schema, dict) and "archive_meta" in schema
+        }
+
     def test_archive_meta_uniqueness(self, latest_paths):
         """
         Check that archve_meta is either undefined or unique.
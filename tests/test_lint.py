@@ -0,0 +1,59 @@
+"""
+Test the schema lint engine.
+"""
+
+import pytest
+
+from rad._parser import LINT_RULES, lint_schema
+from rad._parser._lint import LintRule, lint_rule
+
+_BAD_SCHEMA = {
+    "id": "asdf://stsci.edu/datamodels/roman/schemas/bad-1.0.0",
+    "type": "object",
+    "properties": {
+        "data": {"tag": "tag:stsci.edu:asdf/core/ndarray-1.*", "ndim": 2},
+        "name": {"$ref": "asdf://stsci.edu/datamodels/roman/schemas/missing-1.0.0", "title": "Name"},
+        "value": {"type": "number", "maxLength": 3, "default": 1},
+    },
+    "propertyOrder": ["data", "name", "value"],
+    "required": ["data", "other"],
+}
+
+
+def test_lint_schema():
+    """
+    Check that each of the rules reports the expected violation from one run.
+    """
+    violations = {(violation.rule, violation.path) for violation in lint_schema(_BAD_SCHEMA)}
+
+    assert violations == {
+        ("required", "/"),
+        ("exact_datatype", "properties/data"),
+        ("ref_loneliness", "properties/name"),
+        ("absolute_ref", "properties/name"),
+        ("string_max_length", "properties/value"),
+        ("no_default", "properties/value"),
+        ("property_order", "/"),
+    }
+
+
+def test_lint_schema_tagged():
+    """
+    Check that tagged schemas must have flowStyle and can have propertyOrder.
+    """
+    violations = [violation.rule for violation in lint_schema(_BAD_SCHEMA, tagged=True, rules=("property_order", "flowstyle"))]
+
+    assert violations == ["flowstyle"]
+
+
+def test_lint_rule_registry():
+    """
+    Check that rules cannot be registered twice.
+    """
+    assert "required" in LINT_RULES
+
+    with pytest.raises(ValueError, match=r"Lint rule required is already registered"):
+
+        @lint_rule("required")
+        class _Duplicate(LintRule):
+            pass
@@ -0,0 +1,70 @@
+"""
+Test the bulk-load plans of the archive tables.
+"""
+
+import sqlite3
+
+import pytest
+
+from rad._parser import load_plans, path_index, super_schema
+from rad._parser._catalog import sqlite_type
+from rad.versions import latest_uri
+
+_WFI_IMAGE_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_image")
+_WFI_MOSAIC_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_mosaic")
+
+
+@pytest.fixture(scope="module")
+def path_indexes():
+    return {uri: path_index(super_schema(uri)) for uri in (_WFI_IMAGE_URI, _WFI_MOSAIC_URI)}
+
+
+def test_load_plans(path_indexes):
+    """
+    Check that every archived field is planned to be loaded into its destinations.
+    """
+    plans = load_plans(path_indexes)
+    assert list(plans) == sorted(plans)
+
+    for uri, index in path_indexes.items():
+        for info in index.values():
+            if (archive_catalog := info["archive_catalog"]) is None:
+                continue
+
+            for dest in archive_catalog["destination"]:
+                table, column = dest.split(".", 1)
+                assert plans[table].columns[column] == archive_catalog["datatype"]
+                assert column in plans[table].sources[uri]
+
+    manifest = plans["WFIExposure"].manifest()
+    assert manifest["columns"] == list(plans["WFIExposure"].columns)
+    assert len(manifest["sources"][_WFI_IMAGE_URI]) == len(manifest["columns"])
+    assert manifest["sources"][_WFI_IMAGE_URI][manifest["columns"].index("exposure_start_time")] == "meta.exposure.start_time"
+
+
+def test_load_plan_ddl(path_indexes):
+    """
+    Check that the DDL creates the tables with their columns in load order.
+    """
+    assert '"filename" nvarchar(120)' in load_plans(path_indexes)["WFIExposure"].ddl()
+
+    connection = sqlite3.connect(":memory:")
+    try:
+        for table, plan in load_plans(path_indexes).items():
+            connection.execute(plan.ddl(sqlite_type))
+            assert [row[1] for row in connection.execute(f'PRAGMA table_info("{table}")')] == list(plan.columns)
+    finally:
+        connection.close()
+
+
+def test_load_plans_conflicts():
+    """
+    Check that the schemas must agree on the datatypes of the destinations.
+    """
+    path_indexes = {
+        "a": {"x": {"archive_catalog": {"datatype": "float", "destination": ["T.x"]}}},
+        "b": {"y": {"archive_catalog": {"datatype": "nvarchar(10)", "destination": ["T.x", "T.y"]}}},
+    }
+
+    with pytest.raises(ValueError, match=r"T\.x: float, nvarchar\(10\)$"):
+        load_plans(path_indexes)
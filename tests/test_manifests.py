@@ -0,0 +1,92 @@
+"""
+Test the index of the RAD manifests.
+"""
+
+import asdf
+import pytest
+import yaml
+
+from rad.integration import get_resource_mappings
+from rad.manifests import ManifestIndex, get_manifest_index
+
+_MANIFEST_URI = "asdf://stsci.edu/datamodels/roman/manifests/{}"
+_WFI_IMAGE_TAG = "asdf://stsci.edu/datamodels/roman/tags/wfi_image-{}"
+_WFI_IMAGE_URI = "asdf://stsci.edu/datamodels/roman/schemas/wfi_image-{}"
+
+
+def test_manifest_index():
+    """
+    Check that the index covers the tags of every version of the manifests.
+    """
+    index = get_manifest_index()
+    assert get_manifest_index() is index
+
+    resource_manager = asdf.get_config().resource_manager
+    manifest_uris = [uri for uri in resource_manager if uri.startswith(_MANIFEST_URI.format(""))]
+    assert set(index.manifest_uris) == set(manifest_uris)
+    assert _MANIFEST_URI.format("datamodels-1.0") in manifest_uris
+    assert _MANIFEST_URI.format("static-1.0.0") in manifest_uris
+
+    for manifest_uri in manifest_uris:
+        for entry in yaml.safe_load(resource_manager[manifest_uri])["tags"]:
+            assert index.schema_uri(entry["tag_uri"]) == entry["schema_uri"]
+            assert entry["tag_uri"] in index.tag_uris(entry["schema_uri"])
+            assert manifest_uri in index.manifests_of(entry["tag_uri"])
+
+    with pytest.raises(ValueError, match=r"No RAD schema is registered for the tag"):
+        index.schema_uri(_WFI_IMAGE_TAG.format("99.0.0"))
+
+    with pytest.raises(ValueError, match=r"is not a RAD manifest"):
+        index.tags(_MANIFEST_URI.format("datamodels-99.0.0"))
+
+
+def test_manifest_index_datamodel_name():
+    """
+    Check that the datamodel names are found from either the tag or the schema.
+    """
+    index = get_manifest_index()
+
+    assert index.datamodel_name(_WFI_IMAGE_TAG.format("1.0.0")) == "ImageModel"
+    assert index.datamodel_name(_WFI_IMAGE_URI.format("2.1.0")) == "ImageModel"
+    assert index.datamodel_name(index.schema_uri("asdf://stsci.edu/datamodels/roman/tags/exposure-1.0.0")) is None
+
+    with pytest.raises(ValueError, match=r"No RAD tag or tagged schema"):
+        index.datamodel_name("asdf://stsci.edu/datamodels/roman/tags/not_a_tag-1.0.0")
+
+
+def test_manifest_index_resources():
+    """
+    Check that an index can be built over other resources.
+    """
+    manifest = {
+        "tags": [{"tag_uri": "asdf://example.org/tags/thing-1.0.0", "schema_uri": "asdf://example.org/schemas/thing-1.0.0"}]
+    }
+    resources = {
+        _MANIFEST_URI.format("example-1.0.0"): yaml.safe_dump(manifest).encode(),
+        "asdf://example.org/schemas/thing-1.0.0": b"datamodel_name: ThingModel\n",
+    }
+    index = ManifestIndex(resources)
+
+    assert len(index) == 1
+    assert "asdf://example.org/tags/thing-1.0.0" in index
+    assert index.tags(_MANIFEST_URI.format("example-1.0.0")) == {
+        "asdf://example.org/tags/thing-1.0.0": "asdf://example.org/schemas/thing-1.0.0"
+    }
+    assert index.datamodel_name("asdf://example.org/tags/thing-1.0.0") == "ThingModel"
+
+
+def test_get_manifest_index_config():
+    """
+    Check that the shared index follows the resource manager of the ASDF configuration,
+    so an index built for another configuration does not leak into the normal one.
+    """
+    with asdf.config_context() as config:
+        config.remove_resource_mapping(package="rad")
+        for mapping in get_resource_mappings(latest_only=True, fallback=False):
+            config.add_resource_mapping(mapping)
+
+        assert len(get_manifest_index().manifest_uris) == 2
+
+    index = get_manifest_index()
+    assert len(index.manifest_uris) > 2
+    assert index.datamodel_name(_WFI_IMAGE_TAG.format("1.0.0")) == "ImageModel"
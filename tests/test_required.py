@@ -0,0 +1,54 @@
+"""
+Test the required data path sets of the datamodels.
+"""
+
+from rad._parser import missing_paths, required_path_sets, required_paths
+from rad.versions import latest_uri
+
+from .test_moc_metadata import TRUTH
+
+_WFI_IMAGE_TAG = latest_uri("asdf://stsci.edu/datamodels/roman/tags/wfi_image")
+
+
+def _tree(paths):
+    tree = {}
+    for path in paths:
+        node = tree
+        for key in path.split("."):
+            node = node.setdefault(key, {})
+
+    return tree
+
+
+def test_required_paths():
+    """
+    Check that the MOC critical metadata is required, and that every required
+    path is only required under a required parent.
+    """
+    required = required_paths(_WFI_IMAGE_TAG)
+    assert set(TRUTH) <= required
+
+    for path in required:
+        parent = path.rpartition(".")[0]
+        assert not parent or parent in required
+
+
+def test_required_path_sets():
+    """
+    Check that the required paths are compiled for every tag of the latest manifest.
+    """
+    sets = required_path_sets()
+    assert _WFI_IMAGE_TAG in sets
+    assert sets[_WFI_IMAGE_TAG] is required_paths(_WFI_IMAGE_TAG)
+
+
+def test_missing_paths():
+    """
+    Check that the missing required paths of a tree are found.
+    """
+    required = required_paths(_WFI_IMAGE_TAG)
+    tree = _tree(required)
+    assert not missing_paths(_WFI_IMAGE_TAG, tree)
+
+    del tree["meta"]["exposure"]
+    assert missing_paths(_WFI_IMAGE_TAG, tree) == {path for path in required if path.startswith("meta.exposure")}
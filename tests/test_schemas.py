@@ -3,7 +3,6 @@ Test features of the schemas not covered by the metaschema.
 """
 
 from collections.abc import Mapping
-from re import match
 
 import asdf
 import asdf.schema
@@ -11,46 +10,39 @@ import asdf.treeutil
 import pytest
 from crds.config import is_crds_name
 
-METADATA_FORCING_REQUIRED = ("archive_catalog", "sdf")
+from rad._parser import LINT_RULES, LINT_SKIPS, LINT_XFAILS, lint_schema
 
-METADATA_FORCE_XFAILS = (
-    # <resource uri>
-)
+METADATA_FORCE_XFAILS = LINT_XFAILS["metadata_force_required"]
 
-VARCHAR_XFAILS = (
-    # <resource uri>
-    "asdf://stsci.edu/datamodels/roman/schemas/meta/ref_file-2.0.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/meta/program-2.1.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_common-2.1.0",
-)
+VARCHAR_XFAILS = LINT_XFAILS["varchar_length"]
 
 REF_COMMON_XFAILS = ("asdf://stsci.edu/datamodels/roman/schemas/reference_files/skycells-2.0.0",)
 
-ARRAY_TAG_XFAILS = (
-    # <resource uri>
-)
-
-REQUIRED_SKIPS = (
-    "asdf://stsci.edu/datamodels/roman/schemas/wfi_mosaic-1.7.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/wfi_mosaic-2.0.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/wfi_mosaic-2.1.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_catalog_common-1.1.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_catalog_common-2.0.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_catalog_common-2.1.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/multiband_source_catalog-1.2.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/multiband_source_catalog-2.0.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/multiband_source_catalog-2.1.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/CCSP/EXAMPLE/example_custom_product-1.1.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/CCSP/EXAMPLE/example_custom_product-2.0.0",
-)
-
-NESTED_REQUIRED_SKIPS = (
-    "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_common-1.1.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_common-2.0.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/meta/l3_common-2.1.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/CCSP/ccsp_custom_product-1.1.0",
-    "asdf://stsci.edu/datamodels/roman/schemas/CCSP/ccsp_custom_product-2.0.0",
-)
+ARRAY_TAG_XFAILS = LINT_XFAILS["array_tag"]
+
+REQUIRED_SKIPS = LINT_SKIPS["required"]
+
+NESTED_REQUIRED_SKIPS = LINT_SKIPS["metadata_force_required"]
+
+
+@pytest.fixture(scope="session")
+def schema_lint(schema_uri, schema, tagged_schema_uris):
+    """
+    Get the lint violations for a schema grouped by lint rule
+    -> The fixture is session scoped, so each schema is only traversed once for all the lint based tests
+    """
+    violations = {name: [] for name in LINT_RULES}
+    for violation in lint_schema(schema, uri=schema_uri, tagged=schema_uri in tagged_schema_uris):
+        violations[violation.rule].append(violation)
+
+    return violations
+
+
+def _messages(violations):
+    """
+    Format the lint violations for an assertion message
+    """
+    return "\n".join(f"{violation.path}: {violation.message}" for violation in violations)
 
 
 class TestSchemaContent:
@@ -77,48 +69,20 @@ class TestSchemaContent:
         assert b"\t" not in current_content
         assert not any(line != line.rstrip() for line in current_content.split(b"\n"))
 
-    def test_required(self, schema):
+    def test_required(self, schema, schema_lint):
         """
         Checks that all required properties are present in the schema
         """
         if schema["id"] in REQUIRED_SKIPS:
             pytest.skip(f"skipped required keyword test for {schema['id']}")
 
-        def callback(node):
-            """Callback for required properties being present"""
-            if isinstance(node, Mapping) and "required" in node:
-                assert node.get("type", "object") == "object"
-                property_names = set(node.get("properties", {}).keys())
-                required_names = set(node["required"])
-                if not required_names.issubset(property_names):
-                    message = f"required references names that do not exist: {','.join(required_names - property_names)}"
-                    raise ValueError(message)
-
-        asdf.treeutil.walk(schema, callback)
+        assert not schema_lint["required"], _messages(schema_lint["required"])
 
-    def test_exact_datatype(self, schema):
+    def test_exact_datatype(self, schema_lint):
         """Confirm that `datatype` and `exact_datatype` is defined for all arrays"""
+        assert not schema_lint["exact_datatype"], _messages(schema_lint["exact_datatype"])
 
-        def callback_ndarray(node, entry):
-            """
-            Identify and check ndarray nodes (entry passed in for error messages)
-            """
-            if isinstance(node, Mapping) and "tag" in node and node["tag"].startswith("tag:stsci.edu:asdf/core/ndarray-"):
-                assert "datatype" in node, f"datatype not found for ndarray entry {entry}"
-                assert "exact_datatype" in node, f"exact_datatype not found for ndarray entry {entry}"
-                assert node["exact_datatype"] is True, f"exact_datatype not True for ndarray entry {entry}"
-
-        def callback(node):
-            """
-            Identify and check all nodes, note that we loop over the entries for better error messages
-            """
-            if isinstance(node, Mapping):
-                for entry, sub_node in node.items():
-                    callback_ndarray(sub_node, entry)
-
-        asdf.treeutil.walk(schema, callback)
-
-    def test_array_tag(self, schema_uri, schema, request):
+    def test_array_tag(self, schema_uri, schema_lint, request):
         """
         Any schema using ndim, datatype, etc also has an array tag
         """
@@ -131,23 +95,7 @@ class TestSchemaContent:
                 )
             )
 
-        def callback(node):
-            if not isinstance(node, dict):
-                return
-            if "destination" in node:
-                # don't check archive_catalog entries
-                return
-            if "byteorder" in node:
-                # don't check sub-dtypes
-                return
-            if isinstance(node.get("datatype"), dict):
-                # table (and old quantity containing) schemas use datatype in a different way
-                return
-            if any(k in node for k in ("ndim", "datatype", "exact_datatype")):
-                tag = node.get("tag", "")
-                assert tag.startswith("tag:stsci.edu:asdf/core/ndarray-")
-
-        asdf.treeutil.walk(schema, callback)
+        assert not schema_lint["array_tag"], _messages(schema_lint["array_tag"])
 
     @pytest.mark.parametrize("uri", ARRAY_TAG_XFAILS)
     def test_array_tag_xfail_relevant(self, uri, schema_uris):
@@ -157,52 +105,25 @@ class TestSchemaContent:
         """
         assert uri in schema_uris, f"{uri} is not in the list of schemas to be tested."
 
-    def test_ref_loneliness(self, schema):
+    def test_ref_loneliness(self, schema_lint):
         """
         An object with a $ref should contain no other items
         """
+        assert not schema_lint["ref_loneliness"], _messages(schema_lint["ref_loneliness"])
 
-        def callback(node):
-            if not isinstance(node, dict):
-                return
-            if "$ref" not in node:
-                return
-            assert len(node) == 1
-
-        asdf.treeutil.walk(schema, callback)
-
-    def test_no_default(self, schema):
+    def test_no_default(self, schema_lint):
         """
         Test that schemas do not contain the default keyword
         """
+        assert not schema_lint["no_default"], _messages(schema_lint["no_default"])
 
-        for node in asdf.treeutil.iter_tree(schema):
-            if isinstance(node, dict):
-                assert "default" not in node
-
-    def test_absolute_ref(self, schema):
+    def test_absolute_ref(self, schema_lint):
         """
         Test that all $ref are absolute URIs matching those registered with ASDF
         """
-        resources = asdf.config.get_config().resource_manager
-
-        def callback(node):
-            if not isinstance(node, dict):
-                return
-            if "$ref" not in node:
-                return
+        assert not schema_lint["absolute_ref"], _messages(schema_lint["absolute_ref"])
 
-            # Check that the $ref is a full URI registered with ASDF
-            ref_uri = node["$ref"]
-
-            # remove a fragment if it exists
-            if "#" in ref_uri:
-                ref_uri, _ = ref_uri.split("#", maxsplit=1)
-            assert ref_uri in resources
-
-        asdf.treeutil.walk(schema, callback)
-
-    def test_metadata_force_required(self, schema_uri, schema, request):
+    def test_metadata_force_required(self, schema_uri, schema_lint, request):
         """
         Test that if certain properties have certain metadata entries, that they are in a required list.
         -> Also checks that once required is present in a subnode it is present in the parent node for mappings
@@ -218,21 +139,7 @@ class TestSchemaContent:
         if schema_uri in NESTED_REQUIRED_SKIPS:
             pytest.skip(f"skipping nested required keyword test for {schema_uri}")
 
-        def callback(node):
-            if isinstance(node, Mapping) and "properties" in node:
-                for prop_name, prop in node["properties"].items():
-                    # Test that if a subnode has a required list, that the parent has a required list
-                    if isinstance(prop, Mapping) and "required" in prop:
-                        assert "required" in node
-                        assert prop_name in node["required"]
-
-                    # Test that if a subnode has certain metadata entries, that the parent has a required list
-                    for metadata in METADATA_FORCING_REQUIRED:
-                        if isinstance(prop, Mapping) and metadata in prop:
-                            assert "required" in node, f"metadata {metadata} in {prop_name} requires required list"
-                            assert prop_name in node["required"]
-
-        asdf.treeutil.walk(schema, callback)
+        assert not schema_lint["metadata_force_required"], _messages(schema_lint["metadata_force_required"])
 
     @pytest.mark.parametrize("uri", METADATA_FORCE_XFAILS)
     def test_metadata_force_xfail_relevant(self, uri, latest_uris):
@@ -242,18 +149,13 @@ class TestSchemaContent:
         """
         assert uri in latest_uris, f"{uri} is not in the list of schemas to be tested."
 
-    def test_string_max_length(self, schema):
+    def test_string_max_length(self, schema_lint):
         """
         Checks that if a `maxLength` is specified, that it is specified along with a `type` of `string`.
         """
+        assert not schema_lint["string_max_length"], _messages(schema_lint["string_max_length"])
 
-        def callback(node):
-            if isinstance(node, Mapping) and "maxLength" in node:
-                assert node.get("type") == "string", "maxLength is only valid for strings"
-
-        asdf.treeutil.walk(schema, callback)
-
-    def test_varchar_length(self, schema_uri, schema, request):
+    def test_varchar_length(self, schema_uri, schema_lint, request):
         """
         Test that varchar(N) in archive_metadata for string objects
         has a matching maxLength: N validation keyword
@@ -262,65 +164,7 @@ class TestSchemaContent:
         if schema_uri in VARCHAR_XFAILS:
             request.applymarker(pytest.mark.xfail(reason=f"{schema_uri} not checked for maxLength/varchar consistency."))
 
-        def callback(node):
-            if (
-                isinstance(node, Mapping)
-                and "archive_catalog" in node
-                and node["archive_catalog"]["datatype"].startswith("nvarchar(")
-            ):
-                m = match(r"^nvarchar\(([0-9]+)\)$", node["archive_catalog"]["datatype"])
-                if m:
-                    length = int(m.group(1))
-
-                    def check_max_length(node):
-                        nonlocal found
-                        nonlocal ref_uri
-                        if isinstance(node, Mapping) and "enum" in node:
-                            max_enum_length = max(len(v) for v in node["enum"])
-                            assert max_enum_length <= length, (
-                                f"archive_catalog.datatype nvarchar indicates maxLength={length}, but enum of length {max_enum_length} found."
-                            )
-                            found = True
-                            return
-                        if isinstance(node, Mapping) and "type" in node:
-                            if node["type"] == "string":
-                                msg = "archive_catalog.datatype nvarchar indicates maxLength is required"
-                                msg += f" in schema {ref_uri}" if ref_uri else ""
-                                msg += ", but it is not present"
-                                assert "maxLength" in node, msg
-                                assert node["maxLength"] == length, (
-                                    f"archive_catalog.datatype nvarchar indicates maxLength={length}, but found {node['maxLength']}."
-                                )
-                                found = True
-
-                            # Arrays may have a nvarchar described for archive, but they don't have a maxLength
-                            # json-schema descriptor so we assume that we found maxLength
-                            elif node["type"] == "array":
-                                found = True
-
-                    if "type" in node:
-                        found = False
-                        ref_uri = None
-                        asdf.treeutil.walk(node, check_max_length)
-                        assert found, "archive_catalog.datatype nvarchar indicates maxLength is required, none is found"
-                        return
-
-                    if "allOf" in node or "anyOf" in node:
-                        for sub_schema in node.get("allOf", []) + node.get("anyOf", []):
-                            if isinstance(sub_schema, Mapping):
-                                found = False
-                                ref_uri = sub_schema.get("$ref")
-                                sub_node = asdf.schema.load_schema(sub_schema["$ref"]) if "$ref" in sub_schema else sub_schema
-                                asdf.treeutil.walk(sub_node, check_max_length)
-                                assert found, (
-                                    f"archive_catalog.datatype nvarchar indicates there should be a maxLength in {sub_schema['$ref']}"
-                                )
-                                return
-
-                    # Fallback failure
-                    raise AssertionError("archive_catalog.datatype is nvarchar but no maxLength found.")
-
-        asdf.treeutil.walk(schema, callback)
+        assert not schema_lint["varchar_length"], _messages(schema_lint["varchar_length"])
 
     @pytest.mark.parametrize("uri", VARCHAR_XFAILS)
     def test_varchar_xfail_relevant(self, uri, latest_uris):
@@ -370,61 +214,18 @@ class TestTaggedSchemaContent:
 
         asdf.treeutil.walk(schema, callback)
 
-    def test_property_order(self, schema_uri, schema, tagged_schema_uris):
+    def test_property_order(self, schema_lint):
         """
         Check that the propertyOrder is consistent with the properties and is only used in the tag schemas
         """
-        if schema_uri in tagged_schema_uris:
-
-            def callback(node):
-                """Callback for tagged schemas"""
-                if isinstance(node, Mapping) and "propertyOrder" in node:
-                    assert node.get("type") == "object"
-                    property_names = set(node.get("properties", {}).keys())
-                    property_order_names = set(node["propertyOrder"])
-                    if property_order_names != property_names:
-                        missing_list = ", ".join(property_order_names - property_names)
-                        extra_list = ", ".join(property_names - property_order_names)
-                        message = (
-                            "propertyOrder does not match list of properties:\n\n"
-                            "missing properties: " + missing_list + "\n"
-                            "extra properties: " + extra_list
-                        )
-                        raise ValueError(message)
-        else:
-
-            def callback(node):
-                """Callback for non-tagged schemas"""
-                if isinstance(node, Mapping):
-                    assert "propertyOrder" not in node, "Only schemas associated with a tag may specify propertyOrder"
-
-        asdf.treeutil.walk(schema, callback)
+        assert not schema_lint["property_order"], _messages(schema_lint["property_order"])
 
-    def test_flowstyle(self, schema_uri, schema, tagged_schema_uris):
+    def test_flowstyle(self, schema_lint):
         """
         Test that tagged schemas have flowStyle: block
         -> untagged schemas should not have flowStyle
         """
-        if schema_uri in tagged_schema_uris:
-            found_flowstyle = False
-
-            def callback(node):
-                """Callback for tagged schemas"""
-                nonlocal found_flowstyle
-                if isinstance(node, Mapping) and node.get("flowStyle") == "block":
-                    found_flowstyle = True
-
-            asdf.treeutil.walk(schema, callback)
-
-            assert found_flowstyle, "Schemas associated with a tag must specify flowStyle: block"
-        else:
-
-            def callback(node):
-                """Callback for non-tagged schemas"""
-                if isinstance(node, Mapping):
-                    assert "flowStyle" not in node, "Only schemas associated with a tag may specify flowStyle"
-
-            asdf.treeutil.walk(schema, callback)
+        assert not schema_lint["flowstyle"], _messages(schema_lint["flowstyle"])
 
     def test_datamodel_name(self, schema_uri, schema):
         def callback(node):
@@ -0,0 +1,57 @@
+"""
+Test the compiled SDF source-mapping plans.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from rad._parser import path_index, sdf_plan, super_schema
+from rad._parser._sdf import SDFPlan, SourceField
+from rad.versions import latest_uri
+
+_WFI_SCIENCE_RAW_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_science_raw")
+
+
+def test_sdf_plan():
+    """
+    Check that the plan has a field for every sdf annotation of the datamodel.
+    """
+    plan = sdf_plan(_WFI_SCIENCE_RAW_URI)
+    assert sdf_plan(_WFI_SCIENCE_RAW_URI) is plan
+
+    index = path_index(super_schema(_WFI_SCIENCE_RAW_URI))
+    sdfs = {path: info["sdf"] for path, info in index.items() if info["sdf"] is not None}
+    assert [field.path for field in plan.fields] == list(sdfs)
+    for field in plan.fields:
+        assert field.origin == sdfs[field.path]["source"]["origin"]
+        assert field.required == (sdfs[field.path]["special_processing"] == "VALUE_REQUIRED")
+
+    assert SDFPlan.from_dict(json.loads(json.dumps(plan.to_dict()))) == plan
+
+
+def test_sdf_plan_apply():
+    """
+    Check that a plan fills its fields from a batch of source values.
+    """
+    plan = SDFPlan(
+        "uri",
+        (
+            SourceField("meta.a", "PSS:a", None, True),
+            SourceField("meta.b", "PSS:b", "double", False),
+            SourceField("meta.c", "PSS:c", None, False),
+        ),
+    )
+    records = {"PSS:a": np.array([1, 2, 3]), "PSS:b": np.array([4, 5, 6])}
+
+    values = plan.apply(records, {"double": lambda column: column * 2})
+    assert list(values) == ["meta.a", "meta.b"]
+    assert (values["meta.a"] == records["PSS:a"]).all()
+    assert (values["meta.b"] == [8, 10, 12]).all()
+
+    with pytest.raises(ValueError, match=r"functions are not given: double"):
+        plan.apply(records)
+
+    with pytest.raises(ValueError, match=r"required fields: meta\.a"):
+        plan.apply({"PSS:b": records["PSS:b"]}, {"double": lambda column: column * 2})
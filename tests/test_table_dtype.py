@@ -0,0 +1,60 @@
+"""
+Test the NumPy dtypes compiled from the catalog table schemas.
+"""
+
+import numpy as np
+import pytest
+
+from rad._parser import table_dtype
+from rad.versions import latest_uri
+
+_TABLE_URI = "asdf://stsci.edu/datamodels/roman/schemas/tables/{}"
+
+
+@pytest.mark.parametrize("table", ["forced_catalog_table", "multiband_catalog_table", "prompt_catalog_table"])
+def test_table_dtype(table):
+    """
+    Check that every column of a table is compiled, and that the fixed columns make up the default dtype.
+    """
+    uri = latest_uri(_TABLE_URI.format(table))
+    compiled = table_dtype(uri)
+    assert table_dtype(uri) is compiled
+    assert compiled.columns
+
+    dtype = compiled.dtype()
+    names = [column.name for column in compiled.columns if column.name is not None]
+    assert list(dtype.names) == names
+    for column in compiled.columns:
+        if column.name is not None:
+            assert dtype[column.name] == np.dtype("bool" if column.datatype == "bool8" else column.datatype)
+
+    assert set(compiled.units()) == set(names)
+    assert compiled.empty(3).shape == (3,)
+
+
+def test_table_dtype_patterns():
+    """
+    Check that the columns named by a pattern are matched by their pattern.
+    """
+    compiled = table_dtype(latest_uri(_TABLE_URI.format("multiband_catalog_table")))
+
+    dtype = compiled.dtype(["label", "kron_f158_flux", "aper02_f062_flux_err", "is_extended_f213"])
+    assert dtype.names == ("label", "kron_f158_flux", "aper02_f062_flux_err", "is_extended_f213")
+    assert [dtype[name] for name in dtype.names] == [
+        np.dtype("int32"),
+        np.dtype("float32"),
+        np.dtype("float32"),
+        np.dtype("bool"),
+    ]
+    assert compiled.units(["kron_f158_flux"]) == {"kron_f158_flux": "nJy"}
+
+    with pytest.raises(ValueError, match=r"no column matching kron_f999_flux"):
+        compiled.dtype(["kron_f999_flux"])
+
+
+def test_table_dtype_columns_definitions():
+    """
+    Check that a schema which only defines the columns for the tables is not compiled.
+    """
+    with pytest.raises(ValueError, match=r"specifies no columns"):
+        table_dtype(latest_uri(_TABLE_URI.format("source_catalog_columns")))
@@ -0,0 +1,80 @@
+"""
+Test the opt-in tracing of rad.
+"""
+
+import json
+
+import asdf
+
+from rad import tracing
+from rad._parser import archive_entries, dump, super_schema
+from rad.integration import StrippedResourceMapping
+from rad.versions import latest_uri
+
+_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_image")
+
+
+def test_disabled():
+    """
+    Check that spans record nothing when tracing is disabled.
+    """
+    assert tracing.get_tracer() is None
+
+    with tracing.span("test", uri=_URI) as event:
+        event.bytes = 10
+        event.set(entries=1)
+
+    assert event.duration == 0
+
+
+def test_tracing(tmp_path):
+    """
+    Check that the traced operations are recorded and exported.
+    """
+    json_path = tmp_path / "trace.json"
+    chrome_path = tmp_path / "trace.chrome.json"
+
+    with tracing.tracing(json_path) as tracer:
+        archive_entries(super_schema(_URI))
+
+    assert tracing.get_tracer() is None
+    tracer.write(chrome_path, "chrome")
+
+    summary = tracer.summary()
+    assert {"super_schema.load_schema", "super_schema.merge_all_of", "archive_entries"} <= set(summary)
+    assert summary["super_schema.load_schema"]["count"] == 1
+
+    trace = json.loads(json_path.read_text())
+    assert trace["summary"] == json.loads(json.dumps(summary))
+    assert len(trace["events"]) == len(tracer.spans)
+
+    chrome = json.loads(chrome_path.read_text())
+    assert {event["ph"] for event in chrome["traceEvents"]} == {"X"}
+
+
+def test_dump_timings(tmp_path):
+    """
+    Check that dump returns the structured per-URI timings of the active tracer.
+    """
+    with tracing.tracing() as tracer:
+        output = dump(tmp_path, super_schema=False, archive_json=False, archive_yaml=False, archive_txt=False)
+
+    timings = output["timings"]
+    assert set(timings) == {event.args["uri"] for event in tracer.spans if event.name == "process"}
+    assert all(timing.duration > 0 for timing in timings.values())
+    assert {"super_schema", "archive"} <= {product for timing in timings.values() for product in timing.products}
+
+    assert "timings" not in dump(tmp_path, super_schema=False, archive_json=False, archive_yaml=False, archive_txt=False)
+
+
+def test_strip_annotations_bytes():
+    """
+    Check that the strip span records the bytes read, like the other spans, and the bytes saved separately.
+    """
+    full = {_URI: asdf.get_config().resource_manager[_URI]}
+    with tracing.tracing() as tracer:
+        StrippedResourceMapping(full)[_URI]
+
+    (event,) = (event for event in tracer.spans if event.name == "integration.strip_annotations")
+    assert event.bytes == len(full[_URI])
+    assert 0 < event.args["saved"] < event.bytes
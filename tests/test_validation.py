@@ -0,0 +1,232 @@
+"""
+Test the reusable validators for the RAD schemas.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import asdf.schema
+import pytest
+from asdf.exceptions import ValidationError
+from astropy.time import Time
+
+from rad.validation import (
+    ValidatorCache,
+    expand_pattern,
+    expand_pattern_properties,
+    get_validator_cache,
+    pattern_keys,
+    subtree_schema,
+)
+from rad.versions import latest_uri
+
+_CAL_LOGS_TAG = latest_uri("asdf://stsci.edu/datamodels/roman/tags/cal_logs")
+_DATAMODELS_MANIFEST_URI = latest_uri("asdf://stsci.edu/datamodels/roman/manifests/datamodels")
+_WFI_IMAGE_URI = latest_uri("asdf://stsci.edu/datamodels/roman/schemas/wfi_image")
+
+
+def test_validator_cache():
+    """
+    Check that validators are built once, and validate against the tag's schema.
+    """
+    cache = ValidatorCache()
+
+    validator = cache.get(_CAL_LOGS_TAG)
+    assert cache.get(_CAL_LOGS_TAG) is validator
+
+    cache.validate(_CAL_LOGS_TAG, ["a log message"])
+    with pytest.raises(ValidationError):
+        cache.validate(_CAL_LOGS_TAG, [1])
+
+    with pytest.raises(ValueError, match=r"No RAD schema is registered for the tag"):
+        cache.get("asdf://stsci.edu/datamodels/roman/tags/not_a_tag-1.0.0")
+
+
+def test_validator_cache_lru():
+    """
+    Check that the least recently used validator is evicted.
+    """
+    cache = ValidatorCache(maxsize=2)
+    tags = [latest_uri(f"asdf://stsci.edu/datamodels/roman/tags/{name}") for name in ("cal_logs", "exposure", "guidestar")]
+
+    cache.get(tags[0])
+    cache.get(tags[1])
+    cache.get(tags[0])
+    cache.get(tags[2])
+
+    assert tags[0] in cache
+    assert tags[1] not in cache
+    assert len(cache) == 2
+
+
+def test_validator_cache_warm():
+    """
+    Check that warming builds a validator for every tag of the manifest, once,
+    and only up to the size of the cache.
+    """
+    cache = ValidatorCache()
+
+    built = cache.warm(_DATAMODELS_MANIFEST_URI)
+    assert built == len(cache)
+    assert cache.warm(_DATAMODELS_MANIFEST_URI) == 0
+
+    small = ValidatorCache(maxsize=2)
+    assert small.warm(_DATAMODELS_MANIFEST_URI) == 2
+    assert len(small) == 2
+
+
+def test_validator_cache_threads():
+    """
+    Check that the threads share the validators.
+    """
+    cache = get_validator_cache()
+    assert get_validator_cache() is cache
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        validators = list(executor.map(lambda _: cache.get(_CAL_LOGS_TAG), range(8)))
+        list(executor.map(lambda _: cache.validate(_CAL_LOGS_TAG, ["message"]), range(8)))
+
+    assert all(validator is validators[0] for validator in validators)
+
+
+def test_validator_cache_concurrent_validation():
+    """
+    Check that validations from many threads get the right results, without
+    changing the validator classes ASDF shares with the rest of the process.
+    """
+    cache = ValidatorCache()
+
+    def validate(index):
+        instance = ["message"] * 100 if index % 2 else ["message", index]
+        try:
+            cache.validate(_CAL_LOGS_TAG, instance)
+        except ValidationError:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(validate, range(64)))
+
+    assert results == [bool(index % 2) for index in range(64)]
+    assert type(cache.get(_CAL_LOGS_TAG)._context).__module__ == "asdf.schema"
+
+
+def _exposure():
+    """
+    A valid exposure subtree for the latest schemas.
+    """
+    return {
+        "type": "WFI_IMAGE",
+        "start_time": Time("2020-01-01T00:00:00.0", format="isot", scale="utc"),
+        "end_time": Time("2020-01-01T01:00:00.0", format="isot", scale="utc"),
+        "engineering_quality": "OK",
+        "nresultants": 6,
+        "data_problem": None,
+        "frame_time": 3.04,
+        "exposure_time": 60.0,
+        "effective_exposure_time": 55.0,
+        "ma_table_name": "High Latitude Imaging Survey",
+        "ma_table_number": 1,
+        "ma_table_id": "1",
+        "read_pattern": [[1], [2, 3], [4]],
+        "truncated": False,
+        "hga_move": False,
+    }
+
+
+def test_subtree_schema():
+    """
+    Check that the subtree schema follows the path and only keeps the validation keywords.
+    """
+    schema = subtree_schema(_WFI_IMAGE_URI, "meta.exposure")
+
+    assert schema["properties"]["nresultants"] == {"type": "integer"}
+    assert "title" not in schema
+    assert "archive_catalog" not in schema["properties"]["nresultants"]
+
+    with pytest.raises(ValueError, match=r"meta.not_a_key is not a subtree of the schema"):
+        subtree_schema(_WFI_IMAGE_URI, "meta.not_a_key")
+
+
+def test_validate_subtree():
+    """
+    Check that a subtree is validated against just that part of the schema.
+    """
+    cache = ValidatorCache()
+
+    exposure = _exposure()
+    cache.validate_subtree(_WFI_IMAGE_URI, "meta.exposure", exposure)
+    assert cache.get_subtree(_WFI_IMAGE_URI, "meta.exposure") is cache.get_subtree(_WFI_IMAGE_URI, "meta.exposure")
+
+    exposure["nresultants"] = "six"
+    with pytest.raises(ValidationError):
+        cache.validate_subtree(_WFI_IMAGE_URI, "meta.exposure", exposure)
+
+    del exposure["nresultants"]
+    with pytest.raises(ValidationError):
+        cache.validate_subtree(_WFI_IMAGE_URI, "meta.exposure", exposure)
+
+
+@pytest.mark.parametrize(
+    "pattern, keys",
+    [
+        (r"^WFI(0[1-9]|1[0-8])$", {f"WFI{i:02d}" for i in range(1, 19)}),
+        (r"^science_channel_(0[1-9]|[1-2][0-9]|3[0-2])$", {f"science_channel_{i:02d}" for i in range(1, 33)}),
+        (r"^(F062|F087|DARK)$", {"F062", "F087", "DARK"}),
+        (r"^a[bc]{1,2}$", {"ab", "ac", "abb", "abc", "acb", "acc"}),
+        (r"^GW([0-9]{4})$", None),
+        (r"^[a-z]+$", None),
+        (r"^(?i:wfi)$", None),
+        (r"WFI01", None),
+        (r"^WFI|GW$", None),
+        (r"\AWFI0[1-3]\Z", {"WFI01", "WFI02", "WFI03"}),
+        (r"^a\.(?:b|c)?$", {"a.", "a.b", "a.c"}),
+        (r"^\d$", None),
+    ],
+)
+def test_expand_pattern(pattern, keys):
+    """
+    Check that only the patterns matching a finite set of keys are expanded, and exactly.
+    """
+    assert expand_pattern(pattern) == keys
+    if keys is not None:
+        assert all(re.fullmatch(pattern, key) for key in keys)
+
+
+def test_expand_pattern_properties():
+    """
+    Check that the finite patternProperties are rewritten as properties, without changing what is valid.
+    """
+    schema = {
+        "type": "object",
+        "properties": {"WFI01": {"required": ["a"]}, "patternProperties": {"type": "string"}},
+        "patternProperties": {"^WFI(0[1-9]|1[0-8])$": {"type": "object"}, "^GW[0-9]{4}$": {"type": "integer"}},
+        "additionalProperties": False,
+    }
+    expanded = expand_pattern_properties(schema)
+
+    assert expanded["patternProperties"] == {"^GW[0-9]{4}$": {"type": "integer"}}
+    assert expanded["properties"]["WFI01"] == {"allOf": [{"required": ["a"]}, {"type": "object"}]}
+    assert expanded["properties"]["WFI18"] == {"type": "object"}
+    assert expanded["properties"]["patternProperties"] == {"type": "string"}
+    assert schema["properties"]["WFI01"] == {"required": ["a"]}
+    assert len(schema["patternProperties"]) == 2
+
+    keys = pattern_keys(schema)
+    assert keys.keys == {f"WFI{i:02d}" for i in range(1, 19)}
+    assert keys.match("GW0001")
+    assert not keys.match("WFI19")
+    assert keys.match("WFI01\n")
+
+    for instance, valid in [
+        ({"WFI01": {"a": 1}, "WFI02": {}, "GW0001": 1}, True),
+        ({"WFI01": {}}, False),
+        ({"WFI02": 1}, False),
+        ({"WFI19": {}}, False),
+        ({"GW0001": "a"}, False),
+        ({"WFI01\n": {}}, True),
+        ({"WFI01\n": 1}, False),
+    ]:
+        for candidate in (schema, expanded):
+            validator = asdf.schema.get_validator(candidate)
+            assert validator.is_valid(instance) == valid
@@ -39,11 +39,12 @@ from re import findall
 from tomllib import load
 
 import pytest
-import yaml
 from asdf.treeutil import walk_and_modify
 from git import Repo
 from semantic_version import Version
 
+from ._snapshot import SNAPSHOT, shared
+
 # Using a python library load the actual RAD repository data into python
 # object which can be interacted with.
 REPO_PATH = Path(__file__).parent.parent
@@ -154,7 +155,8 @@ def _get_versions():
 
 
 # Read out all the versioins for RAD.
-_VERSIONS = _get_versions()
+#   shared so that the tags are only fetched once when running with pytest-xdist
+_VERSIONS = shared("versions", _get_versions)
 
 
 @pytest.fixture(scope="module")
@@ -275,7 +277,7 @@ def _get_frozen_schemas(version):
     for blob in release.tree.traverse(predicate=predicate):
         # Read the file blob directly from the git history corresponding to the
         # to the release version's commit
-        data = BytesIO(blob.data_stream.read()).read().decode("utf-8")
+        content = BytesIO(blob.data_stream.read()).read()
 
         # Check that the file has the %YAML 1.1 header, which is required for
         # (and tested for) the RAD schemas.
@@ -284,8 +286,8 @@ def _get_frozen_schemas(version):
         # the symlink data as text that is a relateive path to the file linked to
         # meaning that GitPython will simply return a string containing that relative
         # path. These do not have the %YAML 1.1 header, so we can use that to filter
-        if data.startswith("%YAML 1.1"):
-            schema = yaml.safe_load(data)
+        if content.startswith(b"%YAML 1.1"):
+            schema = SNAPSHOT.parse_content(content)
             schemas[schema["id"]] = filter_ignored_keys(schema)
 
     # Sort the schemas by their URI
@@ -322,7 +324,8 @@ def _get_frozen_schemas_for_all_versions():
 
 
 # Get all the frozen schema information and the set of frozen schema URIs
-_FROZEN_VERSIONS, _FROZEN_URIS = _get_frozen_schemas_for_all_versions()
+#   shared so that the git history is only scanned once when running with pytest-xdist
+_FROZEN_VERSIONS, _FROZEN_URIS = shared("frozen", _get_frozen_schemas_for_all_versions)
 
 
 @pytest.fixture(scope="module")
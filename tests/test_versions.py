@@ -0,0 +1,124 @@
+"""
+Test the sorted version indexes of the tag and schema URIs.
+"""
+
+import asdf
+import pytest
+from asdf.util import uri_match
+from semantic_version import Version
+
+from rad.versions import VersionIndex, get_version_index, latest_uri, parse_version, split_uri
+
+_URIS = [
+    "tag:example.org:thing-1.0.0",
+    "tag:example.org:thing-1.10.0",
+    "tag:example.org:thing-1.2.0",
+    "tag:example.org:thing-2.0.0",
+    "tag:example.org:thing-10.0.0",
+    "tag:example.org:thing-step-1.0.0",
+    "tag:example.org:other-1.0",
+    "tag:example.org:unversioned",
+]
+
+
+def test_split_uri():
+    """
+    Check that URIs are split into their base name and (normalized) version.
+    """
+    assert split_uri("asdf://stsci.edu/datamodels/roman/tags/wfi_image-2.1.0") == (
+        "asdf://stsci.edu/datamodels/roman/tags/wfi_image",
+        Version("2.1.0"),
+    )
+    assert split_uri("asdf://stsci.edu/datamodels/roman/manifests/datamodels-1.0")[1] == Version("1.0.0")
+    assert split_uri("tag:example.org:unversioned") is None
+    assert parse_version("1.0") == Version("1.0.0")
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "tag:example.org:thing-*",
+        "tag:example.org:thing-1.*",
+        "tag:example.org:thing-1.2.*",
+        "tag:example.org:thing-1.1*",
+        "tag:example.org:thing-1.0.0",
+        "tag:example.org:thing-3.0.0",
+        "tag:example.org:*-1.0.0",
+        "tag:example.org:other-1.*",
+    ],
+)
+def test_version_index_match(pattern):
+    """
+    Check that the index matches the same versions as scanning every URI.
+    """
+    index = VersionIndex(_URIS)
+    base = pattern.rpartition("-")[0]
+    expected = [uri for uri in _URIS if uri_match(pattern, uri) and ("*" in base or uri.rpartition("-")[0] == base)]
+
+    assert sorted(index.match(pattern)) == sorted(expected)
+
+
+def test_version_index_latest():
+    """
+    Check that the versions are sorted semantically, not as strings.
+    """
+    index = VersionIndex(reversed(_URIS))
+    assert index.versions("tag:example.org:thing") == [
+        "tag:example.org:thing-1.0.0",
+        "tag:example.org:thing-1.2.0",
+        "tag:example.org:thing-1.10.0",
+        "tag:example.org:thing-2.0.0",
+        "tag:example.org:thing-10.0.0",
+    ]
+    assert index.latest("tag:example.org:thing") == "tag:example.org:thing-10.0.0"
+    assert index.latest_match("tag:example.org:thing-1.*") == "tag:example.org:thing-1.10.0"
+    assert index.latest("tag:example.org:missing") is None
+    assert "tag:example.org:unversioned" not in index
+
+
+def test_get_version_index():
+    """
+    Check that the shared index holds the RAD tags, schemas, and manifests.
+    """
+    index = get_version_index()
+    assert get_version_index() is index
+
+    manifests = [
+        uri
+        for uri in asdf.get_config().resource_manager
+        if uri.startswith("asdf://stsci.edu/datamodels/roman/manifests/datamodels-")
+    ]
+    assert index.latest("asdf://stsci.edu/datamodels/roman/manifests/datamodels") == max(
+        manifests, key=lambda uri: parse_version(uri.rsplit("-", 1)[-1])
+    )
+    assert "asdf://stsci.edu/datamodels/roman/tags/wfi_image-2.1.0" in index.match(
+        "asdf://stsci.edu/datamodels/roman/tags/wfi_image-2.*"
+    )
+    assert index.match("tag:stsci.edu:asdf/core/ndarray-1.*")
+
+
+def test_latest_uri():
+    """
+    Check that the resolver returns the latest version, normalizing the legacy "1.0" manifest.
+    """
+    index = get_version_index()
+    manifests = index.versions("asdf://stsci.edu/datamodels/roman/manifests/datamodels")
+    assert manifests[0] == "asdf://stsci.edu/datamodels/roman/manifests/datamodels-1.0"
+    assert latest_uri("asdf://stsci.edu/datamodels/roman/manifests/datamodels") == manifests[-1]
+
+    with pytest.raises(ValueError, match=r"There are no versions of"):
+        latest_uri("asdf://stsci.edu/datamodels/roman/schemas/missing")
+
+
+def test_get_version_index_config():
+    """
+    Check that the shared index follows the resource manager of the ASDF configuration.
+    """
+    index = get_version_index()
+    with asdf.config_context() as config:
+        config.remove_resource_mapping(package="rad")
+
+        assert get_version_index() is not index
+        assert "asdf://stsci.edu/datamodels/roman/manifests/datamodels" not in get_version_index()
+
+    assert get_version_index() is index
@@ -0,0 +1,117 @@
+"""
+Test the change detection for the RAD resources on disk used by the helper app.
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# The helper package imports textual, so the (standalone) module is loaded directly
+_spec = importlib.util.spec_from_file_location(
+    "_rad_helper_watch", Path(__file__).parent.parent / "scripts" / "helper" / "_watch.py"
+)
+_watch = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = _watch
+_spec.loader.exec_module(_watch)
+
+ChangeDetector = _watch.ChangeDetector
+Changes = _watch.Changes
+
+
+def _backends():
+    try:
+        import inotify_simple  # noqa: F401
+    except ImportError:
+        return [False, pytest.param(True, marks=pytest.mark.skip(reason="inotify_simple is not installed"))]
+
+    return [False, True]
+
+
+@pytest.fixture
+def root(tmp_path):
+    """
+    A directory of resources, with a nested directory and a file which is not watched.
+    """
+    (tmp_path / "meta").mkdir()
+    (tmp_path / "a.yaml").write_text("id: a\n")
+    (tmp_path / "meta" / "b.yaml").write_text("id: b\n")
+    (tmp_path / "notes.txt").write_text("not watched\n")
+    return tmp_path
+
+
+@pytest.fixture(params=_backends(), ids=lambda inotify: "inotify" if inotify else "polling")
+def detector(request, root):
+    detector = ChangeDetector(root, inotify=request.param)
+    yield detector
+    detector.close()
+
+
+def test_no_changes(detector, root):
+    """
+    Check that only the matching files are known, and nothing is reported without changes.
+    """
+    assert detector.paths == {root / "a.yaml", root / "meta" / "b.yaml"}
+
+    changes = detector.poll()
+    assert changes == Changes(frozenset(), frozenset(), frozenset())
+    assert not changes
+
+
+def test_changes(detector, root):
+    """
+    Check that the changed, added, and removed files are each reported once.
+    """
+    (root / "a.yaml").write_text("id: a\ntitle: changed\n")
+    (root / "meta" / "c.yaml").write_text("id: c\n")
+    (root / "meta" / "b.yaml").unlink()
+    (root / "notes.txt").write_text("still not watched\n")
+
+    changes = detector.poll()
+    assert changes
+    assert changes.changed == {root / "a.yaml"}
+    assert changes.added == {root / "meta" / "c.yaml"}
+    assert changes.removed == {root / "meta" / "b.yaml"}
+    assert detector.paths == {root / "a.yaml", root / "meta" / "c.yaml"}
+
+    assert not detector.poll()
+
+
+def test_same_size_change(detector, root):
+    """
+    Check that a change which keeps the size of a file is found from its mtime.
+    """
+    path = root / "a.yaml"
+    stat = path.stat()
+    path.write_text("id: z\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert detector.poll().changed == {path}
+
+
+def test_new_directory(detector, root):
+    """
+    Check that the files of a new directory are found.
+    """
+    (root / "enums").mkdir()
+    (root / "enums" / "d.yaml").write_text("id: d\n")
+
+    assert detector.poll().added == {root / "enums" / "d.yaml"}
+
+
+def test_refresh(detector, root):
+    """
+    Check that the refreshed files are not reported, but later changes to them are.
+    """
+    (root / "a.yaml").write_text("id: a\ntitle: written by the app\n")
+    (root / "meta" / "c.yaml").write_text("id: c\n")
+    (root / "meta" / "b.yaml").unlink()
+    detector.refresh([root / "a.yaml", root / "meta" / "c.yaml", root / "meta" / "b.yaml"])
+
+    assert not detector.poll()
+    assert detector.paths == {root / "a.yaml", root / "meta" / "c.yaml"}
+
+    (root / "a.yaml").write_text("id: a\ntitle: then changed outside of the app\n")
+    assert detector.poll().changed == {root / "a.yaml"}